@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+from valkey.asyncio import Valkey
+
+from yui.api.directory import ConversationDirectory
+from yui.api.directory import UserDirectory
+from yui.cache import Cache
+from yui.event import ImCreated
+from yui.event import TeamJoin
+from yui.event import UserChange
+from yui.types.slack.response import APIResponse
+
+
+@pytest.fixture
+def bot(bot):
+    @bot.response("users.info")
+    def user_info(data):
+        return APIResponse(
+            body={
+                "ok": True,
+                "user": {"id": data["user"], "name": "item4", "team": "T1"},
+            },
+            status=200,
+            headers={},
+        )
+
+    @bot.response("conversations.open")
+    def conversation_open(data):
+        return APIResponse(
+            body={
+                "ok": True,
+                "channel": {"id": data["users"].replace("U", "D")},
+            },
+            status=200,
+            headers={},
+        )
+
+    return bot
+
+
+@pytest.mark.anyio
+async def test_user_directory_get(bot):
+    directory = UserDirectory(bot)
+
+    users = await asyncio.gather(*[directory.get("U1") for _ in range(3)])
+
+    assert {user.name for user in users} == {"item4"}
+    assert [call.method for call in bot.call_queue] == ["users.info"]
+    assert directory.stats() == {
+        "size": 1,
+        "hits": 0,
+        "misses": 1,
+        "coalesced": 2,
+        "pending": 0,
+        "mirror_hits": 0,
+    }
+
+    user = await directory.get("U1")
+    assert user is users[0]
+    assert directory.users.hits == 1
+    assert len(bot.call_queue) == 1
+
+
+@pytest.mark.anyio
+async def test_user_directory_expire(bot):
+    directory = UserDirectory(bot, ttl=0)
+
+    await directory.get("U1")
+    await directory.get("U1")
+
+    assert [call.method for call in bot.call_queue] == [
+        "users.info",
+        "users.info",
+    ]
+
+
+@pytest.mark.anyio
+async def test_user_directory_unexpected_response(bot):
+    @bot.response("users.info")
+    def info(data):
+        return APIResponse(
+            body={"ok": False, "error": "user_not_found"},
+            status=200,
+            headers={},
+        )
+
+    directory = UserDirectory(bot)
+
+    with pytest.raises(ValueError, match="Unexpected response"):
+        await directory.get("U1")
+    assert directory.users.pending == {}
+
+
+@pytest.mark.anyio
+async def test_user_directory_observe(bot):
+    directory = bot.get_user_directory()
+    assert (await bot.get_user("U1")).name == "item4"
+
+    await directory.observe(UserChange(user={"id": "U1", "name": "new"}))
+    assert (await directory.get("U1")).name == "new"
+
+    await directory.observe(TeamJoin(user={"id": "U3", "name": "joined"}))
+    assert (await directory.get("U3")).name == "joined"
+
+    await directory.observe(TeamJoin(user="U3"))
+    assert directory.users.get_cached("U3") is None
+
+    assert [call.method for call in bot.call_queue] == ["users.info"]
+
+
+@pytest.mark.anyio
+async def test_user_directory_mirror_unavailable(bot):
+    bot.cache = Cache(Valkey.from_url("valkey://localhost:1"), "YUI_TEST_")
+    directory = UserDirectory(bot, mirror=True)
+
+    try:
+        user = await directory.get("U1")
+    finally:
+        await bot.cache.close()
+
+    assert user.name == "item4"
+    assert directory.mirror_hits == 0
+    assert [call.method for call in bot.call_queue] == ["users.info"]
+
+
+@pytest.mark.anyio
+async def test_conversation_directory_open_dm(bot):
+    directory = ConversationDirectory(bot)
+
+    channels = await asyncio.gather(
+        *[directory.open_dm("U1") for _ in range(3)],
+    )
+    assert channels == ["D1", "D1", "D1"]
+    assert await directory.open_dm("U1") == "D1"
+    assert [call.method for call in bot.call_queue] == ["conversations.open"]
+    assert directory.stats()["dm_channels"] == {
+        "size": 1,
+        "hits": 1,
+        "misses": 1,
+        "coalesced": 2,
+        "pending": 0,
+    }
+
+    directory.observe(ImCreated(user="U2", channel={"id": "D9"}))
+    assert await directory.open_dm("U2") == "D9"
+    assert len(bot.call_queue) == 1
+
+
+@pytest.mark.anyio
+async def test_conversation_directory_open_dm_fail(bot):
+
+    @bot.response("conversations.open")
+    def open_(data):
+        return APIResponse(
+            body={"ok": False, "error": "user_not_found"},
+            status=200,
+            headers={},
+        )
+
+    directory = ConversationDirectory(bot)
+
+    assert await directory.open_dm("U1") is None
+    assert directory.dm_channels.get_cached("U1") is None
@@ -0,0 +1,109 @@
+import enum
+
+from attrs import define
+
+from yui.api.endpoint import ENCODERS
+from yui.api.endpoint import get_encoder
+from yui.api.endpoint import prepare_for_json
+from yui.types.slack.action import Action
+from yui.types.slack.action import Confirmation
+from yui.types.slack.action import OptionField
+from yui.types.slack.attachment import Attachment
+from yui.types.slack.attachment import Field
+from yui.types.slack.block import PlainTextField
+from yui.types.slack.block import Section
+from yui.types.slack.block import TextField
+
+
+class Color(enum.Enum):
+    red = "red"
+
+
+@define
+class Sample:
+    name: str | None
+    color: Color | None
+    tags: list[str] | tuple[str, ...]
+    extra: dict[str, str | None]
+    count: int = 0
+
+
+def test_prepare_for_json_attachment():
+    attachment = Attachment(
+        fallback="fallback val",
+        title="title val",
+        fields=[Field("field title1", "field value1", short=False)],
+        blocks=[Section(text=PlainTextField(text="plain"))],
+        actions=[
+            Action(
+                name="action name",
+                text="action text",
+                type="button",
+                confirm=Confirmation(text="confirm text"),
+                options=[OptionField(text="o text", value="o value")],
+            ),
+        ],
+    )
+
+    assert prepare_for_json(
+        {"channel": "C1", "attachments": [attachment], "text": None},
+    ) == {
+        "channel": "C1",
+        "attachments": [
+            {
+                "fallback": "fallback val",
+                "title": "title val",
+                "blocks": [
+                    {
+                        "text": {"text": "plain", "type": "plain_text"},
+                        "type": "section",
+                    },
+                ],
+                "fields": [
+                    {
+                        "title": "field title1",
+                        "value": "field value1",
+                        "short": False,
+                    },
+                ],
+                "actions": [
+                    {
+                        "name": "action name",
+                        "text": "action text",
+                        "type": "button",
+                        "confirm": {"text": "confirm text"},
+                        "options": [{"text": "o text", "value": "o value"}],
+                    },
+                ],
+            },
+        ],
+    }
+    assert prepare_for_json(Attachment()) == {}
+    assert prepare_for_json(Section(text=TextField(text="text"))) == {
+        "text": {"text": "text", "type": "mrkdwn"},
+        "type": "section",
+    }
+
+
+def test_prepare_for_json_values():
+    assert prepare_for_json(
+        Sample(name=None, color=Color.red, tags=(), extra={"a": None}),
+    ) == {"color": "red", "extra": {}, "count": 0}
+    assert prepare_for_json(
+        Sample(name="yui", color=None, tags=("a",), extra={"a": "b"}),
+    ) == {"name": "yui", "tags": ["a"], "extra": {"a": "b"}, "count": 0}
+    assert prepare_for_json(
+        Sample(name=Color.red, color=None, tags=[], extra={}, count=[]),
+    ) == {"name": "red", "extra": {}}
+
+
+def test_get_encoder_cache():
+    encoder = get_encoder(Field)
+
+    assert get_encoder(Field) is encoder
+    assert ENCODERS[Field] is encoder
+    assert encoder(Field("t", "v", short=True)) == {
+        "title": "t",
+        "value": "v",
+        "short": True,
+    }
@@ -0,0 +1,195 @@
+import asyncio
+
+import pytest
+
+from yui.api.outbox import Outbox
+from yui.types.slack.attachment import Attachment
+
+
+@pytest.mark.anyio
+async def test_outbox_priority(bot):
+    outbox = Outbox(bot.api.chat, workers=1)
+
+    tasks = [
+        asyncio.create_task(
+            outbox.put({"channel": "C1", "text": "report"}, priority="report"),
+        ),
+        asyncio.create_task(
+            outbox.put(
+                {"channel": "C2", "text": "broadcast"},
+                priority="broadcast",
+            ),
+        ),
+        asyncio.create_task(
+            outbox.put({"channel": "C3", "text": "reply"}),
+        ),
+    ]
+    await asyncio.sleep(0)
+    assert outbox.stats()["depth"] == {
+        "interactive": 1,
+        "broadcast": 1,
+        "report": 1,
+    }
+
+    runner = asyncio.create_task(outbox.run())
+    async with asyncio.timeout(1):
+        await asyncio.gather(*tasks)
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+    assert [call.data["text"] for call in bot.call_queue] == [
+        "reply",
+        "broadcast",
+        "report",
+    ]
+    stats = outbox.stats()
+    assert stats["peak"] == 3
+    assert stats["calls"] == 3
+    assert stats["coalesced"] == 0
+    assert stats["max_wait"] >= stats["avg_wait"] > 0
+
+
+@pytest.mark.anyio
+async def test_outbox_coalesce(bot):
+    outbox = Outbox(bot.api.chat, workers=1, max_attachments=3)
+
+    def put(channel: str, *, coalesce: bool = True, **kwargs):
+        return asyncio.create_task(
+            outbox.put(
+                {"channel": channel, **kwargs},
+                priority="broadcast",
+                coalesce=coalesce,
+            ),
+        )
+
+    tasks = [
+        put("C1", text="a"),
+        put("C2", text="other"),
+        put("C1", text="b"),
+        put("C1", attachments=[Attachment(text="1"), Attachment(text="2")]),
+        put("C1", attachments=[Attachment(text="3"), Attachment(text="4")]),
+        put("C1", text="c"),
+        put("C2", text="not", coalesce=False),
+        put("C2", text="last"),
+    ]
+    await asyncio.sleep(0)
+    assert len(outbox) == len(tasks)
+
+    runner = asyncio.create_task(outbox.run())
+    async with asyncio.timeout(1):
+        responses = await asyncio.gather(*tasks)
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+    assert all(resp.is_ok() for resp in responses)
+    assert [call.data for call in bot.call_queue] == [
+        {
+            "channel": "C1",
+            "text": "a\nb",
+            "attachments": [{"text": "1"}, {"text": "2"}],
+        },
+        {"channel": "C2", "text": "other"},
+        {
+            "channel": "C1",
+            "text": "c",
+            "attachments": [{"text": "3"}, {"text": "4"}],
+        },
+        {"channel": "C2", "text": "not"},
+        {"channel": "C2", "text": "last"},
+    ]
+    assert outbox.stats()["coalesced"] == 3
+
+
+@pytest.mark.anyio
+async def test_outbox_channel_order(bot, monkeypatch):
+    outbox = Outbox(bot.api.chat, workers=2)
+    original = bot.api.chat._call
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_call(method, data, **kwargs):
+        if data["text"] == "1":
+            started.set()
+            await release.wait()
+        return await original(method, data, **kwargs)
+
+    monkeypatch.setattr(bot.api.chat, "_call", slow_call)
+
+    runner = asyncio.create_task(outbox.run())
+    tasks = [
+        asyncio.create_task(outbox.put({"channel": "C1", "text": text}))
+        for text in ["1", "2"]
+    ]
+    async with asyncio.timeout(1):
+        await started.wait()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert outbox.sending == {"C1"}
+    assert outbox.stats()["depth"]["interactive"] == 1
+    assert bot.call_queue == []
+
+    release.set()
+    async with asyncio.timeout(1):
+        await asyncio.gather(*tasks)
+    assert [call.data["text"] for call in bot.call_queue] == ["1", "2"]
+
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+
+@pytest.mark.anyio
+async def test_outbox_error(bot):
+    outbox = Outbox(bot.api.chat, workers=1)
+
+    @bot.response("chat.postMessage")
+    def callback(data):
+        error = "boom"
+        raise RuntimeError(error)
+
+    runner = asyncio.create_task(outbox.run())
+    with pytest.raises(RuntimeError, match="boom"):
+        async with asyncio.timeout(1):
+            await outbox.put({"channel": "C1", "text": "hello"})
+    assert outbox.sending == set()
+
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+
+@pytest.mark.anyio
+async def test_outbox_unknown_priority(bot):
+    outbox = Outbox(bot.api.chat)
+
+    with pytest.raises(ValueError, match="unknown priority"):
+        await outbox.put(
+            {"channel": "C1", "text": "hello"},
+            priority="urgent",
+        )
+
+
+@pytest.mark.anyio
+async def test_post_message_through_outbox(bot):
+    outbox = bot.get_outbox()
+    runner = asyncio.create_task(outbox.run())
+    await asyncio.sleep(0)
+    assert outbox.running
+
+    async with asyncio.timeout(1):
+        resp = await bot.say("C1", "hello", priority="broadcast")
+    assert resp.is_ok()
+    assert outbox.stats()["calls"] == 1
+    assert bot.get_stats()["outbox"]["calls"] == 1
+
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+    assert not outbox.running
+
+    await bot.say("C1", "direct")
+    assert outbox.stats()["calls"] == 1
+    assert len(bot.call_queue) == 2
@@ -0,0 +1,173 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from yui.api.pagination import get_next_cursor
+from yui.api.pagination import paginate
+from yui.types.slack.response import APIResponse
+
+
+def make_response(body: dict) -> APIResponse:
+    return APIResponse(body=body, status=200, headers={})
+
+
+@pytest.fixture
+def bot(bot):
+    @bot.response("conversations.history")
+    def history(data):
+        cursor = data.get("cursor")
+        page = int(cursor) if cursor else 0
+        body = {"ok": True, "messages": [{"ts": f"{page}.0"}]}
+        if page < 2:
+            body["response_metadata"] = {"next_cursor": str(page + 1)}
+        return make_response(body)
+
+    @bot.response("users.list")
+    def users(data):
+        cursor = data.get("cursor")
+        body = {"ok": True, "members": [{"id": cursor or "U0"}]}
+        if not cursor:
+            body["response_metadata"] = {"next_cursor": "U1"}
+        else:
+            body["response_metadata"] = {"next_cursor": ""}
+        return make_response(body)
+
+    return bot
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ({"ok": True}, None),
+        ({"ok": True, "response_metadata": {"next_cursor": ""}}, None),
+        ({"ok": True, "response_metadata": {"next_cursor": "abc"}}, "abc"),
+        ({"ok": False, "response_metadata": {"next_cursor": "abc"}}, None),
+    ],
+)
+def test_get_next_cursor(body, expected):
+    assert get_next_cursor(make_response(body)) == expected
+
+
+@pytest.mark.anyio
+async def test_iter_history(bot):
+    pages = [
+        resp.body["messages"][0]["ts"]
+        async for resp in bot.api.conversations.iter_history(
+            "C1",
+            latest="123.0",
+        )
+    ]
+
+    assert pages == ["0.0", "1.0", "2.0"]
+    assert [call.data.get("cursor") for call in bot.call_queue] == [
+        None,
+        "1",
+        "2",
+    ]
+    assert all(call.data["latest"] == "123.0" for call in bot.call_queue)
+
+
+@pytest.mark.anyio
+async def test_iter_users(bot):
+    members = [
+        resp.body["members"][0]["id"]
+        async for resp in bot.api.users.iter_list(limit=1)
+    ]
+
+    assert members == ["U0", "U1"]
+    assert [call.data.get("cursor") for call in bot.call_queue] == [
+        None,
+        "U1",
+    ]
+
+
+@pytest.mark.anyio
+async def test_paginate_prefetch():
+    requested: list[str | None] = []
+    consumed: list[str | None] = []
+
+    async def fetch(cursor):
+        await asyncio.sleep(0)
+        requested.append(cursor)
+        next_cursor = {None: "a", "a": "b"}.get(cursor)
+        return make_response(
+            {"ok": True, "response_metadata": {"next_cursor": next_cursor}},
+        )
+
+    async for resp in paginate(fetch):
+        cursor = get_next_cursor(resp)
+        consumed.append(cursor)
+        await asyncio.sleep(0.01)
+        if cursor is not None:
+            # next page is already fetched while this page is processed
+            assert requested[-1] == cursor
+
+    assert requested == [None, "a", "b"]
+    assert consumed == ["a", "b", None]
+
+
+@pytest.mark.anyio
+async def test_paginate_not_ok():
+    calls = 0
+
+    async def fetch(cursor):
+        nonlocal calls
+        await asyncio.sleep(0)
+        calls += 1
+        return make_response(
+            {
+                "ok": False,
+                "error": "ratelimited",
+                "response_metadata": {"next_cursor": "a"},
+            },
+        )
+
+    pages = [resp async for resp in paginate(fetch)]
+
+    assert len(pages) == 1
+    assert calls == 1
+
+
+@pytest.mark.anyio
+async def test_paginate_close_cancel_prefetch():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch(cursor):
+        if cursor is None:
+            return make_response(
+                {"ok": True, "response_metadata": {"next_cursor": "a"}},
+            )
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async with aclosing(paginate(fetch)) as pages:
+        async for _ in pages:
+            await started.wait()
+            break
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.anyio
+async def test_paginate_error():
+    async def fetch(cursor):
+        await asyncio.sleep(0)
+        if cursor is None:
+            return make_response(
+                {"ok": True, "response_metadata": {"next_cursor": "a"}},
+            )
+        error = "boom"
+        raise RuntimeError(error)
+
+    pages = paginate(fetch)
+    resp = await anext(pages)
+    assert resp.is_ok()
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await anext(pages)
@@ -0,0 +1,147 @@
+import asyncio
+import itertools
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+import pytest
+
+from yui.api.throttle import LeakyBucket
+
+
+@pytest.mark.anyio
+async def test_leaky_bucket_release_in_order():
+    loop = asyncio.get_running_loop()
+    bucket = LeakyBucket()
+    released: list[tuple[int, float]] = []
+
+    async def worker(n: int):
+        await bucket.acquire(0.05)
+        released.append((n, loop.time()))
+
+    start = loop.time()
+    await asyncio.gather(*(worker(n) for n in range(4)))
+
+    assert [n for n, _ in released] == [0, 1, 2, 3]
+    assert released[0][1] - start < 0.05
+    for (_, prev), (_, curr) in itertools.pairwise(released):
+        assert curr - prev >= 0.045
+    assert not bucket.waiters
+    assert bucket.handle is None
+
+
+@pytest.mark.anyio
+async def test_leaky_bucket_skip_cancelled_waiter():
+    bucket = LeakyBucket()
+    released: list[int] = []
+
+    async def worker(n: int):
+        await bucket.acquire(0.05)
+        released.append(n)
+
+    await worker(0)
+    cancelled = asyncio.create_task(worker(1))
+    waiting = asyncio.create_task(worker(2))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await waiting
+
+    assert cancelled.cancelled()
+    assert released == [0, 2]
+
+
+@pytest.mark.anyio
+async def test_rate_limiter(bot):
+    loop = asyncio.get_running_loop()
+    bot.api.throttle_interval = defaultdict(lambda: timedelta(0))
+    bot.api.throttle_interval["slow"] = timedelta(seconds=0.1)
+
+    start = loop.time()
+    await bot.api.rate_limiter.acquire("fast")
+    await bot.api.rate_limiter.acquire("fast")
+    await bot.api.rate_limiter.acquire("slow")
+    assert loop.time() - start < 0.1
+
+    await bot.api.rate_limiter.acquire("slow")
+    assert loop.time() - start >= 0.095
+    assert set(bot.api.rate_limiter.buckets) == {"fast", "slow"}
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_channel_scope(bot):
+    loop = asyncio.get_running_loop()
+    bot.api.throttle_interval = defaultdict(lambda: timedelta(0))
+    bot.api.channel_throttle_interval = {"post": timedelta(seconds=0.1)}
+    limiter = bot.api.rate_limiter
+
+    start = loop.time()
+    await limiter.acquire("post", "C1")
+    await limiter.acquire("post", "C2")
+    await limiter.acquire("post")
+    assert loop.time() - start < 0.1
+
+    await limiter.acquire("post", "C1")
+    assert loop.time() - start >= 0.095
+    assert set(limiter.buckets) == {"post", ("post", "C1"), ("post", "C2")}
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_workspace_ceiling(bot):
+    loop = asyncio.get_running_loop()
+    bot.api.throttle_interval = defaultdict(lambda: timedelta(0))
+    bot.api.throttle_interval["post"] = timedelta(seconds=0.1)
+    bot.api.channel_throttle_interval = {"post": timedelta(0)}
+    limiter = bot.api.rate_limiter
+
+    start = loop.time()
+    await limiter.acquire("post", "C1")
+    await limiter.acquire("post", "C2")
+    assert loop.time() - start >= 0.095
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_adaptive(bot):
+    loop = asyncio.get_running_loop()
+    bot.api.throttle_interval = defaultdict(lambda: timedelta(seconds=1))
+    limiter = bot.api.rate_limiter
+
+    await limiter.acquire("a")
+    assert limiter.rates() == {"a": 60.0}
+
+    limiter.penalize("a", 30)
+    assert math.isclose(limiter.get_interval("a"), 2.0)
+    assert limiter.buckets["a"].next_at >= loop.time() + 29
+    limiter.penalize("a", 0)
+    assert limiter.rates() == {"a": 15.0}
+
+    limiter.relax("a")
+    assert math.isclose(limiter.get_factor("a"), 4.0)
+
+    limiter.changed_at["a"] -= 60
+    limiter.relax("a")
+    assert math.isclose(limiter.get_factor("a"), 2.0)
+
+    limiter.changed_at["a"] -= 60
+    limiter.relax("a")
+    assert math.isclose(limiter.get_factor("a"), 1.0)
+    assert not limiter.factors
+    assert not limiter.changed_at
+
+    limiter.relax("a")
+    assert limiter.rates() == {"a": 60.0}
+
+
+@pytest.mark.anyio
+async def test_leaky_bucket_delay():
+    loop = asyncio.get_running_loop()
+    bucket = LeakyBucket()
+
+    start = loop.time()
+    await bucket.acquire(0.05)
+    task = asyncio.create_task(bucket.acquire(0.05))
+    await asyncio.sleep(0)
+    assert bucket.handle is not None
+
+    bucket.delay(0.1)
+    await task
+    assert loop.time() - start >= 0.095
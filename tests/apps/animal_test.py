@@ -13,6 +13,7 @@ from yui.apps.animal import fox
 from yui.apps.animal import get_cat_image_url
 from yui.apps.animal import get_dog_image_url
 from yui.apps.animal import get_fox_image_url
+from yui.apps.animal import parse_fox_gallery
 
 CAT_REJECTED_PATTERN = re.compile(
     r"아직 쿨타임이다냥! \d+시 \d+분 이후로 다시 시도해보라냥!",
@@ -250,28 +251,22 @@ async def test_get_dog_image_url(response_mock):
 
 
 @pytest.mark.anyio
-async def test_get_fox_image_url_server_error(response_mock):
+async def test_get_fox_image_url_server_error(bot, response_mock):
     response_mock.get(
         FOX_GALLERY_URL,
         status=500,
     )
     with pytest.raises(APIServerError):
-        await get_fox_image_url(1.0)
+        await get_fox_image_url(bot, 1.0)
 
 
-@pytest.mark.anyio
-async def test_get_fox_image_url_no_image(response_mock):
-    response_mock.get(
-        FOX_GALLERY_URL,
-        body="<!doctype html><html></html>",
-        headers={"Content-Type": "text/html"},
-    )
+def test_parse_fox_gallery_no_image():
     with pytest.raises(APIServerError):
-        await get_fox_image_url(0.001)
+        parse_fox_gallery("<!doctype html><html></html>")
 
 
 @pytest.mark.anyio
-async def test_get_fox_image_url(response_mock):
+async def test_get_fox_image_url(bot, response_mock):
     IMAGE_URL = "http://fox.com/img1.png"
     response_mock.get(
         FOX_GALLERY_URL,
@@ -288,7 +283,7 @@ async def test_get_fox_image_url(response_mock):
         ),
         headers={"Content-Type": "text/html"},
     )
-    url = await get_fox_image_url(0.001)
+    url = await get_fox_image_url(bot, 0.001)
     assert url == IMAGE_URL
 
 
@@ -1,3 +1,5 @@
+import asyncio
+
 import aiohttp.client_exceptions
 import pytest
 from aiohttp.client_reqrep import ConnectionKey
@@ -6,7 +8,9 @@ from sqlalchemy.sql.expression import select
 from yarl import URL
 
 from yui.apps.info.rss.commands import RSS
+from yui.apps.info.rss.commands import crawl
 from yui.apps.info.rss.models import RSSFeedURL
+from yui.types.slack.response import APIResponse
 from yui.utils.datetime import datetime
 
 
@@ -245,3 +249,98 @@ async def test_list_fine(bot, fx_sess):
 {feed1.id} - {feed1.url}
 {feed2.id} - {feed2.url}
 ```"""
+
+
+FEED_BODY = """\
+<rss version="2.0">
+<channel>
+<title>{title}</title>
+<link>https://test.dev</link>
+<description>test feed</description>
+<item>
+<title>{title} post</title>
+<link>https://test.dev/{title}/post/</link>
+<pubDate>Sun, 22 Mar 2020 09:09:00 GMT</pubDate>
+<description>summary</description>
+</item>
+</channel>
+</rss>
+"""
+
+
+@pytest.mark.anyio
+async def test_crawl_coalesce(bot, fx_sess, response_mock):
+    event = bot.create_message()
+    async with fx_sess.begin():
+        for title in ["a", "b"]:
+            response_mock.get(
+                URL(f"https://test.dev/{title}.xml"),
+                body=FEED_BODY.format(title=title),
+            )
+            feed = RSSFeedURL()
+            feed.channel = event.channel
+            feed.url = f"https://test.dev/{title}.xml"
+            feed.updated_at = datetime(2020, 3, 1)
+            fx_sess.add(feed)
+        await fx_sess.commit()
+
+    outbox = bot.get_outbox()
+    runner = asyncio.create_task(outbox.run())
+    await asyncio.sleep(0)
+
+    async with asyncio.timeout(5):
+        await crawl(bot, fx_sess)
+
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+    (said,) = bot.call_queue
+    assert said.method == "chat.postMessage"
+    assert said.data["channel"] == event.channel
+    assert [attachment.title for attachment in said.data["attachments"]] == [
+        "a post",
+        "b post",
+    ]
+    assert outbox.stats()["coalesced"] == 1
+    feeds = (
+        await fx_sess.scalars(select(RSSFeedURL).order_by(RSSFeedURL.id))
+    ).all()
+    assert [feed.updated_at for feed in feeds] == [
+        datetime(2020, 3, 22, 18, 9),
+        datetime(2020, 3, 22, 18, 9),
+    ]
+
+
+@pytest.mark.anyio
+async def test_crawl_error_priority(bot, fx_sess, response_mock, monkeypatch):
+    event = bot.create_message()
+    async with fx_sess.begin():
+        response_mock.get(URL("https://test.dev/rss.xml"), body=b"wrong body")
+        feed = RSSFeedURL()
+        feed.channel = event.channel
+        feed.url = "https://test.dev/rss.xml"
+        feed.updated_at = datetime(2020, 3, 1)
+        fx_sess.add(feed)
+        await fx_sess.commit()
+
+    queued: list[tuple[str, str, bool]] = []
+
+    async def put(params, *, token, priority, coalesce):
+        await asyncio.sleep(0)
+        queued.append((params["text"], priority, coalesce))
+        return APIResponse(body={"ok": True}, status=200, headers={})
+
+    outbox = bot.get_outbox()
+    outbox.running = True
+    monkeypatch.setattr(outbox, "put", put)
+
+    await crawl(bot, fx_sess)
+
+    assert queued == [
+        (
+            "*Error*: `https://test.dev/rss.xml`는 올바른 RSS 문서가 아니에요!",
+            "broadcast",
+            True,
+        ),
+    ]
@@ -0,0 +1,21 @@
+import pytest
+
+from yui.apps.manage.cleanup.commands import cleanup
+from yui.apps.manage.cleanup.commands import collect
+from yui.box import box
+from yui.box.apps.basic import App
+
+from ....util import FakeBot
+
+
+@pytest.mark.parametrize("handler", [cleanup, collect])
+def test_command_no_timeout(handler):
+    bot = FakeBot()
+    (app,) = [
+        app
+        for app in box.apps
+        if isinstance(app, App) and app.handler is handler
+    ]
+
+    assert bot.config.HANDLER_TIMEOUT == 60
+    assert bot.get_app_timeout(app) is None
@@ -49,6 +49,12 @@ async def test_say_command(bot, owner_id, user_id):
     assert said.data["channel"] == user_id.replace("U", "D")
     assert said.data["text"] == text
 
+    await say(bot, event, None, user_id, text)
+
+    said = bot.call_queue.pop(0)
+    assert said.method == "chat.postMessage"
+    assert said.data["channel"] == user_id.replace("U", "D")
+
     await say(bot, event, test.id, user_id, text)
 
     said = bot.call_queue.pop(0)
@@ -10,9 +10,12 @@ from yui.apps.search.ref import fetch_css_ref
 from yui.apps.search.ref import fetch_html_ref
 from yui.apps.search.ref import fetch_python_ref
 from yui.apps.search.ref import html
-from yui.apps.search.ref import on_start
 from yui.apps.search.ref import python
 from yui.apps.search.ref import refresh
+from yui.apps.search.ref import warm_up_css
+from yui.apps.search.ref import warm_up_html
+from yui.apps.search.ref import warm_up_python
+from yui.warmup import WARMING_UP_MESSAGE
 
 from ...util import assert_crontab_match
 from ...util import assert_crontab_spec
@@ -50,14 +53,19 @@ async def test_fetch_all_ref(bot):
     assert python_data
 
 
+@pytest.mark.parametrize(
+    ("warm_up", "fetch"),
+    [
+        (warm_up_css, "fetch_css_ref"),
+        (warm_up_html, "fetch_html_ref"),
+        (warm_up_python, "fetch_python_ref"),
+    ],
+)
 @pytest.mark.anyio
-async def test_on_start(bot, monkeypatch):
+async def test_warm_up(bot, monkeypatch, warm_up, fetch):
     mock = AsyncMock()
-    monkeypatch.setattr(
-        "yui.apps.search.ref.fetch_all_ref",
-        mock,
-    )
-    assert await on_start(bot)
+    monkeypatch.setattr(f"yui.apps.search.ref.{fetch}", mock)
+    await warm_up(bot)
     mock.assert_awaited_once_with(bot)
 
 
@@ -102,10 +110,7 @@ async def test_css_command(bot):
     assert said.method == "chat.postMessage"
     assert isinstance(said.data, dict)
     assert said.data["channel"] == event.channel
-    assert (
-        said.data["text"]
-        == "아직 레퍼런스 관련 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!"
-    )
+    assert said.data["text"] == WARMING_UP_MESSAGE
 
     await fetch_css_ref(bot)
 
@@ -136,10 +141,7 @@ async def test_html_command(bot):
     assert said.method == "chat.postMessage"
     assert isinstance(said.data, dict)
     assert said.data["channel"] == event.channel
-    assert (
-        said.data["text"]
-        == "아직 레퍼런스 관련 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!"
-    )
+    assert said.data["text"] == WARMING_UP_MESSAGE
 
     await fetch_html_ref(bot)
 
@@ -170,10 +172,7 @@ async def test_python_command(bot):
     assert said.method == "chat.postMessage"
     assert isinstance(said.data, dict)
     assert said.data["channel"] == event.channel
-    assert (
-        said.data["text"]
-        == "아직 레퍼런스 관련 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!"
-    )
+    assert said.data["text"] == WARMING_UP_MESSAGE
 
     await fetch_python_ref(bot)
 
@@ -17,10 +17,11 @@ from yui.apps.search.subway import find_station_id
 from yui.apps.search.subway import get_shortest_route
 from yui.apps.search.subway import gwangju_subway
 from yui.apps.search.subway import make_route_desc
-from yui.apps.search.subway import on_start
 from yui.apps.search.subway import refresh_db
 from yui.apps.search.subway import subway
+from yui.apps.search.subway import warm_up
 from yui.utils.datetime import now
+from yui.warmup import WARMING_UP_MESSAGE
 
 from ...util import assert_crontab_match
 from ...util import assert_crontab_spec
@@ -312,15 +313,15 @@ async def test_get_shortest_route(time, start_id, goal_id):
 
 
 @pytest.mark.anyio
-async def test_on_start(bot, monkeypatch):
+async def test_warm_up(bot, monkeypatch):
     mock = AsyncMock()
     monkeypatch.setattr(
-        "yui.apps.search.subway.fetch_all_station_db",
+        "yui.apps.search.subway.fetch_station_db",
         mock,
     )
 
-    assert await on_start(bot)
-    mock.assert_awaited_once_with(bot)
+    await warm_up(bot)
+    assert mock.await_count == len(REGION_TABLE)
 
 
 def test_refresh_db_spec():
@@ -390,10 +391,7 @@ async def test_command_body(bot, start_name, goal_name):
     assert said.method == "chat.postMessage"
     assert isinstance(said.data, dict)
     assert said.data["channel"] == event.channel
-    assert (
-        said.data["text"]
-        == "아직 지하철 관련 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!"
-    )
+    assert said.data["text"] == WARMING_UP_MESSAGE
 
     await fetch_station_db(
         bot,
@@ -0,0 +1,237 @@
+import asyncio
+
+import pytest
+
+from yui.backlog import Delivery
+from yui.backlog import EventBacklog
+from yui.backlog import FairBacklog
+from yui.box.apps.base import BaseApp
+from yui.event import create_event
+
+from .util import FakeBot
+
+
+def make_delivery(
+    text: str = "hello",
+    *,
+    user: str | None = None,
+    channel: str | None = None,
+    apps: list[BaseApp] | None = None,
+) -> Delivery:
+    bot = FakeBot()
+    return Delivery(
+        bot.create_message(text=text, user_id=user, channel_id=channel),
+        [] if apps is None else apps,
+    )
+
+
+def test_backlog_shed():
+    backlog = EventBacklog(2, max_size=10, shed_limit=2)
+
+    assert backlog.put(0, make_delivery())
+    assert backlog.put(1, make_delivery())
+    assert not backlog.put(0, make_delivery())
+    assert backlog.stats() | {"avg_latency": 0.0} == {
+        "workers": 2,
+        "size": 2,
+        "peak": 2,
+        "shed": 1,
+        "sampled": 0,
+        "dropped": 0,
+        "handled": 0,
+        "avg_latency": 0.0,
+        "max_latency": 0.0,
+    }
+
+
+def test_backlog_sample():
+    backlog = EventBacklog(1, shed_limit=1, sample_rate=1.0)
+
+    assert backlog.put(0, make_delivery())
+    assert backlog.put(0, make_delivery())
+    assert backlog.sampled == 1
+    assert backlog.shed == 0
+
+
+def test_backlog_drop_new():
+    backlog = EventBacklog(1, max_size=2)
+    first = make_delivery("1")
+
+    assert backlog.put(0, first)
+    assert backlog.put(0, make_delivery("2"))
+    assert not backlog.put(0, make_delivery("3"))
+    assert backlog.dropped == 1
+    assert backlog.shards[0].get_nowait() is first
+
+
+def test_backlog_drop_oldest():
+    backlog = EventBacklog(2, max_size=3, overflow="drop_oldest")
+    deliveries = [make_delivery(str(x)) for x in range(4)]
+
+    assert backlog.put(0, deliveries[0])
+    assert backlog.put(0, deliveries[1])
+    assert backlog.put(1, deliveries[2])
+    assert backlog.put(1, deliveries[3])
+    assert backlog.size == 3
+    assert backlog.dropped == 1
+    assert backlog.shards[0].get_nowait() is deliveries[1]
+
+
+@pytest.mark.anyio
+async def test_backlog_latency():
+    backlog = EventBacklog(1)
+    delivery = make_delivery()
+    delivery.enqueued_at -= 2
+
+    backlog.put(0, delivery)
+    async with asyncio.timeout(1):
+        assert await backlog.get(0) is delivery
+
+    stats = backlog.stats()
+    assert stats["handled"] == 1
+    assert stats["avg_latency"] >= 2
+    assert stats["max_latency"] >= 2
+
+
+def test_backlog_unknown_overflow():
+    with pytest.raises(ValueError, match="unknown overflow policy"):
+        EventBacklog(1, overflow="block")
+
+
+@pytest.mark.parametrize(
+    ("type_", "source", "expected"),
+    [
+        ("channel_created", {"channel": {"id": "C2"}}, "C2"),
+        ("channel_rename", {"channel": {"id": "C2"}}, "C2"),
+        ("im_created", {"user": "U1", "channel": {"id": "D1"}}, "D1"),
+        ("channel_deleted", {"channel": "C2"}, "C2"),
+        ("channel_rename", {"channel": {}}, ""),
+    ],
+)
+def test_fair_backlog_get_channel(type_, source, expected):
+    backlog = FairBacklog(1)
+    delivery = Delivery(create_event(type_, source), [])
+
+    assert backlog.get_channel(delivery) == expected
+    assert backlog.put(0, delivery)
+    assert backlog.pick() is delivery
+    backlog.done(delivery)
+    assert backlog.stats()["running"] == 0
+
+
+def test_fair_backlog_round_robin():
+    backlog = FairBacklog(2)
+    deliveries = [
+        make_delivery("1", user="U1"),
+        make_delivery("2", user="U1"),
+        make_delivery("3", user="U1"),
+        make_delivery("4", user="U2"),
+        make_delivery("5", user="U3"),
+    ]
+    for delivery in deliveries:
+        backlog.put(0, delivery)
+
+    picked = []
+    while (delivery := backlog.pick()) is not None:
+        picked.append(delivery.event.text)
+        backlog.done(delivery)
+    assert picked == ["1", "4", "5", "2", "3"]
+    assert backlog.size == 0
+    assert backlog.stats()["users"] == 0
+
+
+def test_fair_backlog_limits():
+    backlog = FairBacklog(4, user_limit=1, channel_limit=2)
+    for delivery in [
+        make_delivery("1", user="U1", channel="C1"),
+        make_delivery("2", user="U1", channel="C2"),
+        make_delivery("3", user="U2", channel="C1"),
+        make_delivery("4", user="U3", channel="C1"),
+        make_delivery("5", user="U4", channel="C2"),
+    ]:
+        backlog.put(0, delivery)
+
+    first = backlog.pick()
+    second = backlog.pick()
+    third = backlog.pick()
+    assert first is not None
+    assert second is not None
+    assert third is not None
+    assert [first.event.text, second.event.text, third.event.text] == [
+        "1",
+        "3",
+        "5",
+    ]
+    assert backlog.pick() is None
+    assert backlog.stats()["running"] == 3
+    assert backlog.throttled == 1
+
+    backlog.done(first)
+    fourth = backlog.pick()
+    fifth = backlog.pick()
+    assert fourth is not None
+    assert fifth is not None
+    assert [fourth.event.text, fifth.event.text] == ["2", "4"]
+    assert backlog.size == 0
+
+
+def test_fair_backlog_channel_turns():
+    backlog = FairBacklog(2, channel_limit=1)
+    for delivery in [
+        make_delivery("1", user="U1", channel="C1"),
+        make_delivery("2", user="U1", channel="C1"),
+        make_delivery("3", user="U2", channel="C1"),
+    ]:
+        backlog.put(0, delivery)
+
+    picked = []
+    while (delivery := backlog.pick()) is not None:
+        picked.append(delivery.event.text)
+        assert backlog.pick() is None
+        backlog.done(delivery)
+    assert picked == ["1", "3", "2"]
+
+
+def test_fair_backlog_app_limits():
+    app = BaseApp()
+    app.user_limit = 0
+    backlog = FairBacklog(2, user_limit=1)
+    backlog.put(0, make_delivery("1", user="U1", apps=[app]))
+    backlog.put(0, make_delivery("2", user="U1", apps=[app]))
+
+    assert backlog.pick() is not None
+    assert backlog.pick() is not None
+
+
+def test_fair_backlog_drop_oldest():
+    backlog = FairBacklog(1, max_size=3, overflow="drop_oldest")
+    deliveries = [
+        make_delivery("1", user="U1"),
+        make_delivery("2", user="U2"),
+        make_delivery("3", user="U2"),
+        make_delivery("4", user="U3"),
+    ]
+    for delivery in deliveries:
+        assert backlog.put(0, delivery)
+
+    assert backlog.size == 3
+    assert backlog.dropped == 1
+    assert list(backlog.queues["U2"]) == [deliveries[2]]
+
+
+@pytest.mark.anyio
+async def test_fair_backlog_wait_for_done():
+    backlog = FairBacklog(2, user_limit=1)
+    first = make_delivery("1", user="U1")
+    second = make_delivery("2", user="U1")
+    backlog.put(0, first)
+    backlog.put(0, second)
+
+    async with asyncio.timeout(1):
+        assert await backlog.get(0) is first
+        task = asyncio.create_task(backlog.get(1))
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        backlog.done(first)
+        assert await task is second
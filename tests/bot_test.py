@@ -1,14 +1,22 @@
 import asyncio
+import logging
+import math
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import timedelta
 
+import aiohttp
 import pytest
 
 from yui.api import SlackAPI
+from yui.backlog import FairBacklog
 from yui.bot import APICallError
 from yui.bot import Bot
 from yui.box import Box
+from yui.event import Message
+from yui.event import create_event
 from yui.types.slack.response import APIResponse
+from yui.utils import json
 
 
 @pytest.mark.anyio
@@ -24,7 +32,7 @@ async def test_bot_init(monkeypatch, bot_config):
     box = Box()
     async with Bot(bot_config, using_box=box) as bot:
         assert bot.config == bot_config
-        assert bot.restart is False
+        assert not bot.restart_event.is_set()
         assert isinstance(bot.api, SlackAPI)
         assert bot.box is box
         assert isinstance(bot.queue, asyncio.Queue)
@@ -32,6 +40,7 @@ async def test_bot_init(monkeypatch, bot_config):
             "yui.app1",
             "yui.app2",
         ]
+        assert list(bot.get_stats()["imports"]) == ["yui.app1", "yui.app2"]
 
 
 @pytest.mark.anyio
@@ -125,3 +134,660 @@ async def test_call_json(bot_config, response_mock, channel_id):
         assert resp.body == {"ok": True}
         assert resp.status == 200
         assert resp.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.anyio
+async def test_call_reuse_api_session(bot_config, response_mock):
+    response_mock.post(
+        "https://slack.com/api/test1",
+        payload={"ok": True},
+        repeat=True,
+    )
+
+    box = Box()
+    async with Bot(bot_config, using_box=box) as bot:
+        bot.api.throttle_interval = defaultdict(lambda: timedelta(0))
+
+        await bot.call("test1")
+        session = bot.api_session
+        assert session is not None
+        assert not session.closed
+
+        await bot.call("test1")
+        assert bot.api_session is session
+
+    assert session.closed
+    assert bot.api_session is None
+
+
+@pytest.mark.anyio
+async def test_call_ratelimited(bot_config, response_mock):
+    response_mock.post(
+        "https://slack.com/api/test1",
+        payload={"ok": False, "error": "ratelimited"},
+        status=429,
+        headers={"Retry-After": "0"},
+    )
+    response_mock.post(
+        "https://slack.com/api/test1",
+        payload={"ok": True},
+    )
+    response_mock.post(
+        "https://slack.com/api/test2",
+        payload={"ok": False, "error": "ratelimited"},
+        headers={"Retry-After": "0"},
+        repeat=True,
+    )
+
+    box = Box()
+    async with Bot(bot_config, using_box=box) as bot:
+        bot.api.throttle_interval = defaultdict(lambda: timedelta(0))
+
+        resp = await bot.call("test1")
+        assert resp.is_ok()
+        assert bot.api.rate_limiter.factors == {"test1": 2.0}
+
+        resp = await bot.call("test2")
+        assert resp.is_ratelimited()
+        assert math.isclose(bot.api.rate_limiter.factors["test2"], 16.0)
+
+
+@pytest.mark.anyio
+async def test_process_shard_by_channel(bot):
+    bot.queue = asyncio.Queue()
+    bot.config.EVENT_LANES = {"PASSIVE": 2}
+    released = asyncio.Event()
+    handled: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+
+    @bot.box.on(Message)
+    async def slow(event):
+        if event.text == "slow":
+            await released.wait()
+        await handled.put((event.channel, event.text))
+        return event.text != "stop"
+
+    @bot.box.on(Message)
+    async def after(event):
+        await handled.put((event.channel, "after"))
+
+    assert bot.get_shard_index(
+        bot.create_message(channel_id="C1"),
+        2,
+    ) != bot.get_shard_index(bot.create_message(channel_id="C4"), 2)
+
+    task = asyncio.create_task(bot.process())
+    for channel, text in [
+        ("C1", "slow"),
+        ("C1", "next"),
+        ("C4", "stop"),
+    ]:
+        await bot.queue.put(bot.create_message(channel_id=channel, text=text))
+
+    async with asyncio.timeout(1):
+        assert await handled.get() == ("C4", "stop")
+        assert handled.empty()
+
+        released.set()
+        assert [await handled.get() for _ in range(4)] == [
+            ("C1", "slow"),
+            ("C1", "after"),
+            ("C1", "next"),
+            ("C1", "after"),
+        ]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("type_", "source", "channel"),
+    [
+        ("channel_created", {"channel": {"id": "C9", "name": "new"}}, "C9"),
+        ("channel_rename", {"channel": {"id": "C9", "name": "old"}}, "C9"),
+        ("im_created", {"user": "U1", "channel": {"id": "D9"}}, "D9"),
+        ("channel_deleted", {"channel": "C9"}, "C9"),
+        ("channel_archive", {"channel": "C9", "user": "U1"}, "C9"),
+        ("channel_unarchive", {"channel": "C9", "user": "U1"}, "C9"),
+        ("channel_created", {"channel": {"name": "new"}}, None),
+    ],
+)
+async def test_process_channel_events(bot, type_, source, channel):
+    bot.queue = asyncio.Queue()
+    bot.config.EVENT_LANES = {"SYSTEM": 4}
+    handled: asyncio.Queue = asyncio.Queue()
+    event = create_event(type_, source)
+
+    @bot.box.on(type_)
+    async def on_event(event):
+        await handled.put(event)
+
+    expected = bot.get_shard_index(bot.create_message(channel_id=channel), 4)
+    assert bot.get_shard_index(event, 4) == (expected if channel else 0)
+
+    task = asyncio.create_task(bot.process())
+    await bot.queue.put(event)
+    async with asyncio.timeout(1):
+        assert await handled.get() is event
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.anyio
+async def test_process_lanes(bot):
+    bot.queue = asyncio.Queue()
+    bot.config.EVENT_LANES = {"PASSIVE": 1, "COMMAND": 1, "BOOKKEEPING": 1}
+    released = asyncio.Event()
+    handled: asyncio.Queue[str] = asyncio.Queue()
+
+    @bot.box.on(Message, bookkeeping=True)
+    async def log(event):
+        await released.wait()
+        await handled.put(f"log {event.text}")
+
+    @bot.box.on(Message)
+    async def listen(event):
+        if event.text == "slow":
+            await released.wait()
+        await handled.put(f"listen {event.text}")
+        return True
+
+    @bot.box.command("cmd")
+    async def cmd(bot, event):
+        await handled.put("cmd")
+
+    task = asyncio.create_task(bot.process())
+    for text in ["slow", "cmd"]:
+        await bot.queue.put(bot.create_message(channel_id="C1", text=text))
+
+    async with asyncio.timeout(1):
+        assert await handled.get() == "listen cmd"
+        assert await handled.get() == "cmd"
+        assert handled.empty()
+
+        released.set()
+        assert {await handled.get() for _ in range(3)} == {
+            "listen slow",
+            "log slow",
+            "log cmd",
+        }
+
+    stats = bot.get_stats()["event_queue"]
+    assert stats["command"]["handled"] == 1
+    assert stats["passive"]["handled"] == 1
+    assert stats["bookkeeping"]["handled"] == 2
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.anyio
+async def test_process_fair_share(bot):
+    bot.queue = asyncio.Queue()
+    bot.config.EVENT_LANES = {"COMMAND": 2}
+    bot.config.FAIR_SHARE = {"PER_USER": 1, "PER_CHANNEL": 0}
+    released = asyncio.Event()
+    handled: asyncio.Queue[str] = asyncio.Queue()
+
+    @bot.box.command("heavy")
+    async def heavy(bot, event):
+        await released.wait()
+        await handled.put(f"heavy {event.user}")
+
+    @bot.box.command("light")
+    async def light(bot, event):
+        await handled.put(f"light {event.user}")
+
+    assert isinstance(bot.get_lanes()["command"], FairBacklog)
+
+    task = asyncio.create_task(bot.process())
+    for user, text in [("U1", "heavy"), ("U1", "heavy"), ("U2", "light")]:
+        await bot.queue.put(bot.create_message(user_id=user, text=text))
+
+    async with asyncio.timeout(1):
+        assert await handled.get() == "light U2"
+        assert handled.empty()
+
+        released.set()
+        assert [await handled.get() for _ in range(2)] == [
+            "heavy U1",
+            "heavy U1",
+        ]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.anyio
+async def test_process_fair_share_channel_order(bot):
+    bot.queue = asyncio.Queue()
+    bot.config.EVENT_LANES = {"COMMAND": 2}
+    bot.config.FAIR_SHARE = {}
+    released = asyncio.Event()
+    handled: asyncio.Queue[str] = asyncio.Queue()
+
+    @bot.box.command("heavy")
+    async def heavy(bot, event):
+        await released.wait()
+        await handled.put(f"heavy {event.channel}")
+
+    @bot.box.command("light")
+    async def light(bot, event):
+        await handled.put(f"light {event.channel}")
+
+    task = asyncio.create_task(bot.process())
+    for user, channel, text in [
+        ("U1", "C1", "heavy"),
+        ("U2", "C1", "light"),
+        ("U3", "C2", "light"),
+    ]:
+        await bot.queue.put(
+            bot.create_message(user_id=user, channel_id=channel, text=text),
+        )
+
+    async with asyncio.timeout(1):
+        assert await handled.get() == "light C2"
+        await asyncio.sleep(0.01)
+        assert handled.empty()
+
+        released.set()
+        assert [await handled.get() for _ in range(2)] == [
+            "heavy C1",
+            "light C1",
+        ]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.anyio
+async def test_run_app_timeout(bot):
+    bot.config.USERS = {"owner": "U1"}
+    sessions = []
+
+    @bot.box.command("slow", timeout=0.01)
+    async def slow(bot, event, sess):
+        sessions.append(sess)
+        await asyncio.sleep(1)
+
+    @bot.box.command("fail", timeout=1)
+    async def fail(bot, event):
+        await asyncio.sleep(0)
+        raise TimeoutError
+
+    slow_app, fail_app = bot.box.apps
+    assert slow_app.timeout == bot.get_app_timeout(slow_app)
+
+    async with asyncio.timeout(0.5):
+        assert not await bot.run_app(
+            slow_app,
+            bot.create_message(text="slow"),
+        )
+        assert not await bot.run_app(
+            fail_app,
+            bot.create_message(text="fail"),
+        )
+
+    assert sessions[0].closed
+    assert [call.method for call in bot.call_queue] == [
+        "conversations.open",
+        "conversations.open",
+    ]
+
+    fail_app.timeout = None
+    bot.config.HANDLER_TIMEOUT = 5
+    assert bot.get_app_timeout(fail_app) == 5
+    bot.config.HANDLER_TIMEOUT = 0
+    assert bot.get_app_timeout(fail_app) is None
+
+
+class FakeWebSocket:
+    def __init__(self, messages: list[aiohttp.WSMessage]) -> None:
+        self.messages = messages
+        self.sent: list[dict] = []
+        self.closed = False
+
+    async def receive(self) -> aiohttp.WSMessage:
+        if not self.messages:
+            return aiohttp.http.WS_CLOSED_MESSAGE
+        return self.messages.pop(0)
+
+    async def send_json(self, data, *, dumps):
+        self.sent.append(json.loads(dumps(data)))
+
+
+@pytest.mark.anyio
+async def test_receive_ack_before_build(bot):
+    bot.queue = asyncio.Queue()
+    envelope = {
+        "envelope_id": "E1",
+        "payload": {
+            "event": {
+                "type": "message",
+                "channel": "C1",
+                "user": "U1",
+                "text": "hello",
+                "ts": "1234.5678",
+                "event_ts": "1234.5678",
+            },
+        },
+    }
+    ws = FakeWebSocket(
+        [
+            aiohttp.WSMessage(
+                aiohttp.WSMsgType.TEXT,
+                json.dumps(envelope),
+                None,
+            ),
+            aiohttp.WSMessage(
+                aiohttp.WSMsgType.TEXT,
+                json.dumps({"envelope_id": "E2", "payload": {}}),
+                None,
+            ),
+        ],
+    )
+
+    await bot.receive(ws)
+
+    assert ws.sent == [{"envelope_id": "E1"}, {"envelope_id": "E2"}]
+    assert bot.queue.empty()
+    assert bot.raw_events.qsize() == 1
+    bot.raw_events.put_nowait(("E1", {"type": "message"}))
+    bot.raw_events.put_nowait(
+        (
+            "E3",
+            {
+                "type": "message",
+                "channel": "C1",
+                "user": "U1",
+                "text": "bye",
+                "ts": "1234.5679",
+                "event_ts": "1234.5679",
+            },
+        ),
+    )
+
+    task = asyncio.create_task(bot.build_events())
+    async with asyncio.timeout(1):
+        event = await bot.queue.get()
+        last = await bot.queue.get()
+    task.cancel()
+
+    assert isinstance(event, Message)
+    assert event.channel == "C1"
+    assert event.text == "hello"
+    assert isinstance(last, Message)
+    assert last.text == "bye"
+    assert bot.queue.empty()
+    assert bot.get_stats()["dedup"]["suppressed"] == 1
+
+
+@pytest.mark.anyio
+async def test_receive_disconnect_warning(bot):
+    handover = asyncio.Event()
+    ws = FakeWebSocket(
+        [
+            aiohttp.WSMessage(
+                aiohttp.WSMsgType.TEXT,
+                json.dumps({"type": "disconnect", "reason": "warning"}),
+                None,
+            ),
+        ],
+    )
+
+    await bot.receive(ws, handover)
+
+    assert handover.is_set()
+    assert ws.sent == []
+
+
+@pytest.mark.anyio
+async def test_keep_connection_handover(bot, monkeypatch):
+    urls = ["wss://1", "wss://2"]
+    opened: list[str] = []
+    closed: list[str] = []
+    release = asyncio.Event()
+    second_closed = asyncio.Event()
+
+    handovers: list[bool] = []
+
+    async def open_connection(*, handover):
+        await asyncio.sleep(0)
+        handovers.append(handover)
+        return urls.pop(0) if urls else None
+
+    async def run_connection(url, handover):
+        opened.append(url)
+        if url == "wss://1":
+            handover.set()
+            await release.wait()
+        closed.append(url)
+        if url == "wss://2":
+            second_closed.set()
+
+    monkeypatch.setattr(bot, "open_connection", open_connection)
+    monkeypatch.setattr(bot, "run_connection", run_connection)
+
+    task = asyncio.create_task(bot.keep_connection())
+    async with asyncio.timeout(1):
+        await second_closed.wait()
+        assert closed == ["wss://2"]
+        assert opened == ["wss://1", "wss://2"]
+        assert not task.done()
+
+        release.set()
+        await task
+    assert closed == ["wss://2", "wss://1"]
+    assert handovers == [False, True, False]
+
+
+@pytest.mark.anyio
+async def test_open_connection_handover(bot_config, response_mock):
+    for _ in range(2):
+        response_mock.post(
+            "https://slack.com/api/apps.connections.open",
+            payload={"ok": True, "url": "wss://1"},
+        )
+
+    box = Box()
+    async with Bot(bot_config, using_box=box) as bot:
+        assert await bot.open_connection() == "wss://1"
+        bucket = bot.api.rate_limiter.get_bucket("apps.connections.open")
+        assert bucket.next_at > asyncio.get_running_loop().time()
+
+        async with asyncio.timeout(1):
+            assert await bot.open_connection(handover=True) == "wss://1"
+
+
+@pytest.mark.anyio
+async def test_process_bookkeeping_after_stop(bot):
+    bot.queue = asyncio.Queue()
+    handled: asyncio.Queue[str] = asyncio.Queue()
+
+    @bot.box.on(Message, bookkeeping=True)
+    async def first_log(event):
+        await handled.put(f"first {event.text}")
+
+    @bot.box.on(Message)
+    async def stop(event):
+        await handled.put(f"stop {event.text}")
+        return event.text != "stop"
+
+    @bot.box.on(Message, bookkeeping=True)
+    async def last_log(event):
+        await handled.put(f"last {event.text}")
+
+    task = asyncio.create_task(bot.process())
+    for text in ["stop", "go"]:
+        await bot.queue.put(bot.create_message(channel_id="C1", text=text))
+
+    async with asyncio.timeout(1):
+        assert {await handled.get() for _ in range(5)} == {
+            "first stop",
+            "stop stop",
+            "first go",
+            "stop go",
+            "last go",
+        }
+    await asyncio.sleep(0.01)
+    assert handled.empty()
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.anyio
+async def test_handle_event_passed(bot):
+    @bot.box.on(Message)
+    async def go(event):
+        await asyncio.sleep(0)
+        return True
+
+    @bot.box.on(Message)
+    async def stop(event):
+        await asyncio.sleep(0)
+        return False
+
+    go_app, stop_app = bot.box.apps
+    event = bot.create_message(text="hi")
+    assert await bot.handle_event(event, [go_app, go_app]) == 2
+    assert await bot.handle_event(event, [go_app, stop_app, go_app]) == 1
+
+
+@pytest.mark.anyio
+async def test_request_restart_every_connection(bot, monkeypatch):
+    closed: list[str] = []
+
+    class FakeSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+        @asynccontextmanager
+        async def ws_connect(self, url):
+            try:
+                yield url
+            finally:
+                closed.append(url)
+
+    async def wait_forever(*args):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(aiohttp, "ClientSession", FakeSession)
+    monkeypatch.setattr(bot, "ping", wait_forever)
+    monkeypatch.setattr(bot, "receive", wait_forever)
+
+    tasks = [
+        asyncio.create_task(bot.run_connection(url, asyncio.Event()))
+        for url in ["wss://1", "wss://2"]
+    ]
+    await asyncio.sleep(0.01)
+    assert closed == []
+
+    bot.request_restart()
+    async with asyncio.timeout(1):
+        await asyncio.gather(*tasks)
+
+    assert sorted(closed) == ["wss://1", "wss://2"]
+    assert not bot.restart_event.is_set()
+
+
+def test_get_lane(bot):
+    @bot.box.command("hello")
+    async def hello(bot, event):
+        pass
+
+    @bot.box.on(Message)
+    async def listen(event):
+        pass
+
+    assert bot.get_lane(bot.create_message(text="hello")) == "command"
+    assert bot.get_lane(bot.create_message(text="hi")) == "passive"
+    assert bot.get_lane(create_event("yui_system_start", {})) == "system"
+
+
+@pytest.mark.anyio
+async def test_get_supervisor(bot):
+    @bot.box.cron("0 * * * *")
+    async def hourly(bot):
+        pass
+
+    @bot.box.polling_task()
+    async def poll(bot):
+        pass
+
+    await bot.register_cron_tasks()
+    supervisor = bot.get_supervisor()
+
+    assert supervisor is bot.get_supervisor()
+    assert list(supervisor.children) == [
+        "slack",
+        "process",
+        "outbox",
+        "valkey",
+        "stats",
+        f"cron {hourly!r}",
+        f"polling {poll!r}",
+    ]
+    assert bot.get_stats()["supervisor"]["slack"]["restarts"] == 0
+
+
+@pytest.mark.anyio
+async def test_log_stats(bot, caplog, monkeypatch):
+    logged = asyncio.Event()
+
+    def get_stats():
+        logged.set()
+        return {"outbox": {"sent": 1}}
+
+    monkeypatch.setattr(bot, "get_stats", get_stats)
+    caplog.set_level(logging.INFO)
+
+    task = asyncio.create_task(bot.log_stats(0.01))
+    async with asyncio.timeout(1):
+        await logged.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert "outbox: {'sent': 1}" in caplog.text
+
+
+def test_get_supervisor_without_stats(bot):
+    bot.config.SUPERVISOR = {"STATS_INTERVAL": 0}
+
+    assert "stats" not in bot.get_supervisor().children
+
+
+@pytest.mark.anyio
+async def test_warm_up(bot):
+    attempts = []
+
+    @bot.box.warmup("data")
+    async def warm_up(bot):
+        await asyncio.sleep(0)
+        attempts.append(bot)
+        if len(attempts) == 1:
+            error = "boom"
+            raise RuntimeError(error)
+
+    task = bot.box.warmup_tasks[0]
+    assert "warmup data" in bot.get_supervisor().children
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await bot.warm_up(task)
+    assert not bot.get_readiness().is_ready(["data"])
+    assert bot.get_stats()["warmup"]["data"]["state"] == "failed"
+
+    await bot.warm_up(task)
+    assert bot.get_readiness().is_ready(["data"])
+    assert attempts == [bot, bot]
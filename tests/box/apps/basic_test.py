@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+
+import pytest
+
 from yui.box import Box
 from yui.box.apps.basic import App
 from yui.command.decorators import argument
+from yui.command.decorators import concurrency
 from yui.command.decorators import option
+from yui.command.decorators import requires
+from yui.command.limits import BUSY_MESSAGE
 from yui.event import Message
 from yui.event import MessageMessage
 from yui.types.base import Ts
+from yui.warmup import WARMING_UP_MESSAGE
+
+from ...util import FakeBot
 
 
 def test_basic_app(channel_id, user_id):
@@ -79,3 +89,95 @@ LONG"""
     assert app.get_event_text(event) == "=test --foo 1 --bar 2 3 4 5"
     assert app.split_call_and_args("=test 1 2 3 4 5") == ("=test", "1 2 3 4 5")
     assert app.split_call_and_args("=test") == ("=test", "")
+
+
+@pytest.mark.anyio
+async def test_basic_app_concurrency(monkeypatch):
+    monkeypatch.setattr("yui.command.limits.LIMITS", {})
+    bot = FakeBot()
+    box = Box()
+    called = []
+
+    @box.command("heavy")
+    @concurrency(1, wait=False)
+    async def heavy(bot, event: Message):
+        await asyncio.sleep(0)
+        called.append(event.text)
+
+    app = box.apps.pop()
+    assert isinstance(app, App)
+    assert heavy.concurrency is not None
+
+    event = bot.create_message(text="heavy")
+    async with heavy.concurrency.hold(bot):
+        assert not await app.run(bot, event)
+    said = bot.call_queue.pop()
+    assert said.data["text"] == BUSY_MESSAGE
+    assert not called
+
+    await app.run(bot, event)
+    assert called == ["heavy"]
+
+
+@pytest.mark.anyio
+async def test_basic_app_requires():
+    box = Box()
+    bot = FakeBot(using_box=box)
+    called = []
+
+    @box.warmup("data")
+    async def warm_up(bot):
+        await asyncio.sleep(0)
+
+    @box.command("data")
+    @requires("data")
+    async def data(bot, event: Message):
+        await asyncio.sleep(0)
+        called.append(event.text)
+
+    app = box.apps.pop()
+    event = bot.create_message(text="data")
+
+    assert not await app.run(bot, event)
+    said = bot.call_queue.pop()
+    assert said.data["text"] == WARMING_UP_MESSAGE
+    assert not called
+
+    await bot.warm_up(box.warmup_tasks[0])
+    await app.run(bot, event)
+    assert called == ["data"]
+
+
+@pytest.mark.anyio
+async def test_basic_app_requires_cached(bot, cache):
+    box = bot.box
+    started = asyncio.Event()
+    release = asyncio.Event()
+    called = []
+
+    @box.warmup("data", cached=["DATA"])
+    async def warm_up(bot):
+        started.set()
+        await release.wait()
+
+    @box.command("data")
+    @requires("data")
+    async def data(bot, event: Message):
+        await asyncio.sleep(0)
+        called.append(event.text)
+
+    app = box.apps.pop()
+    event = bot.create_message(text="data")
+
+    async with bot.use_cache(cache):
+        await cache.set("DATA", [1])
+        task = asyncio.create_task(bot.warm_up(box.warmup_tasks[0]))
+        async with asyncio.timeout(1):
+            await started.wait()
+
+        await app.run(bot, event)
+        assert called == ["data"]
+        assert bot.get_readiness().stats()["data"]["state"] == "ready"
+
+        release.set()
+        await task
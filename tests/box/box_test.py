@@ -58,6 +58,21 @@ def test_box_class():
     assert box.cron_tasks[0].spec == "*/3 * * * *"
     assert box.cron_tasks[0].handler == test_cron
 
+    @box.warmup("dataset")
+    async def test_warmup():
+        pass
+
+    assert box.warmup_tasks[0].dataset == "dataset"
+    assert box.warmup_tasks[0].handler == test_warmup
+    assert test_warmup.warmup_task is box.warmup_tasks[0]
+    assert box.warmup_tasks[0].cached == ()
+
+    @box.warmup("cached", cached=["A", "B"])
+    async def test_cached_warmup():
+        pass
+
+    assert box.warmup_tasks[1].cached == ("A", "B")
+
     @box.on("message")
     async def test4():
         pass
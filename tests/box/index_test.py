@@ -0,0 +1,81 @@
+from yui.box import Box
+from yui.box import route
+from yui.event import Hello
+from yui.event import Message
+from yui.types.base import Ts
+
+
+class Sample(route.RouteApp):
+    def __init__(self) -> None:
+        self.name = "route"
+
+
+def test_app_index(channel_id, user_id):
+    box = Box()
+
+    @box.on(Message)
+    async def passive():
+        pass
+
+    @box.command("cmd", ["alias"])
+    async def cmd():
+        pass
+
+    @box.on(Message, subtype="*")
+    async def any_subtype():
+        pass
+
+    @box.command("edited", subtype="message_changed")
+    async def edited():
+        pass
+
+    @box.on(Hello)
+    async def hello():
+        pass
+
+    sample = Sample()
+    box.register(sample)
+
+    @box.on(Message)
+    async def last():
+        pass
+
+    apps = {
+        app.handler.f.__name__: app
+        for app in box.apps
+        if hasattr(app, "handler")
+    }
+
+    def get_apps(text: str, subtype: str | None = None):
+        event = Message(
+            channel=channel_id,
+            user=user_id,
+            ts=Ts("1.0"),
+            event_ts=Ts("1.0"),
+            text=text,
+            subtype=subtype,
+        )
+        return box.get_apps(event, "=")
+
+    assert get_apps("hello") == [apps["passive"], apps["last"]]
+    assert get_apps("=unknown") == [apps["passive"], apps["last"]]
+    assert get_apps("=cmd arg") == [apps["passive"], apps["cmd"], apps["last"]]
+    assert get_apps("=alias") == [apps["passive"], apps["cmd"], apps["last"]]
+    assert get_apps("cmd") == [apps["passive"], apps["last"]]
+    assert get_apps("=route arg") == [apps["passive"], sample, apps["last"]]
+    assert get_apps("=edited", "message_changed") == [
+        apps["any_subtype"],
+        apps["edited"],
+    ]
+    assert get_apps("=cmd", "bot_message") == [apps["any_subtype"]]
+    assert box.get_apps(Hello(), "=") == [apps["hello"]]
+
+    index = box.build_index()
+    assert box.get_apps(Hello(), "=") == [apps["hello"]]
+    assert set(index.entries) == {("hello", None)}
+
+    @box.on(Hello)
+    async def hello2():
+        pass
+
+    assert box.get_apps(Hello(), "=") == [apps["hello"], box.apps[-1]]
@@ -1,7 +1,9 @@
 import pytest
 
 from yui.command.decorators import argument
+from yui.command.decorators import concurrency
 from yui.command.decorators import option
+from yui.command.decorators import requires
 from yui.types.handler import Argument
 from yui.types.handler import Handler
 from yui.types.handler import Option
@@ -155,3 +157,42 @@ def test_option_decorator():
     assert opts[0].container_cls is None
     assert opts[1].container_cls is tuple
     assert opts[2].container_cls is tuple
+
+
+def test_concurrency_decorator(monkeypatch):
+    monkeypatch.setattr("yui.command.limits.LIMITS", {})
+
+    @concurrency(2, key="heavy", wait=False)
+    async def test1():
+        pass
+
+    @concurrency(3, key="heavy")
+    async def test2():
+        pass
+
+    @concurrency(1)
+    async def test3():
+        pass
+
+    assert isinstance(test1, Handler)
+    assert test1.concurrency is not None
+    assert test1.concurrency is test2.concurrency
+    assert test1.concurrency.limit == 2
+    assert not test1.concurrency.wait
+    assert test3.concurrency is not None
+    assert test3.concurrency.key == repr(test3)
+
+
+def test_requires_decorator():
+    @requires("a")
+    @requires("b", "c")
+    async def test1():
+        pass
+
+    @option("--foo")
+    async def test2():
+        pass
+
+    assert isinstance(test1, Handler)
+    assert test1.requires == {"a", "b", "c"}
+    assert test2.requires == set()
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from yui.command.limits import ConcurrencyLimit
+from yui.command.limits import get_limit
+
+from ..util import FakeBot
+
+
+@pytest.mark.anyio
+async def test_concurrency_limit_wait():
+    bot = FakeBot()
+    limit = ConcurrencyLimit("test", 1)
+    released = asyncio.Event()
+    order: list[str] = []
+
+    async def run(name: str):
+        async with limit.hold(bot) as allowed:
+            assert allowed
+            order.append(name)
+            await released.wait()
+
+    async with asyncio.timeout(1), asyncio.TaskGroup() as tg:
+        tg.create_task(run("a"))
+        tg.create_task(run("b"))
+        await asyncio.sleep(0)
+        assert order == ["a"]
+        assert limit.stats() == {
+            "limit": 1,
+            "running": 1,
+            "waiting": 1,
+            "rejected": 0,
+            "errors": 0,
+        }
+        released.set()
+
+    assert order == ["a", "b"]
+    assert limit.running == 0
+
+
+@pytest.mark.anyio
+async def test_concurrency_limit_reject():
+    bot = FakeBot()
+    limit = ConcurrencyLimit("test", 1, wait=False)
+
+    async with limit.hold(bot) as first:
+        assert first
+        async with limit.hold(bot) as second:
+            assert not second
+    async with limit.hold(bot) as third:
+        assert third
+
+    assert limit.rejected == 1
+
+
+def test_concurrency_limit_invalid():
+    with pytest.raises(ValueError, match="limit must be positive"):
+        ConcurrencyLimit("test", 0)
+
+
+def test_get_limit(monkeypatch):
+    monkeypatch.setattr("yui.command.limits.LIMITS", {})
+
+    first = get_limit("shared", 2)
+    second = get_limit("shared", 3)
+    assert first is second
+    assert first.limit == 2
+
+
+@pytest.fixture(name="bot")
+async def bot_with_cache(bot, cache):
+    async with bot.use_cache(cache):
+        yield bot
+
+
+@pytest.mark.anyio
+async def test_concurrency_limit_shared(bot):
+    first = ConcurrencyLimit("test_shared", 1, wait=False, shared=True)
+    second = ConcurrencyLimit("test_shared", 1, wait=False, shared=True)
+
+    async with first.hold(bot) as allowed:
+        assert allowed
+        async with second.hold(bot) as rejected:
+            assert not rejected
+    async with second.hold(bot) as allowed:
+        assert allowed
+
+    assert await bot.cache.count_slots(first.shared_key) == 0
+
+
+@pytest.mark.anyio
+async def test_concurrency_limit_shared_expire(bot):
+    limit = ConcurrencyLimit("test_expire", 1, wait=False, shared=True, ttl=1)
+    await bot.cache.delete(limit.shared_key)
+
+    # a crashed instance never releases its slot
+    assert await limit.acquire_shared(bot, "crashed")
+    assert not await limit.acquire_shared(bot, "other")
+    await asyncio.sleep(1.1)
+    assert await limit.acquire_shared(bot, "other")
+    assert await bot.cache.count_slots(limit.shared_key) == 1
+    await limit.release_shared(bot, "other")
+
+
+@pytest.mark.anyio
+async def test_concurrency_limit_shared_release_twice(bot):
+    limit = ConcurrencyLimit("test_release", 1, wait=False, shared=True)
+    await bot.cache.delete(limit.shared_key)
+
+    assert await limit.acquire_shared(bot, "first")
+    await limit.release_shared(bot, "first")
+    await limit.release_shared(bot, "first")
+    assert await bot.cache.count_slots(limit.shared_key) == 0
+
+    assert await limit.acquire_shared(bot, "second")
+    assert not await limit.acquire_shared(bot, "third")
+    await limit.release_shared(bot, "second")
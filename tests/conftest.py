@@ -107,8 +107,11 @@ def bot(request, bot_config, monkeypatch):
         "vscode_pytest",
     ) and request.config.pluginmanager.hasplugin("pytest_cov"):
         monkeypatch.setattr("resource.setrlimit", Mock())
-        monkeypatch.setattr("yui.bot.ProcessPoolExecutor", ThreadPoolExecutor)
-    return FakeBot(bot_config)
+        monkeypatch.setattr("yui.pool.ProcessPoolExecutor", ThreadPoolExecutor)
+    bot = FakeBot(bot_config)
+    yield bot
+    if bot.process_pool is not None:
+        bot.process_pool.close()
 
 
 @pytest.fixture
@@ -0,0 +1,41 @@
+import pytest
+
+from yui.dedup import Deduplicator
+from yui.dedup import MemoryDedupStore
+
+
+@pytest.mark.anyio
+async def test_memory_dedup_store_size():
+    store = MemoryDedupStore(2, 60)
+
+    assert await store.add("a")
+    assert not await store.add("a")
+    assert await store.add("b")
+    assert await store.add("c")
+    assert list(store.keys) == ["b", "c"]
+    assert await store.add("a")
+
+
+@pytest.mark.anyio
+async def test_memory_dedup_store_ttl():
+    store = MemoryDedupStore(10, 60)
+
+    assert await store.add("a")
+    store.keys["a"] -= 59
+    assert not await store.add("a")
+    store.keys["a"] -= 2
+    assert await store.add("a")
+
+
+@pytest.mark.anyio
+async def test_deduplicator():
+    dedup = Deduplicator(MemoryDedupStore(100, 60))
+    event = {"type": "message", "channel": "C1", "ts": "1.1"}
+
+    assert not await dedup.is_duplicate("E1", event)
+    assert await dedup.is_duplicate("E1", event)
+    assert await dedup.is_duplicate("E2", event)
+    assert not await dedup.is_duplicate("E3", event | {"ts": "1.2"})
+    assert not await dedup.is_duplicate(None, {"type": "hello"})
+    assert not await dedup.is_duplicate(None, {"type": "hello"})
+    assert dedup.stats() == {"suppressed": 2, "size": 5}
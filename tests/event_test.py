@@ -1,8 +1,10 @@
 import pytest
 
+from yui.event import ChannelDeleted
 from yui.event import Hello
 from yui.event import TeamMigrationStarted
 from yui.event import UnknownEvent
+from yui.event import UserChange
 from yui.event import create_event
 from yui.event import create_unknown_event
 
@@ -19,6 +21,14 @@ def test_create_event():
     assert isinstance(team_migration_event, TeamMigrationStarted)
     assert team_migration_event.type == "team_migration_started"
 
+    user_change_event = create_event("user_change", {"user": {"id": "U1"}})
+    assert isinstance(user_change_event, UserChange)
+    assert user_change_event.user == {"id": "U1"}
+
+    channel_deleted_event = create_event("channel_deleted", {"channel": "C1"})
+    assert isinstance(channel_deleted_event, ChannelDeleted)
+    assert channel_deleted_event.channel == "C1"
+
     with pytest.raises(TypeError, match=""):
         create_event("not exists it", {})
 
@@ -0,0 +1,135 @@
+import asyncio
+import operator
+import os
+import threading
+import time
+
+import pytest
+
+from yui.pool import ProcessPool
+from yui.pool import ThreadPool
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+def fail():
+    error = "fail"
+    raise ValueError(error)
+
+
+def sleep(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+@pytest.fixture
+def pool():
+    p = ProcessPool(1, max_tasks=3)
+    yield p
+    p.close()
+
+
+@pytest.mark.anyio
+async def test_process_pool_reuse_worker(pool):
+    pool.start()
+    assert len(pool.idle) == 1
+
+    assert await pool.run(operator.add, 1, 2) == 3
+    pid = await pool.run(get_pid)
+    assert pid != os.getpid()
+    assert "tests.pool_test" in pool.modules
+
+    with pytest.raises(ValueError, match="fail"):
+        await pool.run(fail)
+
+    assert await pool.run(get_pid) != pid
+    assert pool.idle[0].tasks == 1
+    assert pool.running == 0
+
+
+@pytest.mark.anyio
+async def test_process_pool_kill_stuck_worker(pool):
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(3):
+            await pool.run(sleep, 60)
+    assert pool.running == 0
+    assert len(pool.idle) == 1
+
+    pid = await pool.run(get_pid)
+    assert await pool.run(sleep, 0) == pid
+
+
+@pytest.mark.anyio
+async def test_process_pool_close(pool):
+    await pool.run(operator.add, 1, 2)
+    worker = pool.idle[0]
+
+    pool.close()
+    assert pool.closed
+    assert not pool.idle
+    with pytest.raises(RuntimeError):
+        worker.executor.submit(operator.add, 1, 2)
+
+
+@pytest.mark.anyio
+async def test_thread_pool():
+    pool = ThreadPool(1, queue_size=0)
+    started = threading.Event()
+    released = threading.Event()
+
+    def block() -> int:
+        started.set()
+        released.wait(3)
+        return threading.get_ident()
+
+    first = asyncio.create_task(pool.run(block))
+    second = asyncio.create_task(pool.run(operator.add, 1, 2))
+    await asyncio.to_thread(started.wait, 3)
+    assert pool.stats() == {
+        "size": 1,
+        "waiting": 1,
+        "pending": 0,
+        "running": 1,
+        "completed": 0,
+    }
+
+    released.set()
+    assert await first != threading.get_ident()
+    assert await second == 3
+    assert pool.stats()["completed"] == 2
+    assert pool.stats()["waiting"] == 0
+
+    pool.close()
+
+
+@pytest.mark.anyio
+async def test_thread_pool_cancel():
+    pool = ThreadPool(1, queue_size=0)
+    started = threading.Event()
+    released = threading.Event()
+
+    def block():
+        started.set()
+        released.wait(3)
+
+    first = asyncio.create_task(pool.run(block))
+    await asyncio.to_thread(started.wait, 3)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # thread of cancelled call still holds the slot
+    second = asyncio.create_task(pool.run(operator.add, 1, 2))
+    await asyncio.sleep(0.01)
+    assert not second.done()
+    assert pool.stats()["waiting"] == 1
+    assert pool.stats()["running"] == 1
+
+    released.set()
+    async with asyncio.timeout(3):
+        assert await second == 3
+    assert pool.stats()["completed"] == 2
+
+    pool.close()
@@ -0,0 +1,156 @@
+import asyncio
+import time
+
+import pytest
+
+from yui.box import Box
+from yui.config import Config
+from yui.config import DEFAULT
+from yui.scheduler import CronScheduler
+
+from .util import FakeBot
+
+
+def make_scheduler(**kwargs):
+    box = Box()
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    @box.cron("0 * * * *", **kwargs)
+    async def task():
+        calls.append("start")
+        await release.wait()
+        calls.append("end")
+
+    bot = FakeBot(using_box=box)
+    scheduler = CronScheduler(bot, box.cron_tasks, grace=60)
+    return bot, scheduler, scheduler.jobs[0], calls, release
+
+
+async def wait_for_runs(job):
+    """Wait until running and queued runs of job end."""
+
+    while job.tasks:
+        await asyncio.wait(set(job.tasks))
+
+
+@pytest.mark.anyio
+async def test_cron_skip():
+    _, _, job, calls, release = make_scheduler()
+
+    job.dispatch(time.time())
+    job.dispatch(time.time())
+    await asyncio.sleep(0)
+    assert calls == ["start"]
+    assert job.stats()["skipped"] == 1
+
+    release.set()
+    await wait_for_runs(job)
+    assert not job.running
+    assert calls == ["start", "end"]
+    assert job.runs == 1
+
+
+@pytest.mark.anyio
+async def test_cron_queue():
+    _, _, job, calls, release = make_scheduler(overlap="queue")
+
+    job.dispatch(time.time())
+    job.dispatch(time.time())
+    job.dispatch(time.time())
+    await asyncio.sleep(0)
+    assert calls == ["start"]
+    assert job.skipped == 1
+
+    release.set()
+    await wait_for_runs(job)
+    assert job.runs == 2
+    assert calls == ["start", "end", "start", "end"]
+
+
+@pytest.mark.anyio
+async def test_cron_concurrent():
+    _, _, job, calls, release = make_scheduler(
+        overlap="concurrent",
+        max_instances=2,
+    )
+
+    job.dispatch(time.time())
+    job.dispatch(time.time())
+    job.dispatch(time.time())
+    await asyncio.sleep(0)
+    assert calls == ["start", "start"]
+    assert job.skipped == 1
+
+    release.set()
+    await asyncio.sleep(0)
+    assert job.runs == 2
+
+
+@pytest.mark.anyio
+async def test_cron_catch_up():
+    bot, scheduler, job, calls, release = make_scheduler()
+    release.set()
+
+    job.miss(time.time())
+    job.miss(time.time())
+    await asyncio.sleep(0)
+    assert calls == []
+    assert job.missed == 2
+
+    scheduler.resume()
+    await asyncio.sleep(0)
+    assert calls == []
+
+    catch_up = job.catch_up_task
+    assert catch_up is not None
+    bot.is_ready.set()
+    await catch_up
+    await wait_for_runs(job)
+    assert calls == ["start", "end"]
+    assert job.caught_up == 1
+
+
+@pytest.mark.anyio
+async def test_cron_catch_up_too_late():
+    bot, scheduler, job, calls, _ = make_scheduler()
+
+    job.miss(time.time() - 120)
+    bot.is_ready.set()
+    scheduler.resume()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert calls == []
+    assert job.caught_up == 0
+
+
+@pytest.mark.anyio
+async def test_cron_failure():
+    box = Box()
+
+    @box.cron("0 * * * *")
+    async def task(sess):
+        await asyncio.sleep(0)
+        raise ValueError
+
+    bot = FakeBot(
+        Config(**DEFAULT, USERS={"owner": "U1"}, CHANNELS={}),
+        using_box=box,
+    )
+    scheduler = CronScheduler(bot, box.cron_tasks)
+    job = scheduler.jobs[0]
+    job.dispatch(time.time())
+    await wait_for_runs(job)
+    assert job.runs == 1
+
+    stats = scheduler.stats()["tests.scheduler_test.task"]
+    assert stats["failures"] == 1
+    assert bot.call_queue[0].method == "conversations.open"
+
+
+def test_cron_task_options():
+    box = Box()
+    with pytest.raises(ValueError, match="unknown overlap policy"):
+        box.cron("0 * * * *", overlap="wait")
+    with pytest.raises(ValueError, match="max_instances"):
+        box.cron("0 * * * *", max_instances=0)
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from yui.supervisor import Child
+from yui.supervisor import Supervisor
+
+
+@pytest.mark.anyio
+async def test_supervisor_restart_only_crashed():
+    supervisor = Supervisor(backoff=0.01)
+    ticks: list[int] = []
+    crashes = 0
+    recovered = asyncio.Event()
+
+    async def steady():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0.001)
+
+    async def flaky():
+        nonlocal crashes
+        await asyncio.sleep(0)
+        if crashes < 2:
+            crashes += 1
+            error = "boom"
+            raise RuntimeError(error)
+        recovered.set()
+        await asyncio.Event().wait()
+
+    supervisor.add("steady", steady)
+    supervisor.add("flaky", flaky)
+
+    task = asyncio.create_task(supervisor.run())
+    async with asyncio.timeout(1):
+        await recovered.wait()
+
+    stats = supervisor.stats()
+    assert stats["steady"] == {
+        "running": True,
+        "restarts": 0,
+        "crashes": 0,
+        "failures": 0,
+        "last_error": None,
+    }
+    assert stats["flaky"] == {
+        "running": True,
+        "restarts": 2,
+        "crashes": 2,
+        "failures": 2,
+        "last_error": "RuntimeError('boom')",
+    }
+    assert ticks
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.anyio
+async def test_supervisor_finished():
+    supervisor = Supervisor(backoff=0.01)
+    calls: list[str] = []
+
+    async def once():
+        await asyncio.sleep(0)
+        calls.append("once")
+
+    supervisor.add("once", once)
+    async with asyncio.timeout(1):
+        await supervisor.run()
+
+    assert calls == ["once"]
+    assert supervisor.children["once"].restarts == 0
+
+
+def test_supervisor_delay():
+    supervisor = Supervisor(backoff=1, max_backoff=5)
+    child = Child("test", asyncio.sleep)
+
+    delays = []
+    for failures in range(1, 6):
+        child.failures = failures
+        delays.append(supervisor.get_delay(child))
+    assert delays == [1, 2, 4, 5, 5]
+
+
+def test_supervisor_duplicated_name():
+    supervisor = Supervisor()
+    supervisor.add("test", asyncio.sleep)
+
+    with pytest.raises(ValueError, match="already added"):
+        supervisor.add("test", asyncio.sleep)
@@ -38,6 +38,15 @@ class Call:
     json_mode: bool = False
 
 
+class FakeSession:
+    """Fake DB session for test"""
+
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
 class FakeBot(Bot):
     """Fake bot for test"""
 
@@ -66,6 +75,9 @@ class FakeBot(Bot):
         self.config = config
         self.box = using_box
         self.is_ready = asyncio.Event()
+        self.restart_event = asyncio.Event()
+        self.raw_events = asyncio.Queue()
+        self.session_maker = FakeSession
 
     async def call(
         self,
@@ -0,0 +1,26 @@
+import sys
+from types import ModuleType
+
+import pytest
+
+from yui.utils.lazy import lazy_import
+
+
+def test_lazy_import(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+
+    colorsys = lazy_import("colorsys")
+    assert sys.modules["colorsys"] is colorsys
+    assert lazy_import("colorsys") is colorsys
+    assert colorsys.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1)
+
+
+def test_lazy_import_extension_module():
+    bz2 = lazy_import("_bz2")
+    assert type(bz2) is ModuleType
+    assert bz2.BZ2Compressor
+
+
+def test_lazy_import_not_found():
+    with pytest.raises(ModuleNotFoundError, match="no_such_module"):
+        lazy_import("no_such_module")
@@ -0,0 +1,120 @@
+import asyncio
+import re
+
+import pytest
+
+from yui.types.slack.response import APIResponse
+from yui.utils.report import report
+
+from ..util import FakeBot
+
+
+def fail():
+    error = "boom"
+    raise ValueError(error)
+
+
+async def fail_and_report(bot, text: str):
+    try:
+        fail()
+    except ValueError:
+        await report(bot, event=bot.create_message(text=text))
+
+
+@pytest.mark.anyio
+async def test_report_last_chunk():
+    bot = FakeBot()
+    bot.config.USERS["owner"] = "U1"
+
+    @bot.response("conversations.open")
+    def open_dm(data):
+        return APIResponse(
+            body={"ok": True, "channel": {"id": "D1"}},
+            status=200,
+            headers={},
+        )
+
+    await fail_and_report(bot, "hello")
+
+    (said,) = [
+        call for call in bot.call_queue if call.method == "chat.postMessage"
+    ]
+    assert said.data["channel"] == "D1"
+    assert said.data["text"].endswith("ValueError: boom\n```")
+
+
+@pytest.mark.anyio
+async def test_report_coalesce():
+    bot = FakeBot()
+    bot.config.USERS["owner"] = "U1"
+
+    @bot.response("conversations.open")
+    def open_dm(data):
+        return APIResponse(
+            body={"ok": True, "channel": {"id": "D1"}},
+            status=200,
+            headers={},
+        )
+
+    assert await bot.get_conversation_directory().open_dm("U1") == "D1"
+    outbox = bot.get_outbox()
+    runner = asyncio.create_task(outbox.run())
+    await asyncio.sleep(0)
+
+    async with asyncio.timeout(1):
+        await asyncio.gather(
+            fail_and_report(bot, "first"),
+            fail_and_report(bot, "second"),
+        )
+
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+    (said,) = [
+        call for call in bot.call_queue if call.method == "chat.postMessage"
+    ]
+    assert said.data["channel"] == "D1"
+    assert said.data["text"].count("ValueError: boom") == 2
+    assert "first" in said.data["text"]
+    assert "second" in said.data["text"]
+    assert outbox.stats()["coalesced"] == 1
+
+
+@pytest.mark.anyio
+async def test_report_chunk_order(monkeypatch):
+    lines = [f"line {i:03d} {'x' * 90}\n" for i in range(100)]
+    monkeypatch.setattr(
+        "yui.utils.report.get_simple_tb_text",
+        lambda tb: lines,
+    )
+    bot = FakeBot()
+    bot.config.USERS["owner"] = "U1"
+
+    @bot.response("conversations.open")
+    def open_dm(data):
+        return APIResponse(
+            body={"ok": True, "channel": {"id": "D1"}},
+            status=200,
+            headers={},
+        )
+
+    outbox = bot.get_outbox()
+    runner = asyncio.create_task(outbox.run())
+    await asyncio.sleep(0)
+
+    async with asyncio.timeout(1):
+        await fail_and_report(bot, "hello")
+
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+    said = [
+        call.data["text"]
+        for call in bot.call_queue
+        if call.method == "chat.postMessage"
+    ]
+    assert len(said) == 3
+    numbers = [int(n) for n in re.findall(r"line (\d+)", "".join(said))]
+    assert numbers == list(range(100))
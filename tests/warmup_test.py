@@ -0,0 +1,47 @@
+from yui.warmup import Readiness
+
+
+def test_readiness():
+    readiness = Readiness(["a", "b"])
+
+    assert not readiness.is_ready(["a"])
+    assert readiness.is_ready(["unknown"])
+    assert readiness.is_ready([])
+
+    readiness.start("a")
+    assert readiness.states["a"] == "running"
+    readiness.fail("a", RuntimeError("boom"))
+    assert readiness.states["a"] == "failed"
+    assert not readiness.is_ready(["a"])
+
+    readiness.start("a")
+    readiness.finish("a")
+    assert readiness.is_ready(["a"])
+    assert not readiness.is_ready(["a", "b"])
+
+    readiness.start("a")
+    readiness.fail("a", RuntimeError("boom"))
+    assert readiness.is_ready(["a"])
+
+    stats = readiness.stats()
+    assert stats["a"]["state"] == "ready"
+    assert stats["a"]["attempts"] == 3
+    assert stats["a"]["error"] == "RuntimeError('boom')"
+    assert stats["b"] == {
+        "state": "pending",
+        "attempts": 0,
+        "duration": None,
+        "error": None,
+    }
+
+
+def test_readiness_restore():
+    readiness = Readiness(["a"])
+
+    readiness.restore("a")
+    assert readiness.is_ready(["a"])
+
+    readiness.start("a")
+    readiness.fail("a", RuntimeError("boom"))
+    assert readiness.is_ready(["a"])
+    assert readiness.stats()["a"]["duration"] is None
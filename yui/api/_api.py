@@ -4,6 +4,7 @@ from datetime import timedelta
 from .apps import Apps
 from .chat import Chat
 from .conversations import Conversations
+from .throttle import RateLimiter
 from .users import Users
 
 
@@ -15,7 +16,8 @@ TIER1 = _limit_to_timedelta(1)  # 1+ per minute
 TIER2 = _limit_to_timedelta(20)  # 20+ per minute
 TIER3 = _limit_to_timedelta(50)  # 50+ per minute
 TIER4 = _limit_to_timedelta(100)  # 100+ per minute
-POST_MESSAGE = _limit_to_timedelta(60)  # 1 per second
+POST_MESSAGE = _limit_to_timedelta(60)  # 1 per second per channel
+POST_MESSAGE_WORKSPACE = _limit_to_timedelta(300)  # several hundred per minute
 
 
 class SlackAPI:
@@ -37,6 +39,8 @@ class SlackAPI:
         self.throttle_interval: defaultdict[str, timedelta] = defaultdict(
             lambda: TIER3,
         )
+        self.channel_throttle_interval: dict[str, timedelta] = {}
+        self.rate_limiter = RateLimiter(self)
 
         # apps.connections tier 1
         self.throttle_interval["apps.connections.open"] = TIER1
@@ -46,7 +50,8 @@ class SlackAPI:
         # chat tier 4
         self.throttle_interval["chat.postEphemeral"] = TIER4
         # chat special
-        self.throttle_interval["chat.postMessage"] = POST_MESSAGE
+        self.throttle_interval["chat.postMessage"] = POST_MESSAGE_WORKSPACE
+        self.channel_throttle_interval["chat.postMessage"] = POST_MESSAGE
 
         # conversations tier 2
         self.throttle_interval["conversations.list"] = TIER2
@@ -9,10 +9,17 @@ class Connections(Endpoint):
         self,
         *,
         token: str,
+        throttle_check: bool = True,
     ) -> APIResponse:
         """https://api.slack.com/methods/apps.connections.open"""
 
-        return await self._call("open", {}, token=token, json_mode=True)
+        return await self._call(
+            "open",
+            {},
+            token=token,
+            json_mode=True,
+            throttle_check=throttle_check,
+        )
 
 
 class Apps:
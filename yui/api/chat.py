@@ -7,6 +7,7 @@ from ..types.slack.attachment import Attachment
 from ..types.slack.block import Block
 from ..types.slack.response import APIResponse
 from .endpoint import Endpoint
+from .outbox import Priority
 
 
 class Chat(Endpoint):
@@ -107,8 +108,16 @@ class Chat(Endpoint):
         unfurl_media: bool | None = None,
         username: str | None = None,
         token: str | None = None,
+        priority: Priority = "interactive",
+        coalesce: bool = False,
     ) -> APIResponse:
-        """https://api.slack.com/methods/chat.postMessage"""
+        """https://api.slack.com/methods/chat.postMessage
+
+        When outbox of bot is running, message is queued with ``priority``
+        and may be merged with other queued messages of the same channel if
+        ``coalesce`` is set.
+
+        """
 
         params: dict[str, Any] = {
             "channel": channel,
@@ -157,6 +166,15 @@ class Chat(Endpoint):
         if username is not None:
             params["username"] = username
 
+        outbox = self.bot.outbox
+        if outbox is not None and outbox.running:
+            return await outbox.put(
+                params,
+                token=token,
+                priority=priority,
+                coalesce=coalesce,
+            )
+
         return await self._call(
             "postMessage",
             params,
@@ -1,9 +1,12 @@
+from collections.abc import AsyncGenerator
+
 from ..types.base import ChannelID
 from ..types.base import Ts
 from ..types.base import UserID
 from ..types.slack.response import APIResponse
 from .encoder import bool2str
 from .endpoint import Endpoint
+from .pagination import paginate
 
 type Array[T] = list[T]
 
@@ -44,6 +47,30 @@ class Conversations(Endpoint):
 
         return await self._call("history", params, json_mode=True)
 
+    def iter_history(
+        self,
+        channel: ChannelID,
+        *,
+        cursor: str | None = None,
+        inclusive: bool | None = None,
+        latest: Ts | None = None,
+        limit: int | None = None,
+        oldest: Ts | None = None,
+    ) -> AsyncGenerator[APIResponse]:
+        """Iterate pages of :meth:`history` with prefetch of next page."""
+
+        return paginate(
+            lambda cursor: self.history(
+                channel,
+                cursor=cursor,
+                inclusive=inclusive,
+                latest=latest,
+                limit=limit,
+                oldest=oldest,
+            ),
+            cursor,
+        )
+
     async def replies(
         self,
         channel: ChannelID,
@@ -79,6 +106,32 @@ class Conversations(Endpoint):
 
         return await self._call("replies", params)
 
+    def iter_replies(
+        self,
+        channel: ChannelID,
+        ts: Ts,
+        *,
+        cursor: str | None = None,
+        inclusive: bool | None = None,
+        latest: Ts | None = None,
+        limit: int | None = None,
+        oldest: Ts | None = None,
+    ) -> AsyncGenerator[APIResponse]:
+        """Iterate pages of :meth:`replies` with prefetch of next page."""
+
+        return paginate(
+            lambda cursor: self.replies(
+                channel,
+                ts,
+                cursor=cursor,
+                inclusive=inclusive,
+                latest=latest,
+                limit=limit,
+                oldest=oldest,
+            ),
+            cursor,
+        )
+
     async def info(
         self,
         channel: ChannelID,
@@ -130,6 +183,28 @@ class Conversations(Endpoint):
 
         return await self._call("list", params)
 
+    def iter_list(
+        self,
+        *,
+        cursor: str | None = None,
+        exclude_archived: bool | None = None,
+        limit: int | None = None,
+        team_id: str | None = None,
+        types: str | None = None,
+    ) -> AsyncGenerator[APIResponse]:
+        """Iterate pages of :meth:`list` with prefetch of next page."""
+
+        return paginate(
+            lambda cursor: self.list(
+                cursor=cursor,
+                exclude_archived=exclude_archived,
+                limit=limit,
+                team_id=team_id,
+                types=types,
+            ),
+            cursor,
+        )
+
     async def open(
         self,
         *,
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+from typing import TYPE_CHECKING
+
+from valkey.exceptions import ValkeyError
+
+from ..event import ImCreated
+from ..event import TeamJoin
+from ..event import UserChange
+from ..types.user import User
+from ..utils.attrs import make_instance
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
+    from ..bot import Bot
+    from ..event import Event
+    from ..types.base import ChannelID
+    from ..types.base import UserID
+
+logger = logging.getLogger(__name__)
+
+
+class TTLStore[T]:
+    """In-memory values which expire after ``ttl`` seconds.
+
+    Concurrent :meth:`get` calls of the same missing key share one fetch.
+
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self.entries: dict[str, tuple[T, float]] = {}
+        self.pending: dict[str, asyncio.Future[T]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_cached(self, key: str) -> T | None:
+        try:
+            value, expires_at = self.entries[key]
+        except KeyError:
+            return None
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+        return value
+
+    def put(self, key: str, value: T):
+        self.entries[key] = (value, time.monotonic() + self.ttl)
+
+    def pop(self, key: str):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Get cached value or fetch it once for concurrent callers."""
+
+        value = self.get_cached(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        future = self.pending.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        future = asyncio.ensure_future(self.load(key, fetch))
+        self.pending[key] = future
+        future.add_done_callback(lambda _: self.pending.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def load(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        value = await fetch()
+        self.put(key, value)
+        return value
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "pending": len(self.pending),
+        }
+
+
+class UserDirectory:
+    """Cache of Slack users.
+
+    Users are fetched by ``users.info`` on first lookup and kept in memory
+    for ``ttl`` seconds. If ``mirror`` is set, they are also stored in
+    Valkey, so other instances and restarts can skip ``users.info``.
+    ``team_join`` and ``user_change`` events update cached users. Concurrent
+    lookups of the same user share one API call.
+
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        *,
+        ttl: float = 43200.0,
+        mirror: bool = False,
+    ) -> None:
+        self.bot = bot
+        self.ttl = ttl
+        self.mirror = mirror
+        self.users: TTLStore[User] = TTLStore(ttl)
+        self.mirror_hits = 0
+
+    async def get(self, user_id: UserID) -> User:
+        """Get user from cache or fetch it once for concurrent callers."""
+
+        return await self.users.get(user_id, lambda: self.fetch(user_id))
+
+    async def fetch(self, user_id: UserID) -> User:
+        if self.mirror:
+            data = await self.load_mirror(user_id)
+            if data is not None:
+                self.mirror_hits += 1
+                return make_instance(User, **data)
+
+        resp = await self.bot.api.users.info(user=user_id)
+        if (
+            resp.is_ok()
+            and isinstance(resp.body, dict)
+            and isinstance(resp.body.get("user"), dict)
+        ):
+            await self.save_mirror([resp.body["user"]])
+            return make_instance(User, **resp.body["user"])
+        error = "Unexpected response"
+        raise ValueError(error)
+
+    def store(self, data: dict[str, Any]) -> User:
+        user = make_instance(User, **data)
+        self.users.put(user.id, user)
+        return user
+
+    async def load_mirror(self, user_id: str) -> dict[str, Any] | None:
+        try:
+            data: dict[str, Any] | None = await self.bot.cache.get(
+                f"USER_{user_id}",
+            )
+        except (ValkeyError, RuntimeError, TimeoutError):
+            logger.warning("fail to load user %s from valkey", user_id)
+            return None
+        return data
+
+    async def save_mirror(self, rows: list[dict[str, Any]]):
+        if not self.mirror:
+            return
+        try:
+            for row in rows:
+                await self.bot.cache.set(
+                    f"USER_{row['id']}",
+                    row,
+                    int(self.ttl),
+                )
+        except (ValkeyError, RuntimeError, TimeoutError):
+            logger.warning("fail to save users to valkey")
+
+    async def observe(self, event: Event):
+        """Keep cached users fresh from events."""
+
+        if not isinstance(event, TeamJoin | UserChange):
+            return
+
+        data: Any = event.user
+        if isinstance(data, dict) and "id" in data:
+            self.store(data)
+            await self.save_mirror([data])
+        elif isinstance(data, str):
+            self.users.pop(data)
+
+    def stats(self) -> dict[str, Any]:
+        return self.users.stats() | {"mirror_hits": self.mirror_hits}
+
+
+class ConversationDirectory:
+    """Cache of DM channels.
+
+    Caches DM channel of each user opened by ``conversations.open``, and
+    ``im_created`` events store new DM channels. Concurrent lookups of the
+    same user share one API call.
+
+    """
+
+    def __init__(self, bot: Bot, *, dm_ttl: float = 86400.0) -> None:
+        self.bot = bot
+        self.dm_channels: TTLStore[ChannelID] = TTLStore(dm_ttl)
+
+    async def open_dm(self, user_id: UserID) -> ChannelID | None:
+        """Get id of DM channel with given user."""
+
+        try:
+            return await self.dm_channels.get(
+                user_id,
+                lambda: self.fetch_dm(user_id),
+            )
+        except LookupError:
+            logger.warning("fail to open DM channel with %s", user_id)
+            return None
+
+    async def fetch_dm(self, user_id: UserID) -> ChannelID:
+        resp = await self.bot.api.conversations.open(users=[user_id])
+        channel = resp.body.get("channel") if resp.is_ok() else None
+        if not isinstance(channel, dict) or "id" not in channel:
+            error = f"unexpected response: {resp.body}"
+            raise LookupError(error)
+        return channel["id"]
+
+    def observe(self, event: Event):
+        """Store new DM channels by events."""
+
+        if not isinstance(event, ImCreated):
+            return
+        if isinstance(event.channel, dict) and "id" in event.channel:
+            self.dm_channels.put(event.user, event.channel["id"])
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {"dm_channels": self.dm_channels.stats()}
@@ -1,16 +1,90 @@
 import enum
-from contextlib import suppress
+import types
+from collections.abc import Callable
 from typing import Any
+from typing import Final
+from typing import get_args
 
 import attrs
 
 from ..types.slack.response import APIResponse
 
+type Encoder = Callable[[Any], dict[str, Any]]
+
+SCALARS: Final = frozenset({str, int, float, bool, types.NoneType})
+
+ENCODERS: dict[type, Encoder] = {}
+
+
+def is_scalar(t: Any) -> bool:
+    if t in SCALARS:
+        return True
+    args = get_args(t)
+    return isinstance(t, types.UnionType) and all(
+        arg in SCALARS for arg in args
+    )
+
+
+def compile_encoder(cls: type) -> Encoder:
+    """Generate function which turns attrs instance into JSON-ready dict.
+
+    Generated function reads each field once, drops :obj:`None` and empty
+    lists like :func:`prepare_for_json` and does not build intermediate dict
+    with :func:`attrs.asdict`.
+
+    """
+
+    lines = ["def encode(obj):", "    result = {}"]
+    for field in attrs.fields(cls):
+        name = field.name
+        lines.append(f"    value = obj.{name}")
+        if is_scalar(field.type):
+            lines += [
+                "    if value.__class__ in SCALARS:",
+                "        if value is not None:",
+                f"            result[{name!r}] = value",
+                "    else:",
+                "        value = prepare_for_json(value)",
+                "        if value is not None and value != []:",
+                f"            result[{name!r}] = value",
+            ]
+        else:
+            lines += [
+                "    if value is not None:",
+                "        value = prepare_for_json(value)",
+                "        if value is not None and value != []:",
+                f"            result[{name!r}] = value",
+            ]
+    lines.append("    return result")
+
+    namespace: dict[str, Any] = {
+        "SCALARS": SCALARS,
+        "prepare_for_json": prepare_for_json,
+    }
+    exec(  # noqa: S102
+        compile("\n".join(lines), f"<encoder {cls.__qualname__}>", "exec"),
+        namespace,
+    )
+    return namespace["encode"]
+
+
+def get_encoder(cls: type) -> Encoder:
+    """Get cached encoder of attrs class."""
+
+    try:
+        return ENCODERS[cls]
+    except KeyError:
+        encoder = ENCODERS[cls] = compile_encoder(cls)
+        return encoder
+
 
 def prepare_for_json(obj: Any) -> Any:
+    cls = obj.__class__
+    if cls in SCALARS:
+        return obj
     if isinstance(obj, (list, tuple, set)):
         return [prepare_for_json(x) for x in obj]
-    if issubclass(obj.__class__, enum.Enum):
+    if isinstance(obj, enum.Enum):
         return obj.value
     if isinstance(obj, dict):
         return {
@@ -21,8 +95,8 @@ def prepare_for_json(obj: Any) -> Any:
         }
     if isinstance(obj, str):
         return obj
-    with suppress(attrs.exceptions.NotAnAttrsClassError):
-        return prepare_for_json(attrs.asdict(obj))
+    if attrs.has(cls):
+        return get_encoder(cls)(obj)
 
     return obj
 
@@ -42,6 +116,7 @@ class Endpoint:
         *,
         token=None,
         json_mode: bool = False,
+        throttle_check: bool = True,
     ) -> APIResponse:
         if json_mode:
             data = prepare_for_json(data)
@@ -51,4 +126,5 @@ class Endpoint:
             data,
             token=token,
             json_mode=json_mode,
+            throttle_check=throttle_check,
         )
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from typing import Any
+from typing import Final
+from typing import Literal
+from typing import TYPE_CHECKING
+from typing import get_args
+
+from attrs import define
+from attrs import field
+
+if TYPE_CHECKING:
+    from ..types.slack.response import APIResponse
+    from .chat import Chat
+
+type Priority = Literal["interactive", "broadcast", "report"]
+
+PRIORITIES: Final[tuple[Priority, ...]] = get_args(Priority.__value__)
+MERGEABLE_KEYS: Final = frozenset({"text", "attachments"})
+
+
+@define(eq=False)
+class Outgoing:
+    """Message waiting in :class:`Outbox`."""
+
+    channel: str
+    params: dict[str, Any]
+    token: str | None
+    priority: Priority
+    coalesce: bool
+    future: asyncio.Future[APIResponse]
+    enqueued_at: float
+    merged: list[Outgoing] = field(factory=list)
+
+    def can_merge(self, other: Outgoing) -> bool:
+        if not (self.coalesce and other.coalesce):
+            return False
+        if self.token != other.token:
+            return False
+        keys = self.params.keys() | other.params.keys()
+        return all(
+            self.params.get(key) == other.params.get(key)
+            for key in keys - MERGEABLE_KEYS
+        )
+
+    def merge(
+        self,
+        other: Outgoing,
+        max_length: int,
+        max_attachments: int,
+    ) -> bool:
+        """Merge other message into this one if limits allow it."""
+
+        text = self.params.get("text")
+        other_text = other.params.get("text")
+        if text is not None and other_text is not None:
+            text = f"{text}\n{other_text}"
+        elif other_text is not None:
+            text = other_text
+        if text is not None and len(text) > max_length:
+            return False
+
+        attachments = [
+            *self.params.get("attachments", []),
+            *other.params.get("attachments", []),
+        ]
+        if len(attachments) > max_attachments:
+            return False
+
+        if text is not None:
+            self.params["text"] = text
+        if attachments:
+            self.params["attachments"] = attachments
+        self.merged.append(other)
+        return True
+
+    def resolve(self, resp: APIResponse):
+        for message in [self, *self.merged]:
+            if not message.future.done():
+                message.future.set_result(resp)
+
+    def fail(self, error: Exception):
+        for message in [self, *self.merged]:
+            if not message.future.done():
+                message.future.set_exception(error)
+
+
+class Outbox:
+    """Queue of outgoing messages in front of ``chat.postMessage``.
+
+    Messages are sent by priority, ``interactive`` first, then
+    ``broadcast`` and ``report``. Messages in the same channel are sent in
+    order one at a time, and queued messages which allow ``coalesce`` are
+    merged into one call when only their text or attachments differ.
+
+    """
+
+    def __init__(
+        self,
+        chat: Chat,
+        *,
+        workers: int = 4,
+        max_length: int = 4000,
+        max_attachments: int = 20,
+    ) -> None:
+        self.chat = chat
+        self.workers = workers
+        self.max_length = max_length
+        self.max_attachments = max_attachments
+        self.queues: dict[Priority, deque[Outgoing]] = {
+            priority: deque() for priority in PRIORITIES
+        }
+        self.sending: set[str] = set()
+        self.changed = asyncio.Event()
+        self.running = False
+        self.peak = 0
+        self.calls = 0
+        self.coalesced = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    async def put(
+        self,
+        params: dict[str, Any],
+        *,
+        token: str | None = None,
+        priority: Priority = "interactive",
+        coalesce: bool = False,
+    ) -> APIResponse:
+        """Queue message and wait until it is sent."""
+
+        if priority not in self.queues:
+            error = f"unknown priority: {priority!r}"
+            raise ValueError(error)
+
+        loop = asyncio.get_running_loop()
+        message = Outgoing(
+            channel=str(params["channel"]),
+            params=params,
+            token=token,
+            priority=priority,
+            coalesce=coalesce and "blocks" not in params,
+            future=loop.create_future(),
+            enqueued_at=loop.time(),
+        )
+        self.queues[priority].append(message)
+        self.peak = max(self.peak, len(self))
+        self.changed.set()
+        try:
+            return await message.future
+        except asyncio.CancelledError:
+            with contextlib.suppress(ValueError):
+                self.queues[priority].remove(message)
+            raise
+
+    def pick(self) -> Outgoing | None:
+        """Pop next message and merge followers of its channel into it."""
+
+        for priority in PRIORITIES:
+            queue = self.queues[priority]
+            for message in queue:
+                if message.channel not in self.sending:
+                    break
+            else:
+                continue
+            queue.remove(message)
+            self.collect(message)
+            self.sending.add(message.channel)
+            return message
+        return None
+
+    def collect(self, message: Outgoing):
+        for priority in PRIORITIES:
+            queue = self.queues[priority]
+            for other in list(queue):
+                if other.channel != message.channel:
+                    continue
+                if not (
+                    message.can_merge(other)
+                    and message.merge(
+                        other,
+                        self.max_length,
+                        self.max_attachments,
+                    )
+                ):
+                    return
+                queue.remove(other)
+
+    async def take(self) -> Outgoing:
+        while True:
+            message = self.pick()
+            if message is not None:
+                return message
+            self.changed.clear()
+            await self.changed.wait()
+
+    async def send(self, message: Outgoing):
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        for waited in [message, *message.merged]:
+            wait = now - waited.enqueued_at
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        self.calls += 1
+        self.coalesced += len(message.merged)
+
+        try:
+            resp = await self.chat._call(
+                "postMessage",
+                message.params,
+                token=message.token,
+                json_mode=True,
+            )
+        except Exception as e:  # noqa: BLE001
+            message.fail(e)
+        else:
+            message.resolve(resp)
+        finally:
+            self.sending.discard(message.channel)
+            self.changed.set()
+
+    async def work(self):
+        while True:
+            message = await self.take()
+            await self.send(message)
+
+    async def run(self):
+        """Run workers which send queued messages."""
+
+        self.running = True
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(self.workers):
+                    tg.create_task(self.work())
+        finally:
+            self.running = False
+
+    def stats(self) -> dict[str, Any]:
+        sent = self.calls + self.coalesced
+        return {
+            "depth": {
+                priority: len(queue) for priority, queue in self.queues.items()
+            },
+            "peak": self.peak,
+            "sending": len(self.sending),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "avg_wait": self.total_wait / sent if sent else 0.0,
+            "max_wait": self.max_wait,
+        }
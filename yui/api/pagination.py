@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
+    from ..types.slack.response import APIResponse
+
+type Fetch = Callable[[str | None], Awaitable[APIResponse]]
+
+
+def get_next_cursor(resp: APIResponse) -> str | None:
+    """Get cursor of next page from response of Slack list method."""
+
+    if not resp.body.get("ok"):
+        return None
+    metadata = resp.body.get("response_metadata") or {}
+    return metadata.get("next_cursor") or None
+
+
+async def paginate(
+    fetch: Fetch,
+    cursor: str | None = None,
+) -> AsyncGenerator[APIResponse]:
+    """Iterate pages of Slack list method by following ``next_cursor``.
+
+    ``fetch`` is called with cursor of each page. Next page is requested
+    in background while caller consumes current one. Each request still
+    goes through throttle of bot. Iteration stops after the last page or a
+    page which is not ok.
+
+    """
+
+    task = asyncio.ensure_future(fetch(cursor))
+    try:
+        while True:
+            resp = await task
+            cursor = get_next_cursor(resp)
+            if cursor is not None:
+                task = asyncio.ensure_future(fetch(cursor))
+            yield resp
+            if cursor is None:
+                return
+    finally:
+        if not task.done():
+            task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Final
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._api import SlackAPI
+
+type BucketKey = str | tuple[str, str]
+
+MAX_FACTOR: Final = 16.0
+RELAX_AFTER: Final = 60.0
+
+logger = logging.getLogger(__name__)
+
+
+class LeakyBucket:
+    """Release waiters one by one with the given interval."""
+
+    def __init__(self) -> None:
+        self.interval = 0.0
+        self.next_at = 0.0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.handle: asyncio.TimerHandle | None = None
+
+    async def acquire(self, interval: float):
+        """Wait until this bucket releases a slot for caller."""
+
+        loop = asyncio.get_running_loop()
+        self.interval = interval
+        if not self.waiters and loop.time() >= self.next_at:
+            self.next_at = loop.time() + interval
+            return
+
+        waiter: asyncio.Future[None] = loop.create_future()
+        self.waiters.append(waiter)
+        self._schedule(loop)
+        await waiter
+
+    def delay(self, seconds: float):
+        """Do not release any waiter for given seconds."""
+
+        loop = asyncio.get_running_loop()
+        self.next_at = max(self.next_at, loop.time() + seconds)
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+            self._schedule(loop)
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop):
+        if self.waiters and self.handle is None:
+            self.handle = loop.call_at(self.next_at, self._release, loop)
+
+    def _release(self, loop: asyncio.AbstractEventLoop):
+        self.handle = None
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self.next_at = loop.time() + self.interval
+                break
+        self._schedule(loop)
+
+
+class RateLimiter:
+    """Rate limiter driven by Slack API tier table.
+
+    Methods in ``channel_throttle_interval`` of :class:`SlackAPI` are limited
+    per channel first and then by workspace-wide ``throttle_interval``.
+
+    When Slack answers with rate limit, the interval of the method is doubled
+    (up to :data:`MAX_FACTOR` times) and it is halved again after each
+    :data:`RELAX_AFTER` seconds without rate limit.
+
+    """
+
+    def __init__(self, api: SlackAPI) -> None:
+        self.api = api
+        self.buckets: dict[BucketKey, LeakyBucket] = {}
+        self.factors: dict[str, float] = {}
+        self.changed_at: dict[str, float] = {}
+
+    def get_bucket(self, key: BucketKey) -> LeakyBucket:
+        try:
+            return self.buckets[key]
+        except KeyError:
+            bucket = self.buckets[key] = LeakyBucket()
+            return bucket
+
+    async def acquire(self, method: str, channel: str | None = None):
+        """Wait for the turn to call given method."""
+
+        if channel and (
+            channel_interval := self.api.channel_throttle_interval.get(method)
+        ):
+            await self.get_bucket((method, channel)).acquire(
+                channel_interval.total_seconds() * self.get_factor(method),
+            )
+
+        await self.get_bucket(method).acquire(self.get_interval(method))
+
+    def get_factor(self, method: str) -> float:
+        return self.factors.get(method, 1.0)
+
+    def get_interval(self, method: str) -> float:
+        """Get effective interval of given method in seconds."""
+
+        base = self.api.throttle_interval[method].total_seconds()
+        return base * self.get_factor(method)
+
+    def penalize(self, method: str, retry_after: float):
+        """Apply rate limit response from Slack."""
+
+        loop = asyncio.get_running_loop()
+        self.get_bucket(method).delay(retry_after)
+        factor = min(self.get_factor(method) * 2, MAX_FACTOR)
+        self.factors[method] = factor
+        self.changed_at[method] = loop.time()
+        logger.warning(
+            "rate limited on %s. retry after %.1fs, interval x%g",
+            method,
+            retry_after,
+            factor,
+        )
+
+    def relax(self, method: str):
+        """Apply successful response from Slack."""
+
+        factor = self.factors.get(method)
+        if factor is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        if loop.time() - self.changed_at[method] < RELAX_AFTER:
+            return
+
+        factor /= 2
+        if factor > 1:
+            self.factors[method] = factor
+            self.changed_at[method] = loop.time()
+        else:
+            del self.factors[method]
+            del self.changed_at[method]
+        logger.info("relax rate limit of %s. interval x%g", method, factor)
+
+    def rates(self) -> dict[str, float]:
+        """Get current effective rates per minute of used methods."""
+
+        result: dict[str, float] = {}
+        for key in self.buckets:
+            if isinstance(key, str):
+                interval = self.get_interval(key)
+                result[key] = 60 / interval if interval else float("inf")
+        return result
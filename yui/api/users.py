@@ -1,8 +1,11 @@
+from collections.abc import AsyncGenerator
+
 from ..types.base import UserID
 from ..types.slack.response import APIResponse
 from ..types.user import User
 from .encoder import bool2str
 from .endpoint import Endpoint
+from .pagination import paginate
 
 
 class Users(Endpoint):
@@ -38,3 +41,23 @@ class Users(Endpoint):
             params["presence"] = bool2str(presence)
 
         return await self._call("list", params)
+
+    def iter_list(
+        self,
+        *,
+        cursor: str | None = None,
+        include_locale: bool | None = None,
+        limit: int = 0,
+        presence: bool | None = None,
+    ) -> AsyncGenerator[APIResponse]:
+        """Iterate pages of :meth:`list` with prefetch of next page."""
+
+        return paginate(
+            lambda cursor: self.list(
+                curser=cursor,
+                include_locale=include_locale,
+                limit=limit,
+                presence=presence,
+            ),
+            cursor,
+        )
@@ -84,7 +84,19 @@ async def get_dog_image_url(timeout: float) -> str:  # noqa: ASYNC109
                         return url
 
 
-async def get_fox_image_url(timeout: float) -> str:  # noqa: ASYNC109
+def parse_fox_gallery(data: str) -> str:
+    h = get_root(data)
+    image_els = h.cssselect("#gallery-1 img.attachment-thumbnail")
+    try:
+        return str(image_els[0].get("src"))
+    except IndexError as e:
+        raise APIServerError from e
+
+
+async def get_fox_image_url(
+    bot: Bot,
+    timeout: float,  # noqa: ASYNC109
+) -> str:
     async with (
         asyncio.timeout(delay=timeout),
         aiohttp.ClientSession() as session,
@@ -93,12 +105,7 @@ async def get_fox_image_url(timeout: float) -> str:  # noqa: ASYNC109
         if resp.status != 200:
             raise APIServerError
         data = await resp.text()
-    h = get_root(data)
-    image_els = h.cssselect("#gallery-1 img.attachment-thumbnail")
-    try:
-        return str(image_els[0].get("src"))
-    except IndexError as e:
-        raise APIServerError from e
+    return await bot.run_in_other_thread(parse_fox_gallery, data)
 
 
 @box.command("cat", ["냥", "야옹", "냐옹"])
@@ -228,7 +235,7 @@ async def fox(bot, event: Message, timeout: float = 1.5):  # noqa: ASYNC109
         return
 
     try:
-        url = await get_fox_image_url(timeout)
+        url = await get_fox_image_url(bot, timeout)
     except APIServerError:
         await fox_say(
             text="여우짤 서버의 상태가 좋지 않네요! 나중에 다시 시도해보세요!",
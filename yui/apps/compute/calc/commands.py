@@ -4,6 +4,7 @@ from typing import Final
 
 from ....bot import Bot
 from ....box import box
+from ....command import concurrency
 from ....event import Message
 from .evaluator import Evaluator
 from .exceptions import BadSyntax
@@ -112,6 +113,7 @@ async def body(
 
 
 @box.command("=", ["calc"])
+@concurrency(2, key="calc", wait=False)
 async def calc_decimal(bot, event: Message, raw: str):
     """
     정수타입 수식 계산기
@@ -132,6 +134,7 @@ async def calc_decimal(bot, event: Message, raw: str):
 
 
 @box.command("=", ["calc"], subtype="message_changed")
+@concurrency(2, key="calc", wait=False)
 async def calc_decimal_on_change(bot, event: Message, raw: str):
     if event.message:
         await body(
@@ -144,6 +147,7 @@ async def calc_decimal_on_change(bot, event: Message, raw: str):
 
 
 @box.command("==")
+@concurrency(2, key="calc", wait=False)
 async def calc_num(bot, event: Message, raw: str):
     """
     부동소숫점타입 수식 계산기
@@ -164,6 +168,7 @@ async def calc_num(bot, event: Message, raw: str):
 
 
 @box.command("==", subtype="message_changed")
+@concurrency(2, key="calc", wait=False)
 async def calc_num_on_change(bot, event: Message, raw: str):
     if event.message:
         await body(
@@ -182,8 +187,12 @@ def calculate(
 ):  # pragma: no cover  -- run on other process
 
     limit = 2 * 1024 * 1024
-    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
-    e = Evaluator(decimal_mode=decimal_mode)
-    result = e.run(expr)
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    try:
+        e = Evaluator(decimal_mode=decimal_mode)
+        result = e.run(expr)
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
 
     return result, e.scope
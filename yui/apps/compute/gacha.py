@@ -1,3 +1,4 @@
+import functools
 import inspect
 import math
 import re
@@ -7,16 +8,16 @@ from decimal import InvalidOperation
 from decimal import ROUND_FLOOR
 from typing import Final
 
-from scipy.stats import nbinom
-from sympy.abc import x
-from sympy.functions.combinatorial.numbers import harmonic
-from sympy.utilities.lambdify import lambdify
-
 from ...box import box
 from ...box import route
 from ...command import argument
 from ...command import option
 from ...event import Message
+from ...utils.lazy import lazy_import
+
+# scipy and sympy take seconds to import, so they are imported on first use
+scipy = lazy_import("scipy")
+sympy = lazy_import("sympy")
 
 SUCCESSES_MIN: Final = 1
 SUCCESSES_MAX: Final = 10000
@@ -37,11 +38,29 @@ COLLECT_QUERY2 = re.compile(
     r"(?P<n>\d+)\s*(?:종류?|개)?$",
 )
 
-collect_func: Callable[[int], float] = lambdify(
-    x,
-    x * harmonic(x),
-    modules="sympy",
-)
+
+@functools.cache
+def get_collect_func() -> Callable[[int], float]:
+    x = sympy.Symbol("x")
+    return sympy.lambdify(x, x * sympy.harmonic(x), modules="sympy")
+
+
+def collect_func(n: int) -> float:
+    return get_collect_func()(n)
+
+
+def get_challenge_results(
+    successes: int,
+    p: Decimal,
+) -> list[tuple[int, Decimal]]:
+    counts = {
+        math.ceil(scipy.stats.nbinom.ppf(float(q), successes, float(p)))
+        for q in filter(lambda x: x >= p, [*CHANCES, p])
+    }
+    return [
+        (x, Decimal(str(scipy.stats.nbinom.cdf(x, successes, float(p)))))
+        for x in sorted(counts)
+    ]
 
 
 def to_percent(v: Decimal, q=CHANCE_MIN) -> str:
@@ -135,14 +154,11 @@ Aliases
                 "입력하신 확률값에 비해 성공 횟수가 너무 많아요!",
             )
             return
-        counts = {
-            math.ceil(nbinom.ppf(float(q), successes, float(p)))
-            for q in filter(lambda x: x >= p, [*CHANCES, p])
-        }
-        results = [
-            (x, Decimal(str(nbinom.cdf(x, successes, float(p)))))
-            for x in sorted(counts)
-        ]
+        results = await bot.run_in_other_thread(
+            get_challenge_results,
+            successes,
+            p,
+        )
         text = "\n".join(
             f"- {tries + successes:,}번 시도하시면"
             f" {to_percent(ch, D001)}% 확률로"
@@ -188,7 +204,7 @@ Aliases
             )
             return
 
-        result = collect_func(n)
+        result = await bot.run_in_other_thread(collect_func, n)
         if total > n:
             result /= n / total
             text = "부분적으로"
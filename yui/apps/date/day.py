@@ -27,6 +27,7 @@ async def holiday_message(bot):
         await bot.say(
             bot.config.CHANNELS["general"],
             f"오늘은 {holidays[0]}! 행복한 휴일 되세요!",
+            priority="broadcast",
         )
 
 
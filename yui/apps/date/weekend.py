@@ -19,6 +19,7 @@ async def auto_weekend_loading(bot):
         await bot.say(
             bot.config.CHANNELS["general"],
             f"주말로딩… {blocks} {percent:.2f}%",
+            priority="broadcast",
         )
 
 
@@ -27,6 +28,7 @@ async def auto_weekend_start(bot):
     await bot.say(
         bot.config.CHANNELS["general"],
         "주말이에요! 즐거운 주말 되세요!",
+        priority="broadcast",
     )
 
 
@@ -11,17 +11,8 @@ HEADERS = {
 }
 
 
-async def say_packtpub_dotd(bot: Bot, channel):
+def parse(data: bytes) -> list[Attachment]:
     attachments: list[Attachment] = []
-    url = "https://www.packtpub.com/free-learning"
-    async with (
-        aiohttp.ClientSession(headers=HEADERS) as session,
-        session.get(
-            url,
-        ) as resp,
-    ):
-        data = await resp.read()
-
     h = get_root(data)
 
     try:
@@ -45,6 +36,20 @@ async def say_packtpub_dotd(bot: Bot, channel):
         )
     except IndexError:
         pass
+    return attachments
+
+
+async def say_packtpub_dotd(bot: Bot, channel):
+    url = "https://www.packtpub.com/free-learning"
+    async with (
+        aiohttp.ClientSession(headers=HEADERS) as session,
+        session.get(
+            url,
+        ) as resp,
+    ):
+        data = await resp.read()
+
+    attachments = await bot.run_in_other_thread(parse, data)
 
     if attachments:
         await bot.api.chat.postMessage(
@@ -1,5 +1,7 @@
+import asyncio
 import inspect
 import re
+from datetime import datetime
 
 import aiohttp
 import aiohttp.client_exceptions
@@ -84,7 +86,7 @@ class RSS(route.RouteApp):
             return
 
         try:
-            f = fastfeedparser.parse(data)
+            f = await bot.run_in_other_thread(fastfeedparser.parse, data)
         except ValueError:
             await bot.say(
                 event.channel,
@@ -150,9 +152,26 @@ class RSS(route.RouteApp):
         await sess.commit()
 
 
+async def post_entries(
+    bot,
+    feed: RSSFeedURL,
+    attachments: list[Attachment],
+    updated_at: datetime,
+):
+    await bot.api.chat.postMessage(
+        channel=feed.channel,
+        attachments=attachments,
+        priority="broadcast",
+        coalesce=True,
+    )
+    feed.updated_at = updated_at
+
+
 @box.cron("*/5 * * * *")
 async def crawl(bot, sess: AsyncSession):
     feeds = (await sess.scalars(select(RSSFeedURL))).all()
+    errors: list[tuple[str, str]] = []
+    updates: list[tuple[RSSFeedURL, list[Attachment], datetime]] = []
 
     feed: RSSFeedURL
     for feed in feeds:
@@ -162,25 +181,31 @@ async def crawl(bot, sess: AsyncSession):
                 async with session.get(feed.url) as res:
                     data = await res.read()
             except aiohttp.client_exceptions.ClientConnectorError:
-                await bot.say(
-                    feed.channel,
-                    f"*Error*: `{feed.url}`에 접속할 수 없어요!",
+                errors.append(
+                    (
+                        feed.channel,
+                        f"*Error*: `{feed.url}`에 접속할 수 없어요!",
+                    ),
                 )
                 continue
 
         if not data:
-            await bot.say(
-                feed.channel,
-                f"*Error*: `{feed.url}`에 접속해도 자료를 가져올 수 없어요!",
+            errors.append(
+                (
+                    feed.channel,
+                    f"*Error*: `{feed.url}`에 접속해도 자료를 가져올 수 없어요!",
+                ),
             )
             continue
 
         try:
-            f = fastfeedparser.parse(data)
+            f = await bot.run_in_other_thread(fastfeedparser.parse, data)
         except ValueError:
-            await bot.say(
-                feed.channel,
-                f"*Error*: `{feed.url}`는 올바른 RSS 문서가 아니에요!",
+            errors.append(
+                (
+                    feed.channel,
+                    f"*Error*: `{feed.url}`는 올바른 RSS 문서가 아니에요!",
+                ),
             )
             continue
 
@@ -208,16 +233,22 @@ async def crawl(bot, sess: AsyncSession):
                 )
                 last_updated = t
 
-        feed.updated_at = last_updated
-
         if attachments:
-            await bot.api.chat.postMessage(
-                channel=feed.channel,
-                attachments=attachments,
-            )
-
-            sess.add(feed)
-            await sess.commit()
+            updates.append((feed, attachments, last_updated))
+
+    # queue every post at once, so posts to the same channel are coalesced
+    results = await asyncio.gather(
+        *(
+            bot.say(channel, text, priority="broadcast", coalesce=True)
+            for channel, text in errors
+        ),
+        *(post_entries(bot, *update) for update in updates),
+        return_exceptions=True,
+    )
+    await sess.commit()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
 
 box.register(RSS())
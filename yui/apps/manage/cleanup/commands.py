@@ -17,7 +17,7 @@ box.assert_users_required("force_cleanup")
 COOLTIME = datetime.timedelta(minutes=5)
 
 
-@box.command("청소")
+@box.command("청소", timeout=0)
 @option(
     "--mode",
     "m",
@@ -108,7 +108,7 @@ async def cleanup(bot, sess: AsyncSession, event: Message, mode: str):
     )
 
 
-@box.command("수집")
+@box.command("수집", timeout=0)
 async def collect(bot, sess: AsyncSession, event: Message):
     """
     채널 메시지 수집
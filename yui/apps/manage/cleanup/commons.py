@@ -1,3 +1,5 @@
+from contextlib import aclosing
+
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import delete
@@ -66,35 +68,31 @@ async def cleanup_by_history(
     minimum: int = 100,
 ) -> int:
     deleted = 0
-    deletable = True
-    while deletable and deleted < minimum:
-        try:
-            resp = await bot.api.conversations.history(
-                channel_id,
-                latest=ts,
-            )
-        except APICallError as e:
-            await report(bot, exception=e)
-            break
-        history = resp.body
-        deletable = False
-        if history["ok"]:
-            messages = simplify_history_result(history["messages"])
+    pages = bot.api.conversations.iter_history(channel_id, latest=ts)
+    async with aclosing(pages):
+        while deleted < minimum:
+            try:
+                resp = await anext(pages, None)
+            except APICallError as e:
+                await report(bot, exception=e)
+                break
+            if resp is None or not resp.body["ok"]:
+                break
+            deletable = False
+            messages = simplify_history_result(resp.body["messages"])
             while messages:
                 message = messages.pop(0)
                 reply_count = message["reply_count"]
                 if reply_count:
                     try:
-                        r = await bot.api.conversations.replies(
+                        messages += await get_replies(
+                            bot,
                             channel_id,
-                            ts=message["ts"],
+                            message["ts"],
                         )
                     except APICallError as e:
                         await report(bot, exception=e)
                         break
-                    messages += simplify_history_result(
-                        r.body.get("messages", [])[1:],
-                    )
                 try:
                     res = await bot.api.chat.delete(
                         channel_id,
@@ -115,6 +113,8 @@ async def cleanup_by_history(
                         ),
                     )
                     await sess.commit()
+            if not deletable:
+                break
 
     return deleted
 
@@ -124,56 +124,45 @@ async def collect_history_from_channel(
     channel_id: ChannelID,
     sess: AsyncSession,
 ) -> int:
-    cursor = None
     collected: set[tuple[str, str]] = set()
+    pages = bot.api.conversations.iter_history(channel_id)
     try:
-        while True:
-            try:
-                resp = await bot.api.conversations.history(
-                    channel_id,
-                    cursor=cursor,
-                )
-            except APICallError as e:
-                await report(bot, exception=e)
-                raise RuntimeError from e
-
-            history = resp.body
-            if not history["ok"]:
-                await report(
-                    bot,
-                    exception=APICallError(
-                        method="conversations.history",
-                        headers={},
-                        data=history,
-                    ),
-                )
-                raise RuntimeError
-
-            cursor = (
-                history["response_metadata"]["next_cursor"]
-                if "response_metadata" in history
-                else None
-            )
-
-            messages = simplify_history_result(history["messages"])
-            while messages:
-                message = messages.pop(0)
-                reply_count = message["reply_count"]
-                if reply_count:
-                    try:
-                        r = await bot.api.conversations.replies(
-                            channel_id,
-                            ts=message["ts"],
-                        )
-                    except APICallError as e:
-                        await report(bot, exception=e)
-                    else:
-                        messages += simplify_history_result(
-                            r.body.get("messages", [])[1:],
-                        )
-                collected.add((channel_id, message["ts"]))
-            if cursor is None:
-                break
+        async with aclosing(pages):
+            while True:
+                try:
+                    resp = await anext(pages, None)
+                except APICallError as e:
+                    await report(bot, exception=e)
+                    raise RuntimeError from e
+                if resp is None:
+                    break
+
+                history = resp.body
+                if not history["ok"]:
+                    await report(
+                        bot,
+                        exception=APICallError(
+                            method="conversations.history",
+                            headers={},
+                            data=history,
+                        ),
+                    )
+                    raise RuntimeError
+
+                messages = simplify_history_result(history["messages"])
+                while messages:
+                    message = messages.pop(0)
+                    reply_count = message["reply_count"]
+                    if reply_count:
+                        try:
+                            messages += await get_replies(
+                                bot,
+                                channel_id,
+                                message["ts"],
+                            )
+                        except APICallError as e:
+                            await report(bot, exception=e)
+                    collected.add((channel_id, message["ts"]))
     finally:
         if collected:
             await sess.execute(
@@ -186,6 +175,24 @@ async def collect_history_from_channel(
     return len(collected)
 
 
+async def get_replies(bot, channel_id: ChannelID, ts: str) -> list[dict]:
+    """Get all replies of thread except its parent message."""
+
+    replies: list[dict] = []
+    async with aclosing(
+        bot.api.conversations.iter_replies(channel_id, ts=ts),
+    ) as pages:
+        async for resp in pages:
+            replies += simplify_history_result(
+                [
+                    row
+                    for row in resp.body.get("messages", [])
+                    if row["ts"] != ts
+                ],
+            )
+    return replies
+
+
 def simplify_history_result(rows: list[dict]) -> list[dict]:
     return [
         {
@@ -6,7 +6,7 @@ from ....event import Message
 from .models import EventLog
 
 
-@box.on(Message, subtype="*")
+@box.on(Message, subtype="*", bookkeeping=True)
 async def make_log(bot, event: Message, sess: AsyncSession):
     channels = bot.config.CHANNELS.get("auto_cleanup_targets", [])
 
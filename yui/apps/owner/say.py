@@ -40,8 +40,13 @@ async def say(
             if channel:
                 target = channel
             elif user:
-                resp = await bot.api.conversations.open(users=[user])
-                target = resp.body["channel"]["id"]
+                dm_channel = await bot.get_conversation_directory().open_dm(
+                    user,
+                )
+                if dm_channel is None:
+                    text = "DM 채널을 열지 못했어요!"
+                else:
+                    target = dm_channel
     else:
         text = f"<@{event.user}> 이 명령어는 아빠만 사용할 수 있어요!"
 
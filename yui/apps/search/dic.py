@@ -5,6 +5,7 @@ import aiohttp
 from ...bot import Bot
 from ...box import box
 from ...command import argument
+from ...command import concurrency
 from ...command import option
 from ...event import Message
 from ...transform import choice
@@ -79,6 +80,7 @@ def parse(html: str) -> tuple[str | None, list[Attachment]]:
 
 
 @box.command("dic", ["사전"])
+@concurrency(2, key="dic")
 @option(
     "--category",
     "-c",
@@ -7,9 +7,11 @@ from rapidfuzz import fuzz
 from ...bot import Bot
 from ...box import box
 from ...command import argument
+from ...command import concurrency
+from ...command import requires
 from ...event import Message
-from ...event import YuiSystemStart
 from ...utils.html import get_root
+from ...warmup import WARMING_UP_MESSAGE
 
 logger = logging.getLogger(__name__)
 
@@ -144,11 +146,19 @@ async def fetch_all_ref(bot):
     await asyncio.wait(tasks)
 
 
-@box.on(YuiSystemStart)
-async def on_start(bot):
-    logger.info("on_start ref")
-    await fetch_all_ref(bot)
-    return True
+@box.warmup("ref_css", cached=["REF_CSS"])
+async def warm_up_css(bot):
+    await fetch_css_ref(bot)
+
+
+@box.warmup("ref_html", cached=["REF_HTML"])
+async def warm_up_html(bot):
+    await fetch_html_ref(bot)
+
+
+@box.warmup("ref_python", cached=["REF_PYTHON"])
+async def warm_up_python(bot):
+    await fetch_python_ref(bot)
 
 
 @box.cron("0 3 * * *")
@@ -158,6 +168,8 @@ async def refresh(bot):
 
 
 @box.command("html", ["htm"])
+@concurrency(2, key="ref")
+@requires("ref_html")
 @argument("keyword", nargs=-1, concat=True, count_error="키워드를 입력해주세요")
 async def html(bot, event: Message, keyword: str):
     """
@@ -171,7 +183,7 @@ async def html(bot, event: Message, keyword: str):
     if data is None:
         await bot.say(
             event.channel,
-            "아직 레퍼런스 관련 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!",
+            WARMING_UP_MESSAGE,
         )
         return
 
@@ -184,6 +196,8 @@ async def html(bot, event: Message, keyword: str):
 
 
 @box.command("css")
+@concurrency(2, key="ref")
+@requires("ref_css")
 @argument("keyword", nargs=-1, concat=True, count_error="키워드를 입력해주세요")
 async def css(bot, event: Message, keyword: str):
     """
@@ -197,7 +211,7 @@ async def css(bot, event: Message, keyword: str):
     if data is None:
         await bot.say(
             event.channel,
-            "아직 레퍼런스 관련 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!",
+            WARMING_UP_MESSAGE,
         )
         return
 
@@ -210,6 +224,8 @@ async def css(bot, event: Message, keyword: str):
 
 
 @box.command("python", ["py"])
+@concurrency(2, key="ref")
+@requires("ref_python")
 @argument("keyword", nargs=-1, concat=True, count_error="키워드를 입력해주세요")
 async def python(bot, event: Message, keyword: str):
     """
@@ -223,7 +239,7 @@ async def python(bot, event: Message, keyword: str):
     if data is None:
         await bot.say(
             event.channel,
-            "아직 레퍼런스 관련 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!",
+            WARMING_UP_MESSAGE,
         )
         return
 
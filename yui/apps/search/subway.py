@@ -12,14 +12,16 @@ from more_itertools import ilen
 
 from ...box import box
 from ...command import argument
+from ...command import concurrency
 from ...command import option
+from ...command import requires
 from ...event import Message
-from ...event import YuiSystemStart
 from ...transform import choice
 from ...utils import json
 from ...utils.datetime import now
 from ...utils.fuzz import ratio
 from ...utils.http import USER_AGENT
+from ...warmup import WARMING_UP_MESSAGE
 
 TEMPLATE: Final = (
     "{start_station}에서 {line_name} {direction}행 열차에 탑승해서 {station_count} 정거장을 지나"
@@ -152,11 +154,20 @@ async def get_shortest_route(
         raise ValueError from e
 
 
-@box.on(YuiSystemStart)
-async def on_start(bot):
-    logger.info("on_start subway")
-    await fetch_all_station_db(bot)
-    return True
+@box.warmup(
+    "subway",
+    cached=[
+        f"SUBWAY_{service_region}_{api_version}"
+        for service_region, api_version in REGION_TABLE.values()
+    ],
+)
+async def warm_up(bot):
+    await asyncio.gather(
+        *(
+            fetch_station_db(bot, service_region, api_version)
+            for service_region, api_version in REGION_TABLE.values()
+        ),
+    )
 
 
 @box.cron("0 3 * * *")
@@ -248,7 +259,7 @@ async def body(bot, event: Message, region: str, start: str, end: str):
     if data is None:
         await bot.say(
             event.channel,
-            "아직 지하철 관련 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!",
+            WARMING_UP_MESSAGE,
         )
         return
 
@@ -281,6 +292,8 @@ async def body(bot, event: Message, region: str, start: str, end: str):
 
 
 @box.command("지하철", ["전철", "subway"])
+@concurrency(2, key="subway", shared=True)
+@requires("subway")
 @option(
     "--region",
     "-r",
@@ -306,6 +319,8 @@ async def subway(bot, event: Message, region: str, start: str, end: str):
 
 
 @box.command("부산지하철", ["부산전철"])
+@concurrency(2, key="subway", shared=True)
+@requires("subway")
 @argument("start", count_error="출발역을 입력해주세요")
 @argument("end", count_error="도착역을 입력해주세요")
 async def busan_subway(bot, event: Message, start: str, end: str):
@@ -321,6 +336,8 @@ async def busan_subway(bot, event: Message, start: str, end: str):
 
 
 @box.command("대구지하철", ["대구전철"])
+@concurrency(2, key="subway", shared=True)
+@requires("subway")
 @argument("start", count_error="출발역을 입력해주세요")
 @argument("end", count_error="도착역을 입력해주세요")
 async def daegu_subway(bot, event: Message, start: str, end: str):
@@ -336,6 +353,8 @@ async def daegu_subway(bot, event: Message, start: str, end: str):
 
 
 @box.command("광주지하철", ["광주전철"])
+@concurrency(2, key="subway", shared=True)
+@requires("subway")
 @argument("start", count_error="출발역을 입력해주세요")
 @argument("end", count_error="도착역을 입력해주세요")
 async def gwangju_subway(bot, event: Message, start: str, end: str):
@@ -351,6 +370,8 @@ async def gwangju_subway(bot, event: Message, start: str, end: str):
 
 
 @box.command("대전지하철", ["대전전철"])
+@concurrency(2, key="subway", shared=True)
+@requires("subway")
 @argument("start", count_error="출발역을 입력해주세요")
 @argument("end", count_error="도착역을 입력해주세요")
 async def daejeon_subway(bot, event: Message, start: str, end: str):
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import Counter
+from collections import deque
+from typing import Any
+from typing import Final
+from typing import Literal
+from typing import TYPE_CHECKING
+
+from attrs import define
+from attrs import field
+
+if TYPE_CHECKING:
+    from .box.apps.base import BaseApp
+    from .event import Event
+
+type Overflow = Literal["drop_new", "drop_oldest"]
+
+OVERFLOWS: Final = frozenset({"drop_new", "drop_oldest"})
+
+logger = logging.getLogger(__name__)
+
+
+def get_channel_id(event: Event) -> str | None:
+    """Get id of channel of given event.
+
+    ``channel`` of some events like ``channel_created`` is a channel object
+    instead of its id.
+
+    """
+
+    channel = getattr(event, "channel", None)
+    if isinstance(channel, dict):
+        channel = channel.get("id")
+    return channel if isinstance(channel, str) else None
+
+
+@define
+class Delivery:
+    """Event and apps to run for it.
+
+    ``followers`` are bookkeeping apps which come after some of ``apps`` in
+    order of box. Each of them is paired with the number of ``apps`` which
+    must not stop the chain before it runs.
+
+    """
+
+    event: Event
+    apps: list[BaseApp]
+    followers: list[tuple[int, BaseApp]] = field(factory=list)
+    enqueued_at: float = field(factory=time.monotonic)
+
+
+class EventBacklog:
+    """Bounded backlog of one lane of workers, sharded by channel.
+
+    When the backlog holds ``shed_limit`` deliveries or more, new deliveries
+    are shed except for a ``sample_rate`` fraction of them. When it holds
+    ``max_size`` deliveries, ``overflow`` policy decides whether the new one
+    (``drop_new``) or the oldest one of the longest shard (``drop_oldest``)
+    is dropped. Zero means no limit.
+
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        max_size: int = 0,
+        shed_limit: int = 0,
+        sample_rate: float = 0.0,
+        overflow: Overflow = "drop_new",
+    ) -> None:
+        if overflow not in OVERFLOWS:
+            error = f"unknown overflow policy: {overflow!r}"
+            raise ValueError(error)
+
+        self.workers = max(1, workers)
+        self.shards: list[asyncio.Queue[Delivery]] = [
+            asyncio.Queue() for _ in range(self.workers)
+        ]
+        self.max_size = max_size
+        self.shed_limit = shed_limit
+        self.sample_rate = sample_rate
+        self.overflow = overflow
+        self.shed = 0
+        self.sampled = 0
+        self.dropped = 0
+        self.peak = 0
+        self.handled = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def size(self) -> int:
+        return sum(shard.qsize() for shard in self.shards)
+
+    def put(self, index: int, delivery: Delivery) -> bool:
+        """Put delivery into shard. Return False if it was shed or dropped."""
+
+        size = self.size
+        if self.shed_limit and size >= self.shed_limit:
+            if random.random() >= self.sample_rate:
+                self.shed += 1
+                logger.debug("shed %s", delivery.event)
+                return False
+            self.sampled += 1
+
+        if self.max_size and size >= self.max_size:
+            self.dropped += 1
+            if self.overflow == "drop_new":
+                logger.warning("backlog is full. drop %s", delivery.event)
+                return False
+            oldest = self.pop_oldest()
+            logger.warning("backlog is full. drop %s", oldest.event)
+            size -= 1
+
+        self.push(index, delivery)
+        self.peak = max(self.peak, size + 1)
+        return True
+
+    def push(self, index: int, delivery: Delivery):
+        self.shards[index].put_nowait(delivery)
+
+    def pop_oldest(self) -> Delivery:
+        """Pop the oldest delivery of the longest shard."""
+
+        longest = max(self.shards, key=asyncio.Queue.qsize)
+        return longest.get_nowait()
+
+    async def take(self, index: int) -> Delivery:
+        return await self.shards[index].get()
+
+    async def get(self, index: int) -> Delivery:
+        """Get next delivery of shard and record its queue latency."""
+
+        delivery = await self.take(index)
+        latency = time.monotonic() - delivery.enqueued_at
+        self.handled += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        return delivery
+
+    def done(self, delivery: Delivery):
+        """Mark delivery taken by :meth:`get` as handled."""
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "size": self.size,
+            "peak": self.peak,
+            "shed": self.shed,
+            "sampled": self.sampled,
+            "dropped": self.dropped,
+            "handled": self.handled,
+            "avg_latency": (
+                self.total_latency / self.handled if self.handled else 0.0
+            ),
+            "max_latency": self.max_latency,
+        }
+
+
+class FairBacklog(EventBacklog):
+    """Backlog which shares workers fairly between users and channels.
+
+    Deliveries wait in a queue per user and workers take them from users in
+    round-robin order. A delivery is held back while ``user_limit``
+    deliveries of the same user or ``channel_limit`` deliveries in the same
+    channel are running. Apps can override these limits with their own
+    ``user_limit`` and ``channel_limit``. Zero means no limit. A
+    ``channel_limit`` of 1 runs deliveries in the same channel one by one,
+    so they never overlap. Deliveries of one user start in the order they
+    came, but as users take turns, deliveries of different users in the
+    same channel may start in another order.
+
+    Workers are not sharded, so ``index`` arguments are ignored.
+
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        user_limit: int = 0,
+        channel_limit: int = 0,
+        **kwargs,
+    ) -> None:
+        super().__init__(workers, **kwargs)
+        self.user_limit = user_limit
+        self.channel_limit = channel_limit
+        self.queues: dict[str, deque[Delivery]] = {}
+        self.users: deque[str] = deque()
+        self.running_users: Counter[str] = Counter()
+        self.running_channels: Counter[str] = Counter()
+        self.changed = asyncio.Event()
+        self.throttled = 0
+
+    @property
+    def size(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    def get_user(self, delivery: Delivery) -> str:
+        return getattr(delivery.event, "user", None) or ""
+
+    def get_channel(self, delivery: Delivery) -> str:
+        return get_channel_id(delivery.event) or ""
+
+    def get_limits(self, delivery: Delivery) -> tuple[int, int]:
+        """Get limits per user and per channel of given delivery."""
+
+        user_limit = self.user_limit
+        channel_limit = self.channel_limit
+        for app in delivery.apps:
+            if app.user_limit is not None:
+                user_limit = app.user_limit
+            if app.channel_limit is not None:
+                channel_limit = app.channel_limit
+        return user_limit, channel_limit
+
+    def is_allowed(self, delivery: Delivery) -> bool:
+        user_limit, channel_limit = self.get_limits(delivery)
+        user_running = self.running_users[self.get_user(delivery)]
+        channel_running = self.running_channels[self.get_channel(delivery)]
+        if user_limit and user_running >= user_limit:
+            return False
+        return not (channel_limit and channel_running >= channel_limit)
+
+    def push(self, index: int, delivery: Delivery):
+        user = self.get_user(delivery)
+        if user not in self.queues:
+            self.queues[user] = deque()
+            self.users.append(user)
+        self.queues[user].append(delivery)
+        self.changed.set()
+
+    def remove_user(self, user: str):
+        del self.queues[user]
+        self.users.remove(user)
+
+    def pop_oldest(self) -> Delivery:
+        """Pop the oldest delivery of the user who has most deliveries."""
+
+        user = max(self.users, key=lambda x: len(self.queues[x]))
+        delivery = self.queues[user].popleft()
+        if not self.queues[user]:
+            self.remove_user(user)
+        return delivery
+
+    def pick(self) -> Delivery | None:
+        """Pick next delivery of the first user who is not over limits."""
+
+        for turn, user in enumerate(self.users):
+            delivery = self.queues[user][0]
+            if self.is_allowed(delivery):
+                self.users.rotate(-turn - 1)
+                break
+        else:
+            if self.users:
+                self.throttled += 1
+            return None
+
+        self.queues[user].popleft()
+        if not self.queues[user]:
+            self.remove_user(user)
+        self.running_users[user] += 1
+        self.running_channels[self.get_channel(delivery)] += 1
+        return delivery
+
+    async def take(self, index: int) -> Delivery:
+        while (delivery := self.pick()) is None:
+            self.changed.clear()
+            await self.changed.wait()
+        return delivery
+
+    def done(self, delivery: Delivery):
+        user = self.get_user(delivery)
+        channel = self.get_channel(delivery)
+        self.running_users[user] -= 1
+        if self.running_users[user] <= 0:
+            del self.running_users[user]
+        self.running_channels[channel] -= 1
+        if self.running_channels[channel] <= 0:
+            del self.running_channels[channel]
+        self.changed.set()
+
+    def stats(self) -> dict[str, Any]:
+        return super().stats() | {
+            "users": len(self.queues),
+            "running": self.running_users.total(),
+            "throttled": self.throttled,
+        }
@@ -1,61 +1,81 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import functools
 import importlib
 import logging
 import logging.config
-import multiprocessing
-import random
-import string
-from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
-from datetime import timedelta
+import operator
+import time
+import zlib
 from typing import Any
 from typing import Final
+from typing import Literal
 from typing import ParamSpec
 from typing import TYPE_CHECKING
 from typing import TypeVar
 
-import aiocron
 import aiohttp
 from aiohttp.client_exceptions import ClientError
-from dateutil.tz import tzoffset
 from sqlalchemy.ext.asyncio import close_all_sessions
 from valkey.asyncio.client import Valkey
+from valkey.exceptions import ValkeyError
 
 from .api import SlackAPI
+from .api.directory import ConversationDirectory
+from .api.directory import UserDirectory
+from .api.outbox import Outbox
+from .backlog import Delivery
+from .backlog import EventBacklog
+from .backlog import FairBacklog
+from .backlog import get_channel_id
 from .box import Box
 from .box import box
 from .cache import Cache
+from .command.limits import LIMITS
+from .config import DEFAULT
+from .dedup import Deduplicator
+from .dedup import MemoryDedupStore
+from .dedup import ValkeyDedupStore
+from .event import Message
 from .event import create_event
 from .log import GetLoggerMixin
 from .orm import Base
 from .orm import create_database_engine
 from .orm import sessionmaker
+from .pool import ProcessPool
+from .pool import ThreadPool
+from .scheduler import CronScheduler
+from .supervisor import Supervisor
 from .types.slack.response import APIResponse
-from .types.user import User
 from .utils import json
-from .utils.datetime import now
 from .utils.report import report
+from .warmup import Readiness
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from aiohttp.client_ws import ClientWebSocketResponse
 
+    from .box.apps.base import BaseApp
     from .box.tasks import CronTask
+    from .box.tasks import WarmupTask
     from .config import Config
+    from .dedup import DedupStore
+    from .event import Event
     from .types.base import ChannelID
     from .types.base import UserID
+    from .types.user import User
 
 
 P = ParamSpec("P")
 R = TypeVar("R")
-UTC9 = tzoffset("UTC9", timedelta(hours=9))
+
+type RawEvent = tuple[str | None, dict[str, Any]]
+type Lane = Literal["system", "command", "passive", "bookkeeping"]
+
+LANES: Final[tuple[Lane, ...]] = ("system", "command", "passive", "bookkeeping")
+SHED_LANES: Final = frozenset({"passive", "bookkeeping"})
 
 FATAL_ERROR_CODES: Final = frozenset(
     {
@@ -85,6 +105,9 @@ RECONNECT_ERROR_CODES: Final = frozenset(
     },
 )
 
+RATELIMITED_RETRIES: Final = 3
+MAX_SOCKET_CONNECTIONS: Final = 10
+
 WS_CLOSE_TYPES: Final = frozenset(
     {
         aiohttp.WSMsgType.CLOSE,
@@ -118,6 +141,18 @@ class Bot(GetLoggerMixin):
     """Yui."""
 
     api: SlackAPI
+    api_session: aiohttp.ClientSession | None = None
+    process_pool: ProcessPool | None = None
+    thread_pool: ThreadPool | None = None
+    scheduler: CronScheduler | None = None
+    deduplicator: Deduplicator | None = None
+    supervisor: Supervisor | None = None
+    readiness: Readiness | None = None
+    import_times: dict[str, float] | None = None
+    lanes: dict[Lane, EventBacklog] | None = None
+    outbox: Outbox | None = None
+    user_directory: UserDirectory | None = None
+    conversation_directory: ConversationDirectory | None = None
     valkey_client: Valkey
     cache: Cache
 
@@ -144,19 +179,22 @@ class Bot(GetLoggerMixin):
         self.session_maker = sessionmaker(self.database_engine)
 
         logger.info("import apps")
+        self.import_times = {}
         for app_name in config.APPS:
             logger.debug("import apps: %s", app_name)
+            started = time.perf_counter()
             self._import_app(app_name)
+            self.import_times[app_name] = time.perf_counter() - started
+        self.report_import_times()
 
         self.config = config
         self.orm_base = orm_base or Base
         self.box = using_box or box
         self.queue: asyncio.Queue = asyncio.Queue()
+        self.raw_events: asyncio.Queue[RawEvent] = asyncio.Queue()
         self.api = SlackAPI(self)
-        self.restart = False
+        self.restart_event = asyncio.Event()
         self.is_ready = asyncio.Event()
-        self.method_last_call: defaultdict[str, datetime] = defaultdict(now)
-        self.method_queue: defaultdict[str, list] = defaultdict(list)
 
         self.config.check(
             self.box.config_required,
@@ -173,117 +211,373 @@ class Bot(GetLoggerMixin):
         await asyncio.shield(asyncio.create_task(self.dispose()))
 
     async def dispose(self):
+        if self.api_session is not None:
+            await self.api_session.close()
+            self.api_session = None
+        if self.process_pool is not None:
+            self.process_pool.close()
+            self.process_pool = None
+        if self.thread_pool is not None:
+            self.thread_pool.close()
+            self.thread_pool = None
+        if self.scheduler is not None:
+            self.scheduler.stop()
+            self.scheduler = None
         await close_all_sessions()
         await self.database_engine.dispose()
 
+    def create_api_session(self) -> aiohttp.ClientSession:
+        """Create keep-alive session for Slack Web API."""
+
+        options = DEFAULT["SLACK_API"] | self.config.SLACK_API
+        connector = aiohttp.TCPConnector(
+            limit=options["LIMIT"],
+            limit_per_host=options["LIMIT_PER_HOST"],
+            ttl_dns_cache=options["DNS_CACHE_TTL"],
+            keepalive_timeout=options["KEEPALIVE_TIMEOUT"],
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=options["TIMEOUT"],
+            connect=options["CONNECT_TIMEOUT"],
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    def get_api_session(self) -> aiohttp.ClientSession:
+        """Get shared session for Slack Web API."""
+
+        if self.api_session is None or self.api_session.closed:
+            self.api_session = self.create_api_session()
+        return self.api_session
+
+    def get_process_pool(self) -> ProcessPool:
+        """Get shared pool of worker processes."""
+
+        if self.process_pool is None:
+            options = DEFAULT["PROCESS_POOL"] | self.config.PROCESS_POOL
+            self.process_pool = ProcessPool(
+                options["SIZE"],
+                max_tasks=options["MAX_TASKS"],
+                max_memory=options["MAX_MEMORY"],
+                preload=options["PRELOAD"],
+            )
+        return self.process_pool
+
+    def get_thread_pool(self) -> ThreadPool:
+        """Get shared pool of threads."""
+
+        if self.thread_pool is None:
+            options = DEFAULT["THREAD_POOL"] | self.config.THREAD_POOL
+            self.thread_pool = ThreadPool(
+                options["SIZE"],
+                queue_size=options["QUEUE_SIZE"],
+            )
+        return self.thread_pool
+
+    def get_deduplicator(self) -> Deduplicator:
+        """Get de-duplication layer of received events."""
+
+        if self.deduplicator is None:
+            options = DEFAULT["DEDUP"] | self.config.DEDUP
+            store: DedupStore
+            if options["BACKEND"] == "valkey":
+                store = ValkeyDedupStore(self, options["TTL"])
+            else:
+                store = MemoryDedupStore(options["SIZE"], options["TTL"])
+            self.deduplicator = Deduplicator(store)
+        return self.deduplicator
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get runtime statistics of bot components."""
+
+        stats: dict[str, dict[str, Any]] = {
+            "rate_limit": self.api.rate_limiter.rates(),
+        }
+        if self.process_pool is not None:
+            stats["process_pool"] = self.process_pool.stats()
+        if self.thread_pool is not None:
+            stats["thread_pool"] = self.thread_pool.stats()
+        if self.scheduler is not None:
+            stats["cron"] = self.scheduler.stats()
+        if self.deduplicator is not None:
+            stats["dedup"] = self.deduplicator.stats()
+        if self.import_times:
+            stats["imports"] = self.import_times
+        if self.supervisor is not None:
+            stats["supervisor"] = self.supervisor.stats()
+        if self.readiness is not None:
+            stats["warmup"] = self.readiness.stats()
+        if self.lanes is not None:
+            stats["event_queue"] = {
+                lane: backlog.stats() for lane, backlog in self.lanes.items()
+            }
+        if self.outbox is not None:
+            stats["outbox"] = self.outbox.stats()
+        if self.user_directory is not None:
+            stats["users"] = self.user_directory.stats()
+        if self.conversation_directory is not None:
+            stats["conversations"] = self.conversation_directory.stats()
+        if LIMITS:
+            stats["concurrency"] = {
+                key: limit.stats() for key, limit in LIMITS.items()
+            }
+        return stats
+
+    async def log_stats(self, interval: float):
+        """Log runtime statistics of bot components periodically."""
+
+        logger = self.get_logger("log_stats")
+
+        while True:
+            await asyncio.sleep(interval)
+            for name, values in self.get_stats().items():
+                logger.info("%s: %r", name, values)
+
     def _import_app(self, app_name: str):  # pragma: no cover
         importlib.import_module(app_name)
 
+    def report_import_times(self, limit: int = 5):
+        """Log total import time of apps and the slowest ones."""
+
+        logger = self.get_logger("report_import_times")
+
+        import_times = self.import_times or {}
+        logger.info(
+            "imported %d apps in %.3fs",
+            len(import_times),
+            sum(import_times.values()),
+        )
+        slowest = sorted(
+            import_times.items(),
+            key=operator.itemgetter(1),
+            reverse=True,
+        )
+        for app_name, elapsed in slowest[:limit]:
+            logger.info("import %s: %.3fs", app_name, elapsed)
+
     async def register_cron_tasks(self):
         """Register cronjob to bot from box."""
-        for cron in self.box.cron_tasks:
-            self._register_cron_task(cron)
 
-    def _register_cron_task(self, cron: CronTask):
-        logger = self.get_logger("_register_cron_task")
+        options = DEFAULT["CRON"] | self.config.CRON
+        self.scheduler = CronScheduler(
+            self,
+            self.box.cron_tasks,
+            jitter=options["JITTER"],
+            grace=options["CATCH_UP_GRACE"],
+        )
+
+    async def run_cron_task(self, cron: CronTask) -> bool:
+        """Run cron task once and report failure."""
 
-        logger.info("register %s", cron)
-        is_runnable = [1]
+        log = logging.getLogger(repr(cron.handler))
         func_params = cron.handler.params
         kw: dict[str, Any] = {}
         if "bot" in func_params:
             kw["bot"] = self
+        if "sess" in func_params:
+            kw["sess"] = self.session_maker()
 
-        @aiocron.crontab(
-            cron.spec,
-            *cron.args,
-            **cron.kwargs,
-            tz=UTC9,
-            loop=asyncio.get_running_loop(),
-        )
-        async def task():
-            log = logging.getLogger(repr(cron.handler))
-
-            if not self.is_ready.is_set() or not self.cache.is_ready.is_set():
-                log.debug("cron condition hit but not ready")
-                return
-            log.debug("cron condition hit")
-            if not is_runnable:
-                log.debug("cron skip by lock")
-                return
-
-            is_runnable.pop()
-
-            sess = self.session_maker()
-            if "sess" in func_params:
-                kw["sess"] = sess
-
-            log.debug("cron run")
-            try:
-                await cron.handler(**kw)
-            except APICallError as e:
-                await report(self, exception=e)
-            except Exception:
-                await report(self)
-                raise
-            finally:
-                await sess.close()
-                is_runnable.append(1)
-            log.debug("cron end")
-
-        cron.start = task.start
-        cron.stop = task.stop
+        log.debug("cron run")
+        try:
+            await cron.handler(**kw)
+        except APICallError as e:
+            await report(self, exception=e)
+            return False
+        except Exception:
+            log.exception("cron failed")
+            await report(self)
+            return False
+        finally:
+            if "sess" in kw:
+                await kw["sess"].close()
+        log.debug("cron end")
+        return True
 
     async def run(self):
         """Run"""
 
         logger = self.get_logger("run")
 
+        self.get_api_session()
+        self.get_process_pool().start()
+        self.box.build_index()
+
         if self.config.REGISTER_CRONTAB:
             logger.info("register crontab")
             await self.register_cron_tasks()
 
         valkey_retries = 0
-
         while True:
-            self.valkey_client = Valkey.from_url(self.config.CACHE["URL"])
-            self.cache = Cache(
-                self.valkey_client,
-                self.config.CACHE.get("PREFIX", "YUI_"),
-            )
             try:
-                await self.cache.set("__test__", 1)
+                await self.connect_cache()
             except (
                 RuntimeError,
                 TimeoutError,
+                ValkeyError,
                 asyncio.CancelledError,
             ) as e:
                 logger.exception("fail to connect to valkey")
                 valkey_retries += 1
                 if valkey_retries < 3:
-                    await self.cache.close()
                     await asyncio.sleep(valkey_retries * 5)
                     continue
                 logger.fatal("can not connect to valkey. stop to run")
                 raise SystemExit from e
+            break
+
+        supervisor = self.get_supervisor()
+        try:
+            await supervisor.run()
+        finally:
+            if self.scheduler is not None:
+                self.scheduler.pause()
+            await self.cache.close()
+
+    def get_supervisor(self) -> Supervisor:
+        """Get supervisor of long-running components of bot."""
 
-            valkey_retries = 0
-            self.cache.is_ready.set()
+        if self.supervisor is not None:
+            return self.supervisor
 
-            tasks = [
-                asyncio.create_task(self.connect()),
-                asyncio.create_task(self.process()),
-            ]
-            tasks.extend(
-                asyncio.create_task(task.handler(bot=self))
-                for task in self.box.polling_tasks
+        options = DEFAULT["SUPERVISOR"] | self.config.SUPERVISOR
+        self.supervisor = Supervisor(
+            backoff=options["BACKOFF"],
+            max_backoff=options["MAX_BACKOFF"],
+            stable_after=options["STABLE_AFTER"],
+        )
+        self.supervisor.add("slack", self.connect)
+        self.supervisor.add("process", self.process)
+        self.supervisor.add("outbox", self.get_outbox().run)
+        self.supervisor.add("valkey", self.keep_cache)
+        if options["STATS_INTERVAL"] > 0:
+            self.supervisor.add(
+                "stats",
+                functools.partial(self.log_stats, options["STATS_INTERVAL"]),
             )
-            await asyncio.wait(
-                tasks,
-                return_when=asyncio.FIRST_EXCEPTION,
+        if self.scheduler is not None:
+            for job in self.scheduler.jobs:
+                self.supervisor.add(f"cron {job.name}", job.schedule)
+        for task in self.box.polling_tasks:
+            self.supervisor.add(
+                f"polling {task.handler!r}",
+                functools.partial(task.handler, bot=self),
+            )
+        for warmup in self.box.warmup_tasks:
+            self.supervisor.add(
+                f"warmup {warmup.dataset}",
+                functools.partial(self.warm_up, warmup),
+            )
+        return self.supervisor
+
+    def get_outbox(self) -> Outbox:
+        """Get queue of outgoing messages."""
+
+        if self.outbox is None:
+            options = DEFAULT["OUTBOX"] | self.config.OUTBOX
+            self.outbox = Outbox(
+                self.api.chat,
+                workers=options["WORKERS"],
+                max_length=options["MAX_LENGTH"],
+                max_attachments=options["MAX_ATTACHMENTS"],
+            )
+        return self.outbox
+
+    def get_user_directory(self) -> UserDirectory:
+        """Get cache of Slack users."""
+
+        if self.user_directory is None:
+            options = DEFAULT["USER_DIRECTORY"] | self.config.USER_DIRECTORY
+            self.user_directory = UserDirectory(
+                self,
+                ttl=options["TTL"],
+                mirror=options["MIRROR"],
             )
+        return self.user_directory
+
+    def get_conversation_directory(self) -> ConversationDirectory:
+        """Get cache of Slack conversations."""
+
+        if self.conversation_directory is None:
+            options = (
+                DEFAULT["CONVERSATION_DIRECTORY"]
+                | self.config.CONVERSATION_DIRECTORY
+            )
+            self.conversation_directory = ConversationDirectory(
+                self,
+                dm_ttl=options["DM_TTL"],
+            )
+        return self.conversation_directory
+
+    def get_readiness(self) -> Readiness:
+        """Get readiness state of datasets of warm-up tasks."""
+
+        if self.readiness is None:
+            self.readiness = Readiness(
+                task.dataset for task in self.box.warmup_tasks
+            )
+        return self.readiness
+
+    async def warm_up(self, task: WarmupTask):
+        """Run warm-up task once and update readiness of its dataset.
+
+        Dataset whose cached keys exist already is ready before the task
+        refreshes it.
+
+        """
 
+        readiness = self.get_readiness()
+        if (
+            task.cached
+            and not readiness.is_ready([task.dataset])
+            and await self.cache.exists(*task.cached)
+        ):
+            readiness.restore(task.dataset)
+        readiness.start(task.dataset)
+        try:
+            await task.handler(bot=self)
+        except Exception as e:
+            readiness.fail(task.dataset, e)
+            raise
+        readiness.finish(task.dataset)
+
+    async def connect_cache(self):
+        """Connect to Valkey and resume cron tasks."""
+
+        self.valkey_client = Valkey.from_url(self.config.CACHE["URL"])
+        self.cache = Cache(
+            self.valkey_client,
+            self.config.CACHE.get("PREFIX", "YUI_"),
+        )
+        try:
+            await self.cache.set("__test__", 1)
+        except BaseException:
+            await self.cache.close()
+            raise
+
+        self.cache.is_ready.set()
+        if self.scheduler is not None:
+            self.scheduler.resume()
+
+    async def keep_cache(self):
+        """Check connection to Valkey and reconnect if it is lost.
+
+        Cron tasks are paused while the connection is lost.
+
+        """
+
+        if not self.cache.is_ready.is_set():
             await self.cache.close()
+            await self.connect_cache()
+
+        options = DEFAULT["CACHE"] | self.config.CACHE
+        try:
+            while True:
+                await asyncio.sleep(options["HEALTH_CHECK_INTERVAL"])
+                await self.cache.ping()
+        except (RuntimeError, TimeoutError, ValkeyError):
+            self.cache.is_ready.clear()
+            if self.scheduler is not None:
+                self.scheduler.pause()
+            raise
 
     async def run_in_other_process(
         self,
@@ -291,14 +585,13 @@ class Bot(GetLoggerMixin):
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> R:
-        loop = asyncio.get_running_loop()
-        with ProcessPoolExecutor(
-            mp_context=multiprocessing.get_context("spawn"),
-        ) as executor:
-            return await loop.run_in_executor(
-                executor=executor,
-                func=functools.partial(f, *args, **kwargs),
-            )
+        """Run CPU-bound function on shared worker process pool.
+
+        ``f``, its arguments and its result must be picklable.
+
+        """
+
+        return await self.get_process_pool().run(f, *args, **kwargs)
 
     async def run_in_other_thread(
         self,
@@ -306,28 +599,16 @@ class Bot(GetLoggerMixin):
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> R:
-        loop = asyncio.get_running_loop()
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(
-                executor=executor,
-                func=functools.partial(f, *args, **kwargs),
-            )
+        """Run blocking function on shared thread pool.
+
+        Use this for blocking work like HTML parsing to keep event loop free.
 
-    async def throttle(self, method: str):
-        name = "".join(random.choice(string.printable) for _ in range(16))
-        q = self.method_queue[method]
-        q.append(name)
-        # FIXME: https://docs.astral.sh/ruff/rules/async-busy-wait/
-        while q and q[0] != name:  # noqa: ASYNC110
-            await asyncio.sleep(0.05)
-
-        method_dt = self.method_last_call[method]
-        tier_min = self.api.throttle_interval[method]
-        if (gap := now() - method_dt) < tier_min:
-            await asyncio.sleep(delay=gap.microseconds / 1_000_000)
-        self.method_last_call[method] = now()
-        with contextlib.suppress(KeyError):
-            q.pop(0)
+        """
+
+        return await self.get_thread_pool().run(f, *args, **kwargs)
+
+    async def throttle(self, method: str, channel: str | None = None):
+        await self.api.rate_limiter.acquire(method, channel)
 
     async def call(
         self,
@@ -339,9 +620,40 @@ class Bot(GetLoggerMixin):
         json_mode: bool = False,
     ) -> APIResponse:
         """Call API methods."""
-        if throttle_check:
-            await self.throttle(method)
+        channel = data.get("channel") if data else None
+        limiter = self.api.rate_limiter
+
+        for retries in range(RATELIMITED_RETRIES + 1):
+            if throttle_check:
+                await self.throttle(
+                    method,
+                    channel if isinstance(channel, str) else None,
+                )
+
+            resp = await self._post(
+                method,
+                data,
+                token=token,
+                json_mode=json_mode,
+            )
+            if not resp.is_ratelimited():
+                limiter.relax(method)
+                return resp
+
+            retry_after = resp.get_retry_after()
+            limiter.penalize(method, retry_after)
+            if retries < RATELIMITED_RETRIES and not throttle_check:
+                await asyncio.sleep(retry_after)
+        return resp
 
+    async def _post(
+        self,
+        method: str,
+        data: dict[str, Any] | None,
+        *,
+        token: str | None,
+        json_mode: bool,
+    ) -> APIResponse:
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
         }
@@ -356,21 +668,20 @@ class Bot(GetLoggerMixin):
             payload = aiohttp.FormData(data or {})
             payload.add_field("token", token or self.config.BOT_TOKEN)
 
+        session = self.get_api_session()
         try:
-            async with (
-                aiohttp.ClientSession(headers=headers) as session,
-                session.post(
-                    f"https://slack.com/api/{method}",
-                    data=payload,
-                ) as response,
-            ):
+            async with session.post(
+                f"https://slack.com/api/{method}",
+                data=payload,
+                headers=headers,
+            ) as response:
                 result = await response.json(loads=json.loads)
                 return APIResponse(
                     body=result,
                     status=response.status,
                     headers=response.headers,
                 )
-        except (asyncio.CancelledError, ClientError) as e:
+        except (asyncio.CancelledError, ClientError, TimeoutError) as e:
             raise APICallError(
                 method=method,
                 headers=headers,
@@ -394,39 +705,216 @@ class Bot(GetLoggerMixin):
             **kwargs,
         )
 
-    async def process(self):
-        """Process messages."""
+    async def process(self) -> None:
+        """Process messages.
+
+        Events are dispatched into priority lanes (see :data:`LANES`) and each
+        lane has its own workers, so commands never wait behind passive
+        listeners or bookkeeping. In each lane, events are sharded by channel,
+        so events in the same channel keep their order while other channels
+        proceed. Backlog of lanes is bounded by ``EVENT_QUEUE`` config.
+
+        If ``FAIR_SHARE`` is enabled, command lane is not sharded. Its workers
+        are shared fairly between users instead, and ``PER_CHANNEL`` limits
+        how many commands run at once in one channel. The default limit is 1,
+        so commands in the same channel never overlap. Commands of one user
+        run in the order they came, but commands of different users in the
+        same channel may run in another order as users take turns.
+
+        """
 
         logger = self.get_logger("process")
 
-        async def handle(handler, event):
+        lanes = self.get_lanes()
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self.build_events())
+            for lane in lanes.values():
+                for index in range(lane.workers):
+                    tg.create_task(self.process_shard(lane, index))
+
+            while True:
+                event = await self.queue.get()
+
+                logger.info(event)
+
+                self.dispatch(event)
+
+    def get_lanes(self) -> dict[Lane, EventBacklog]:
+        """Get backlogs of event worker lanes."""
+
+        if self.lanes is not None:
+            return self.lanes
+
+        workers = DEFAULT["EVENT_LANES"] | self.config.EVENT_LANES
+        options = DEFAULT["EVENT_QUEUE"] | self.config.EVENT_QUEUE
+        fair_share = DEFAULT["FAIR_SHARE"] | self.config.FAIR_SHARE
+        self.lanes = {}
+        for lane in LANES:
+            kwargs: dict[str, Any] = {
+                "max_size": options["MAX_SIZE"],
+                "shed_limit": (
+                    options["PASSIVE_LIMIT"] if lane in SHED_LANES else 0
+                ),
+                "sample_rate": options["PASSIVE_SAMPLE_RATE"],
+                "overflow": options["OVERFLOW"],
+            }
+            if lane == "command" and fair_share["ENABLED"]:
+                self.lanes[lane] = FairBacklog(
+                    workers[lane.upper()],
+                    user_limit=fair_share["PER_USER"],
+                    channel_limit=fair_share["PER_CHANNEL"],
+                    **kwargs,
+                )
+            else:
+                self.lanes[lane] = EventBacklog(workers[lane.upper()], **kwargs)
+        return self.lanes
+
+    def get_lane(self, event: Event) -> Lane:
+        if not isinstance(event, Message):
+            return "system"
+        if self.box.is_command(event, self.config.PREFIX):
+            return "command"
+        return "passive"
+
+    def dispatch(self, event: Event):
+        """Put event into lanes of apps which can handle it.
+
+        Bookkeeping apps which come before every other app run at once in
+        bookkeeping lane. Bookkeeping apps after other apps follow them, and
+        run only if none of the apps before them stops the chain.
+
+        """
+
+        main: list[BaseApp] = []
+        bookkeeping: list[BaseApp] = []
+        followers: list[tuple[int, BaseApp]] = []
+        for app in self.box.get_apps(event, self.config.PREFIX):
+            if not app.bookkeeping:
+                main.append(app)
+            elif main:
+                followers.append((len(main), app))
+            else:
+                bookkeeping.append(app)
+
+        if main:
+            self.enqueue(
+                self.get_lane(event),
+                Delivery(event, main, followers),
+            )
+        if bookkeeping:
+            self.enqueue("bookkeeping", Delivery(event, bookkeeping))
+
+    def enqueue(self, lane_name: Lane, delivery: Delivery):
+        lane = self.get_lanes()[lane_name]
+        lane.put(self.get_shard_index(delivery.event, lane.workers), delivery)
+
+    async def build_events(self):
+        """Build events from raw payloads received by :meth:`receive`.
+
+        This runs apart from the socket reader, so slow event building never
+        delays the acknowledgement of next envelopes.
+
+        """
+
+        logger = self.get_logger("build_events")
+
+        while True:
+            envelope_id, source = await self.raw_events.get()
+            if await self.get_deduplicator().is_duplicate(envelope_id, source):
+                continue
+            type_ = source.pop("type", None)
             try:
-                return await handler.run(self, event)
-            except SystemExit:
-                logger.info("SystemExit")
-                raise
-            except BotReconnect:
-                logger.info("BotReconnect raised.")
-                self.restart = True
-                return False
-            except APICallError as e:
-                logger.exception("APICallError on app handle process")
-                await report(self, event=event, exception=e)
-                return False
+                event = create_event(type_, source)
             except Exception:
-                logger.exception("Unexpected exception on app handle process")
-                await report(self, event=event)
-                return False
+                logger.exception(source)
+            else:
+                await self.get_user_directory().observe(event)
+                self.get_conversation_directory().observe(event)
+                await self.queue.put(event)
 
+    def get_shard_index(self, event: Event, size: int) -> int:
+        channel = get_channel_id(event)
+        if not channel:
+            return 0
+        return zlib.crc32(channel.encode()) % size
+
+    async def process_shard(self, lane: EventBacklog, index: int):
         while True:
-            event = await self.queue.get()
+            delivery = await lane.get(index)
+            try:
+                passed = await self.handle_event(delivery.event, delivery.apps)
+                followers = [
+                    app
+                    for needed, app in delivery.followers
+                    if needed <= passed
+                ]
+                if followers:
+                    follow = Delivery(delivery.event, followers)
+                    self.enqueue("bookkeeping", follow)
+            finally:
+                lane.done(delivery)
+
+    async def handle_event(
+        self,
+        event: Event,
+        apps: list[BaseApp] | None = None,
+    ) -> int:
+        """Run apps in order until one of them returns False.
+
+        Return the number of apps which let the chain go on.
+
+        """
 
-            logger.info(event)
+        if apps is None:
+            apps = self.box.get_apps(event, self.config.PREFIX)
+        for passed, app in enumerate(apps):
+            result = await self.run_app(app, event)
+            if not result:
+                return passed
+        return len(apps)
 
-            for handler in self.box.apps:
-                result = await handle(handler, event)
-                if not result:
-                    break
+    def get_app_timeout(self, app: BaseApp) -> float | None:
+        """Get time limit of given app in seconds. None means no limit."""
+
+        timeout = (
+            self.config.HANDLER_TIMEOUT if app.timeout is None else app.timeout
+        )
+        return timeout or None
+
+    async def run_app(self, app: BaseApp, event: Event) -> bool:
+        logger = self.get_logger("process")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        timer = asyncio.timeout(self.get_app_timeout(app))
+        try:
+            async with timer:
+                return await app.run(self, event)
+        except TimeoutError:
+            if not timer.expired():
+                logger.exception("Unexpected exception on app handle process")
+                await report(self, event=event)
+                return False
+            elapsed = loop.time() - started
+            logger.warning("%r is cancelled after %.1fs", app, elapsed)
+            await report(self, event=event, app=app, elapsed=elapsed)
+            return False
+        except SystemExit:
+            logger.info("SystemExit")
+            raise
+        except BotReconnect:
+            logger.info("BotReconnect raised.")
+            self.request_restart()
+            return False
+        except APICallError as e:
+            logger.exception("APICallError on app handle process")
+            await report(self, event=event, exception=e)
+            return False
+        except Exception:
+            logger.exception("Unexpected exception on app handle process")
+            await report(self, event=event)
+            return False
 
     async def ping(self, ws: ClientWebSocketResponse):
         while not ws.closed:
@@ -440,14 +928,14 @@ class Bot(GetLoggerMixin):
                 dumps=json.dumps,
             )
 
-    async def receive(self, ws: ClientWebSocketResponse):
+    async def receive(
+        self,
+        ws: ClientWebSocketResponse,
+        handover: asyncio.Event | None = None,
+    ):
         logger = self.get_logger("receive")
 
         while not ws.closed:
-            if self.restart:
-                self.restart = False
-                await ws.close()
-                break
             if ws.closed:
                 await ws.close()
                 break
@@ -458,21 +946,18 @@ class Bot(GetLoggerMixin):
                 break
 
             if msg.type == aiohttp.WSMsgType.TEXT:
-                source = msg.json(loads=json.loads)
-                envelope_id = source.pop("envelope_id", None)
-                payload = source.pop("payload", {})
-                event = payload.pop("event", None)
-                if envelope_id:
+                envelope = json.loads(msg.data)
+                if envelope_id := envelope.get("envelope_id"):
                     await self.acknowledge(ws, envelope_id)
-                if not event:
-                    continue
-                type_ = event.pop("type", None)
-                try:
-                    event = create_event(type_, event)
-                except Exception:
-                    logger.exception(msg.data)
-                else:
-                    await self.queue.put(event)
+                if event := envelope.get("payload", {}).get("event"):
+                    self.raw_events.put_nowait((envelope_id, event))
+                elif envelope.get("type") == "disconnect":
+                    logger.info(
+                        "disconnect warning: %s",
+                        envelope.get("reason"),
+                    )
+                    if handover is not None:
+                        handover.set()
             elif msg.type in WS_CLOSE_TYPES:
                 logger.info("websocket closed")
                 break
@@ -488,61 +973,112 @@ class Bot(GetLoggerMixin):
                 break
 
     async def connect(self):
-        """Connect Slack Socket Mode."""
-        logger = self.get_logger("connect")
+        """Connect Slack Socket Mode.
+
+        ``SOCKET_CONNECTIONS`` connections are kept open at once and all of
+        them feed the same event queue, so events keep flowing while one of
+        them is reconnecting.
+
+        """
 
         await self.queue.put(create_event("yui_system_start", {}))
         await self.is_ready.wait()
 
+        size = min(
+            max(1, self.config.SOCKET_CONNECTIONS),
+            MAX_SOCKET_CONNECTIONS,
+        )
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(size):
+                tg.create_task(self.keep_connection())
+
+    async def open_connection(self, *, handover: bool = False) -> str | None:
+        """Get URL of new Socket Mode connection. None if it is impossible.
+
+        Replacement of a connection which Slack is about to close skips the
+        throttle of ``apps.connections.open``, so it does not wait for a
+        minute after the last connection was opened.
+
+        """
+
+        logger = self.get_logger("open_connection")
+
         while True:
             try:
                 resp = await self.api.apps.connections.open(
                     token=self.config.APP_TOKEN,
+                    throttle_check=not handover,
                 )
             except Exception:
                 logger.exception("Failed to connect Slack")
                 await asyncio.sleep(60)
                 continue
-            if not resp.is_ok():
-                if resp.body["error"] in FATAL_ERROR_CODES:
-                    logger.error(resp.body["error"])
-                    break
+            if resp.is_ok():
+                return resp.body["url"]
+            if resp.body["error"] in FATAL_ERROR_CODES:
+                logger.error(resp.body["error"])
+                return None
+            if resp.body["error"] in RECONNECT_ERROR_CODES:
+                await asyncio.sleep(60)
 
-                if resp.body["error"] in RECONNECT_ERROR_CODES:
-                    await asyncio.sleep(60)
-                continue
+    async def keep_connection(self):
+        """Keep one Socket Mode connection open.
+
+        When Slack warns that the connection will be closed soon, replacement
+        is opened while the old one still delivers events until it closes.
+
+        """
+
+        replace = False
+        async with asyncio.TaskGroup() as tg:
+            while (
+                url := await self.open_connection(handover=replace)
+            ) is not None:
+                handover = asyncio.Event()
+                connection = tg.create_task(self.run_connection(url, handover))
+                waiter = tg.create_task(handover.wait())
+                await asyncio.wait(
+                    {connection, waiter},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                waiter.cancel()
+                replace = handover.is_set()
 
-            try:
-                logger.info("Connected to Slack")
-                async with (
-                    aiohttp.ClientSession() as session,
-                    session.ws_connect(
-                        resp.body["url"],
-                    ) as ws,
-                ):
-                    tasks = [
-                        asyncio.create_task(self.ping(ws)),
-                        asyncio.create_task(self.receive(ws)),
-                    ]
+    def request_restart(self):
+        """Close every Socket Mode connection, so each of them reconnects."""
+
+        self.restart_event.set()
+        self.restart_event = asyncio.Event()
+
+    async def run_connection(self, url: str, handover: asyncio.Event):
+        logger = self.get_logger("run_connection")
+
+        restart = self.restart_event
+        try:
+            logger.info("Connected to Slack")
+            async with (
+                aiohttp.ClientSession() as session,
+                session.ws_connect(url) as ws,
+            ):
+                tasks = [
+                    asyncio.create_task(self.ping(ws)),
+                    asyncio.create_task(self.receive(ws, handover)),
+                    asyncio.create_task(restart.wait()),
+                ]
+                try:
                     await asyncio.wait(
                         tasks,
                         return_when=asyncio.FIRST_COMPLETED,
                     )
-                continue
-            except BotReconnect:
-                logger.info("BotReconnect raised. I will reconnect soon.")
-                continue
-            except Exception:
-                logger.exception("Unexpected Exception raised")
-                continue
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                if restart.is_set():
+                    logger.info("Restart requested. I will reconnect soon.")
+        except BotReconnect:
+            logger.info("BotReconnect raised. I will reconnect soon.")
+        except Exception:
+            logger.exception("Unexpected Exception raised")
 
     async def get_user(self, user_id: UserID) -> User:
-        resp = await self.api.users.info(user=user_id)
-        if (
-            resp.is_ok()
-            and isinstance(resp.body, dict)
-            and isinstance(resp.body.get("user"), dict)
-        ):
-            return User(**resp.body["user"])
-        error = "Unexpected response"
-        raise ValueError(error)
+        return await self.get_user_directory().get(user_id)
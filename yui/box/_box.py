@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from collections.abc import Iterable
 from typing import Any
 
 from ..event import Event
@@ -6,8 +7,11 @@ from ..types.handler import FuncType
 from ..types.handler import Handler
 from .apps.base import BaseApp
 from .apps.basic import App
+from .index import AppIndex
 from .tasks import CronTask
+from .tasks import Overlap
 from .tasks import PollingTask
+from .tasks import WarmupTask
 
 type Decorator = Callable[[FuncType | Handler], Handler]
 
@@ -26,11 +30,36 @@ class Box:
         self.apps: list[BaseApp] = []
         self.cron_tasks: list[CronTask] = []
         self.polling_tasks: list[PollingTask] = []
+        self.warmup_tasks: list[WarmupTask] = []
+        self._index: AppIndex | None = None
 
     def register(self, app: BaseApp):
         """Register App manually."""
 
         self.apps.append(app)
+        self._index = None
+
+    def build_index(self) -> AppIndex:
+        """Build dispatch index of registered apps."""
+
+        self._index = AppIndex(self.apps)
+        return self._index
+
+    def get_index(self) -> AppIndex:
+        index = self._index
+        if index is None or len(index.apps) != len(self.apps):
+            index = self.build_index()
+        return index
+
+    def get_apps(self, event: Event, prefix: str) -> list[BaseApp]:
+        """Get apps which can handle given event in order."""
+
+        return self.get_index().get_apps(event, prefix)
+
+    def is_command(self, event: Event, prefix: str) -> bool:
+        """Check given event calls one of commands."""
+
+        return self.get_index().is_command(event, prefix)
 
     def assert_config_required(self, key: str, type_):
         """Mark required configuration key and type."""
@@ -66,8 +95,17 @@ class Box:
         short_help: str | None = None,
         help: str | None = None,
         use_shlex: bool = True,
+        timeout: float | None = None,
+        user_limit: int | None = None,
+        channel_limit: int | None = None,
     ) -> Decorator:
-        """Shortcut decorator for make command easily."""
+        """Shortcut decorator for make command easily.
+
+        ``user_limit`` and ``channel_limit`` override how many calls of this
+        command can run at once per user and per channel. See ``FAIR_SHARE``
+        config for defaults. Zero means no limit.
+
+        """
 
         def decorator(target: FuncType | Handler) -> Handler:
             handler = Handler.from_callable(target)
@@ -83,8 +121,12 @@ class Box:
                     help=help,
                     is_command=True,
                     use_shlex=use_shlex,
+                    timeout=timeout,
+                    user_limit=user_limit,
+                    channel_limit=channel_limit,
                 ),
             )
+            self._index = None
 
             return handler
 
@@ -95,8 +137,16 @@ class Box:
         type_: str | type[Event],
         *,
         subtype: str | None = None,
+        bookkeeping: bool = False,
+        timeout: float | None = None,
     ) -> Decorator:
-        """Decorator for make app."""
+        """Decorator for make app.
+
+        Bookkeeping apps like logging run apart from other apps with lower
+        priority. They still run only if none of the apps registered before
+        them returns False.
+
+        """
 
         event_type = type_ if isinstance(type_, str) else type_.type
 
@@ -108,17 +158,35 @@ class Box:
                     event_type,
                     subtype,
                     handler,
+                    bookkeeping=bookkeeping,
+                    timeout=timeout,
                 ),
             )
+            self._index = None
 
             return handler
 
         return decorator
 
-    def cron(self, spec: str, *args, **kwargs) -> CronTask:
+    def cron(
+        self,
+        spec: str,
+        *,
+        overlap: Overlap = "skip",
+        max_instances: int = 1,
+        jitter: float | None = None,
+        catch_up: bool = True,
+    ) -> CronTask:
         """Decorator for cron task."""
 
-        c = CronTask(self, spec, args, kwargs)
+        c = CronTask(
+            self,
+            spec,
+            overlap=overlap,
+            max_instances=max_instances,
+            jitter=jitter,
+            catch_up=catch_up,
+        )
         self.cron_tasks.append(c)
         return c
 
@@ -129,6 +197,22 @@ class Box:
         self.polling_tasks.append(p)
         return p
 
+    def warmup(
+        self,
+        dataset: str,
+        cached: Iterable[str] = (),
+    ) -> WarmupTask:
+        """Decorator for warm-up task which prepares given dataset.
+
+        ``cached`` is keys of cache which the task fills. When all of them
+        exist already, the dataset is ready before the task finishes.
+
+        """
+
+        w = WarmupTask(self, dataset, tuple(cached))
+        self.warmup_tasks.append(w)
+        return w
+
 
 # (:class:`Box`) Default Box instance
 box = Box()
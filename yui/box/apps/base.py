@@ -3,7 +3,8 @@ from __future__ import annotations
 import contextlib
 from typing import TYPE_CHECKING
 
-from ..utils import SPACE_RE
+from ..utils import get_event_text
+from ..utils import split_call_and_args
 
 if TYPE_CHECKING:
     import inspect
@@ -17,6 +18,11 @@ if TYPE_CHECKING:
 class BaseApp:
     """Base class of App"""
 
+    bookkeeping: bool = False
+    timeout: float | None = None
+    user_limit: int | None = None
+    channel_limit: int | None = None
+
     def get_short_help(self, prefix: str) -> str:
         raise NotImplementedError
 
@@ -35,23 +41,10 @@ class BaseApp:
         raise NotImplementedError
 
     def get_event_text(self, event: Message) -> str:
-        if event.text:
-            return event.text
-        if (
-            event.message
-            and hasattr(event.message, "text")
-            and event.message.text
-        ):
-            return event.message.text
-        return ""
+        return get_event_text(event)
 
     def split_call_and_args(self, text: str) -> tuple[str, str]:
-        try:
-            call, args = SPACE_RE.split(text, 1)
-        except ValueError:
-            call = text
-            args = ""
-        return call, args
+        return split_call_and_args(text)
 
     @contextlib.asynccontextmanager
     async def prepare_kwargs(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import html
 import inspect
 from typing import Final
@@ -8,11 +9,14 @@ from typing import TYPE_CHECKING
 from ...event import Event
 from ...event import Message
 from ...utils.format import bold
+from ...warmup import WARMING_UP_MESSAGE
 from ..parsers import parse_option_and_arguments
 from ..utils import split_chunks
 from .base import BaseApp
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from ...bot import Bot
     from ...types.handler import Handler
 
@@ -34,6 +38,10 @@ class App(BaseApp):
         help: str | None = None,
         use_shlex: bool = False,
         is_command: bool = False,
+        bookkeeping: bool = False,
+        timeout: float | None = None,
+        user_limit: int | None = None,
+        channel_limit: int | None = None,
     ) -> None:
         """Initialize"""
         self.type = type
@@ -58,6 +66,10 @@ class App(BaseApp):
         self.help = help
         self.is_command = is_command
         self.use_shlex = use_shlex
+        self.bookkeeping = bookkeeping
+        self.timeout = timeout
+        self.user_limit = user_limit
+        self.channel_limit = channel_limit
 
     @property
     def has_short_help(self) -> bool:
@@ -85,30 +97,46 @@ class App(BaseApp):
             help += "\n\n" + self.help.format(PREFIX=prefix)
         return help
 
-    async def run(self, bot: Bot, event: Event):
-        event_subtype = getattr(event, "subtype", None)
+    def match(self, event_type: str, event_subtype: str | None) -> bool:
+        """Check given event type and subtype are handled by this app."""
+
         subtype_cond1 = self.subtype is None and event_subtype is None
         subtype_cond2 = (
             self.subtype is not None
             and event_subtype is not None
             and self.subtype in {"*", event_subtype}
         )
-        subtype = subtype_cond1 or subtype_cond2
-        if event.type == self.type and subtype:
+        return event_type == self.type and (subtype_cond1 or subtype_cond2)
+
+    async def run(self, bot: Bot, event: Event):
+        if self.match(event.type, getattr(event, "subtype", None)):
             if isinstance(event, Message):
                 return await self._run_message_event(bot, event)
             return await self._run(bot, event)
         return True
 
+    @contextlib.asynccontextmanager
+    async def hold(self, bot: Bot) -> AsyncIterator[bool]:
+        """Hold concurrency slot of handler. Yield False if it is busy."""
+
+        if self.handler.concurrency is None:
+            yield True
+            return
+        async with self.handler.concurrency.hold(bot) as allowed:
+            yield allowed
+
     async def _run(self, bot: Bot, event: Event):
         res: bool | None = True
 
-        async with self.prepare_kwargs(
-            bot=bot,
-            event=event,
-            func_params=self.handler.params,
-        ) as kwargs:
-            res = await self.handler(**kwargs)
+        async with self.hold(bot) as allowed:
+            if not allowed:
+                return True
+            async with self.prepare_kwargs(
+                bot=bot,
+                event=event,
+                func_params=self.handler.params,
+            ) as kwargs:
+                res = await self.handler(**kwargs)
 
         return bool(res)
 
@@ -127,6 +155,12 @@ class App(BaseApp):
             )
 
         if match:
+            if self.handler.requires and not bot.get_readiness().is_ready(
+                self.handler.requires,
+            ):
+                await bot.say(event.channel, WARMING_UP_MESSAGE)
+                return False
+
             func_params = self.handler.params
             try:
                 chunks = split_chunks(raw, use_shlex=self.use_shlex)
@@ -154,13 +188,21 @@ class App(BaseApp):
                     kw["remain_chunks"] = " ".join(remain_chunks)
                 else:
                     kw["remain_chunks"] = remain_chunks
-            async with self.prepare_kwargs(
-                bot=bot,
-                event=event,
-                func_params=func_params,
-                **kw,
-            ) as kwargs:
-                res = await self.handler(**kwargs)
+            async with self.hold(bot) as allowed:
+                if not allowed:
+                    if self.handler.concurrency is not None:
+                        await bot.say(
+                            event.channel,
+                            self.handler.concurrency.busy,
+                        )
+                    return False
+                async with self.prepare_kwargs(
+                    bot=bot,
+                    event=event,
+                    func_params=func_params,
+                    **kw,
+                ) as kwargs:
+                    res = await self.handler(**kwargs)
 
         return bool(res)
 
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from attrs import define
+
+from ..event import Message
+from .apps.basic import App
+from .apps.route import RouteApp
+from .utils import get_event_text
+from .utils import split_call_and_args
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ..event import Event
+    from .apps.base import BaseApp
+
+type IndexKey = tuple[str, str | None]
+
+
+@define
+class IndexEntry:
+    """Candidate apps for one pair of event type and subtype."""
+
+    passive: list[BaseApp]
+    commands: dict[str, list[BaseApp]]
+
+
+class AppIndex:
+    """Pre-built dispatch index of apps.
+
+    Apps are grouped by event type and subtype, and commands are grouped by
+    their names and aliases. So each event only reaches passive apps and the
+    matching command. The order of :attr:`Box.apps` is kept.
+
+    """
+
+    def __init__(self, apps: Sequence[BaseApp]) -> None:
+        self.apps = tuple(apps)
+        self.entries: dict[IndexKey, IndexEntry] = {}
+
+    def get_entry(self, event_type: str, subtype: str | None) -> IndexEntry:
+        key = event_type, subtype
+        try:
+            return self.entries[key]
+        except KeyError:
+            entry = self.entries[key] = self._build_entry(event_type, subtype)
+            return entry
+
+    def _build_entry(self, event_type: str, subtype: str | None) -> IndexEntry:
+        passive: list[tuple[int, BaseApp]] = []
+        commands: dict[str, list[tuple[int, BaseApp]]] = {}
+        is_message = event_type == Message.type
+
+        for order, app in enumerate(self.apps):
+            if isinstance(app, App):
+                if not app.match(event_type, subtype):
+                    continue
+                if app.is_command and is_message:
+                    for name in app.names:
+                        commands.setdefault(name, []).append((order, app))
+                    continue
+            elif isinstance(app, RouteApp):
+                if is_message:
+                    for name in app.names:
+                        commands.setdefault(name, []).append((order, app))
+                continue
+            passive.append((order, app))
+
+        return IndexEntry(
+            passive=[app for _, app in passive],
+            commands={
+                name: [app for _, app in sorted(passive + apps)]
+                for name, apps in commands.items()
+            },
+        )
+
+    def get_apps(self, event: Event, prefix: str) -> list[BaseApp]:
+        """Get apps which can handle given event in order."""
+
+        entry = self.get_entry(event.type, getattr(event, "subtype", None))
+        name = self.find_command(entry, event, prefix)
+        if name is not None:
+            return entry.commands[name]
+        return entry.passive
+
+    def is_command(self, event: Event, prefix: str) -> bool:
+        entry = self.get_entry(event.type, getattr(event, "subtype", None))
+        return self.find_command(entry, event, prefix) is not None
+
+    def find_command(
+        self,
+        entry: IndexEntry,
+        event: Event,
+        prefix: str,
+    ) -> str | None:
+        if entry.commands and isinstance(event, Message):
+            name = self.get_command_name(event, prefix)
+            if name is not None and name in entry.commands:
+                return name
+        return None
+
+    def get_command_name(self, event: Message, prefix: str) -> str | None:
+        call, _ = split_call_and_args(get_event_text(event))
+        if call.startswith(prefix):
+            return call.removeprefix(prefix)
+        return None
@@ -1,33 +1,59 @@
 from __future__ import annotations
 
+from typing import Final
+from typing import Literal
 from typing import TYPE_CHECKING
 
 from ..types.handler import FuncType
 from ..types.handler import Handler
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
     from ._box import Box
 
+type Overlap = Literal["skip", "queue", "concurrent"]
+
+OVERLAPS: Final = frozenset({"skip", "queue", "concurrent"})
+
 
 class CronTask:
-    """Cron Task"""
+    """Cron Task
+
+    ``overlap`` decides what happens when the previous run is still running.
+    ``skip`` drops the new run, ``queue`` runs it after the previous run and
+    ``concurrent`` runs up to ``max_instances`` runs at once.
+
+    ``jitter`` overrides ``CRON.JITTER`` config and ``catch_up`` decides
+    whether a run missed while bot was not ready runs later.
+
+    """
 
     handler: Handler
-    start: Callable[[], None]
-    stop: Callable[[], None]
 
-    def __init__(self, box: Box, spec: str, args: tuple, kwargs: dict) -> None:
+    def __init__(
+        self,
+        box: Box,
+        spec: str,
+        *,
+        overlap: Overlap = "skip",
+        max_instances: int = 1,
+        jitter: float | None = None,
+        catch_up: bool = True,
+    ) -> None:
         """Initialize."""
 
-        if "start" not in kwargs:
-            kwargs["start"] = True
+        if overlap not in OVERLAPS:
+            error = f"unknown overlap policy: {overlap!r}"
+            raise ValueError(error)
+        if max_instances < 1:
+            error = "max_instances must be positive"
+            raise ValueError(error)
 
         self.box = box
         self.spec = spec
-        self.args = args
-        self.kwargs = kwargs
+        self.overlap = overlap
+        self.max_instances = max_instances
+        self.jitter = jitter
+        self.catch_up = catch_up
 
     def __call__(self, target: FuncType | Handler) -> Handler:
         """Use as decorator"""
@@ -67,3 +93,42 @@ class PollingTask:
         return f"PollingTask(func={self.handler!r})"
 
     __str__ = __repr__
+
+
+class WarmupTask:
+    """Warm-up Task
+
+    Bot runs warm-up tasks in background at start and retries failed ones.
+    Commands which require ``dataset`` are answered with a warming up
+    message until the task finishes once. If every key in ``cached`` is
+    already in cache, the dataset is ready at once and the task refreshes
+    it in background.
+
+    """
+
+    handler: Handler
+
+    def __init__(
+        self,
+        box: Box,
+        dataset: str,
+        cached: tuple[str, ...] = (),
+    ) -> None:
+        self.box = box
+        self.dataset = dataset
+        self.cached = cached
+
+    def __call__(self, target: FuncType | Handler) -> Handler:
+        """Use as decorator"""
+
+        handler = Handler.from_callable(target)
+
+        self.handler = handler
+        handler.warmup_task = self
+
+        return handler
+
+    def __repr__(self) -> str:
+        return f"WarmupTask(dataset={self.dataset!r}, func={self.handler!r})"
+
+    __str__ = __repr__
@@ -1,5 +1,11 @@
+from __future__ import annotations
+
 import re
 import shlex
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..event import Message
 
 SPACE_RE = re.compile(r"[\s\xa0]+")
 
@@ -12,3 +18,20 @@ def split_chunks(text: str, *, use_shlex: bool) -> list[str]:
         lex.commenters = ""
         return list(lex)
     return SPACE_RE.split(text)
+
+
+def get_event_text(event: Message) -> str:
+    if event.text:
+        return event.text
+    if event.message and hasattr(event.message, "text") and event.message.text:
+        return event.message.text
+    return ""
+
+
+def split_call_and_args(text: str) -> tuple[str, str]:
+    try:
+        call, args = SPACE_RE.split(text, 1)
+    except ValueError:
+        call = text
+        args = ""
+    return call, args
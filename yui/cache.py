@@ -1,6 +1,8 @@
 import asyncio
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
+from typing import Final
 
 from valkey.asyncio import Valkey
 
@@ -10,12 +12,25 @@ from .utils.datetime import fromtimestamp
 type DataType = str | bytes | bool | int | float | Decimal | dict | list
 type CacheKey = str | bytes
 
+TAKE_SLOT: Final = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
 
 class Cache:
     def __init__(self, valkey_client: Valkey, prefix: str = "") -> None:
         self.valkey_client = valkey_client
         self.prefix = prefix.encode()
         self.is_ready = asyncio.Event()
+        self.take_slot_script = valkey_client.register_script(TAKE_SLOT)
 
     def _key(self, key: CacheKey) -> bytes:
         if isinstance(key, str):
@@ -32,17 +47,58 @@ class Cache:
         key = self._key(key)
         await self.valkey_client.set(key, data, ex=exptime)
 
-    async def get[T: DataType](
-        self,
-        key: CacheKey,
-        default: T | None = None,
-    ) -> T | None:
+    async def get(self, key: CacheKey, default: Any = None) -> Any:
+        """Get decoded JSON value. Its type depends on what was stored."""
+
         key = self._key(key)
         data = await self.valkey_client.get(key)
         if data is None:
             return default
         return json.loads(data.decode())
 
+    async def add(
+        self,
+        key: CacheKey,
+        value: DataType,
+        exptime: int | None = None,
+    ) -> bool:
+        """Set value only if key does not exist. Return whether it was set."""
+
+        data = json.dumps(value).encode()
+        key = self._key(key)
+        return bool(
+            await self.valkey_client.set(key, data, ex=exptime, nx=True),
+        )
+
+    async def take_slot(
+        self,
+        key: CacheKey,
+        token: str,
+        limit: int,
+        exptime: int,
+    ) -> bool:
+        """Take one of ``limit`` slots for ``exptime`` seconds atomically.
+
+        Slots are members of a sorted set scored by their expiration time,
+        so slots which were never released expire on their own.
+
+        """
+
+        key = self._key(key)
+        taken = await self.take_slot_script(
+            keys=[key],
+            args=[token, limit, exptime],
+        )
+        return bool(taken)
+
+    async def release_slot(self, key: CacheKey, token: str):
+        key = self._key(key)
+        await self.valkey_client.zrem(key, token)
+
+    async def count_slots(self, key: CacheKey) -> int:
+        key = self._key(key)
+        return await self.valkey_client.zcard(key)
+
     async def set_dt(
         self,
         key: CacheKey,
@@ -56,7 +112,7 @@ class Cache:
         key: CacheKey,
         default: datetime | None = None,
     ) -> datetime | None:
-        value: float | None = await self.get(key)  # type: ignore[func-returns-value]
+        value: float | None = await self.get(key)
         if value is None:
             return default
         return fromtimestamp(value)
@@ -65,6 +121,15 @@ class Cache:
         key = self._key(key)
         await self.valkey_client.delete(key)
 
+    async def exists(self, *keys: CacheKey) -> bool:
+        """Check whether every given key exists."""
+
+        count = await self.valkey_client.exists(*map(self._key, keys))
+        return count == len(keys)
+
+    async def ping(self):
+        await self.valkey_client.ping()
+
     async def flushall(self):
         await self.valkey_client.flushall()
 
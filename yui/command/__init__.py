@@ -5,7 +5,9 @@ from .decorators import OPTION_COUNT_ERROR
 from .decorators import OPTION_TRANSFORM_ERROR
 from .decorators import OPTION_TYPE_ERROR
 from .decorators import argument
+from .decorators import concurrency
 from .decorators import option
+from .decorators import requires
 
 __all__ = [
     "ARGUMENT_COUNT_ERROR",
@@ -15,5 +17,7 @@ __all__ = [
     "OPTION_TRANSFORM_ERROR",
     "OPTION_TYPE_ERROR",
     "argument",
+    "concurrency",
     "option",
+    "requires",
 ]
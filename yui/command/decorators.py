@@ -8,6 +8,8 @@ from ..types.handler import Argument
 from ..types.handler import FuncType
 from ..types.handler import Handler
 from ..types.handler import Option
+from .limits import BUSY_MESSAGE
+from .limits import get_limit
 
 type Decorator = Callable[[FuncType | Handler], Handler]
 
@@ -256,3 +258,71 @@ def option(
         return handler
 
     return decorator
+
+
+def concurrency(
+    limit: int,
+    *,
+    key: str | None = None,
+    wait: bool = True,
+    busy: str = BUSY_MESSAGE,
+    shared: bool = False,
+    ttl: int = 300,
+) -> Decorator:
+    """
+    Limit concurrent runs of command.
+
+    :param limit: max count of concurrent runs
+    :type limit: :class:`int`
+    :param key: name of limit. Commands with the same key share the limit.
+                The first registered one decides the other parameters.
+    :type key: :class:`str`
+    :param wait: wait for a free slot instead of reply busy message
+    :type wait: :class:`bool`
+    :param busy: message to reply when all slots are taken
+    :type busy: :class:`str`
+    :param shared: share the limit across instances through Valkey
+    :type shared: :class:`bool`
+    :param ttl: expiration time of shared slots in seconds
+    :type ttl: :class:`int`
+
+    :return: decorator
+    :rtype: `DECORATOR_TYPE`
+
+    """
+
+    def decorator(target: FuncType | Handler) -> Handler:
+        handler = Handler.from_callable(target)
+        handler.concurrency = get_limit(
+            repr(handler) if key is None else key,
+            limit,
+            wait=wait,
+            busy=busy,
+            shared=shared,
+            ttl=ttl,
+        )
+        return handler
+
+    return decorator
+
+
+def requires(*datasets: str) -> Decorator:
+    """
+    Mark datasets which must be warmed up before command runs.
+
+    Until all of them are ready, command is answered with warming up message.
+
+    :param datasets: names of datasets of warm-up tasks
+    :type datasets: :class:`tuple` of :class:`str`
+
+    :return: decorator
+    :rtype: `DECORATOR_TYPE`
+
+    """
+
+    def decorator(target: FuncType | Handler) -> Handler:
+        handler = Handler.from_callable(target)
+        handler.requires.update(datasets)
+        return handler
+
+    return decorator
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from typing import Any
+from typing import Final
+from typing import TYPE_CHECKING
+
+from valkey.exceptions import ValkeyError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from ..bot import Bot
+
+BUSY_MESSAGE: Final = (
+    "지금은 요청이 너무 많아서 처리할 수 없어요. 잠시 후 다시 시도해주세요!"
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimit:
+    """Limit of concurrent runs of handlers sharing the same key.
+
+    If all slots are taken, a run waits for a free slot when ``wait`` is
+    True, or it is rejected at once. With ``shared``, slots are also counted
+    in Valkey, so the limit applies across all instances. Each run holds its
+    own slot in Valkey which expires after ``ttl`` seconds, so slots of
+    crashed instances come back.
+    If Valkey is not available, only the local limit applies.
+
+    """
+
+    def __init__(
+        self,
+        key: str,
+        limit: int,
+        *,
+        wait: bool = True,
+        busy: str = BUSY_MESSAGE,
+        shared: bool = False,
+        ttl: int = 300,
+        poll_interval: float = 0.5,
+    ) -> None:
+        if limit < 1:
+            error = "limit must be positive"
+            raise ValueError(error)
+
+        self.key = key
+        self.limit = limit
+        self.wait = wait
+        self.busy = busy
+        self.shared = shared
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self.semaphore = asyncio.Semaphore(limit)
+        self.running = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.errors = 0
+
+    @property
+    def shared_key(self) -> str:
+        return f"CONCURRENCY_{self.key}"
+
+    async def acquire_shared(self, bot: Bot, token: str) -> bool | None:
+        """Take a slot in Valkey for given token.
+
+        Return True if a slot is taken, False if all slots are taken, and
+        None if Valkey is not available.
+
+        """
+
+        try:
+            return await bot.cache.take_slot(
+                self.shared_key,
+                token,
+                self.limit,
+                self.ttl,
+            )
+        except (ValkeyError, RuntimeError, TimeoutError):
+            self.errors += 1
+            logger.warning("fail to take shared slot of %s", self.key)
+            return None
+
+    async def release_shared(self, bot: Bot, token: str):
+        try:
+            await bot.cache.release_slot(self.shared_key, token)
+        except (ValkeyError, RuntimeError, TimeoutError):
+            self.errors += 1
+            logger.warning("fail to release shared slot of %s", self.key)
+
+    @contextlib.asynccontextmanager
+    async def hold(self, bot: Bot) -> AsyncIterator[bool]:
+        """Hold a slot while running. Yield False if the run is rejected."""
+
+        if not self.wait and self.semaphore.locked():
+            self.rejected += 1
+            yield False
+            return
+
+        self.waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        token = uuid.uuid4().hex
+        try:
+            taken = (
+                await self.acquire_shared(bot, token) if self.shared else None
+            )
+            while taken is False and self.wait:
+                await asyncio.sleep(self.poll_interval)
+                taken = await self.acquire_shared(bot, token)
+            if taken is False:
+                self.rejected += 1
+                yield False
+                return
+
+            self.running += 1
+            try:
+                yield True
+            finally:
+                self.running -= 1
+                if taken:
+                    await self.release_shared(bot, token)
+        finally:
+            self.semaphore.release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "running": self.running,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+
+LIMITS: dict[str, ConcurrencyLimit] = {}
+
+
+def get_limit(key: str, limit: int, **kwargs) -> ConcurrencyLimit:
+    """Get limit of given key. Handlers using the same key share it."""
+
+    if key not in LIMITS:
+        LIMITS[key] = ConcurrencyLimit(key, limit, **kwargs)
+    return LIMITS[key]
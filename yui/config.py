@@ -17,10 +17,18 @@ REQUIRED = {
 }
 
 
-DEFAULT = {
+DEFAULT: dict[str, Any] = {
     "DEBUG": False,
     "RECEIVE_TIMEOUT": 300,  # 60 * 5 seconds
     "REGISTER_CRONTAB": True,
+    "EVENT_LANES": {
+        "SYSTEM": 1,
+        "COMMAND": 4,
+        "PASSIVE": 2,
+        "BOOKKEEPING": 1,
+    },
+    "SOCKET_CONNECTIONS": 2,
+    "HANDLER_TIMEOUT": 60,
     "PREFIX": "",
     "APPS": (),
     "DATABASE_URL": "",
@@ -60,7 +68,67 @@ DEFAULT = {
             },
         },
     },
-    "CACHE": {"URL": "valkey://localhost:6379/0", "PREFIX": "YUI_"},
+    "CACHE": {
+        "URL": "valkey://localhost:6379/0",
+        "PREFIX": "YUI_",
+        "HEALTH_CHECK_INTERVAL": 30,
+    },
+    "SLACK_API": {
+        "LIMIT": 100,
+        "LIMIT_PER_HOST": 30,
+        "DNS_CACHE_TTL": 300,
+        "KEEPALIVE_TIMEOUT": 60,
+        "TIMEOUT": 30,
+        "CONNECT_TIMEOUT": 10,
+    },
+    "PROCESS_POOL": {
+        "SIZE": 2,
+        "MAX_TASKS": 100,
+        "MAX_MEMORY": 512,
+        "PRELOAD": [],
+    },
+    "THREAD_POOL": {
+        "SIZE": 8,
+        "QUEUE_SIZE": 64,
+    },
+    "CRON": {
+        "JITTER": 10,
+        "CATCH_UP_GRACE": 600,
+    },
+    "EVENT_QUEUE": {
+        "MAX_SIZE": 1000,
+        "PASSIVE_LIMIT": 200,
+        "PASSIVE_SAMPLE_RATE": 0.0,
+        "OVERFLOW": "drop_oldest",
+    },
+    "DEDUP": {
+        "BACKEND": "memory",
+        "SIZE": 10000,
+        "TTL": 600,
+    },
+    "SUPERVISOR": {
+        "BACKOFF": 1,
+        "MAX_BACKOFF": 300,
+        "STABLE_AFTER": 600,
+        "STATS_INTERVAL": 3600,
+    },
+    "FAIR_SHARE": {
+        "ENABLED": True,
+        "PER_USER": 1,
+        "PER_CHANNEL": 1,
+    },
+    "OUTBOX": {
+        "WORKERS": 4,
+        "MAX_LENGTH": 4000,
+        "MAX_ATTACHMENTS": 20,
+    },
+    "USER_DIRECTORY": {
+        "TTL": 43200,
+        "MIRROR": False,
+    },
+    "CONVERSATION_DIRECTORY": {
+        "DM_TTL": 86400,
+    },
 }
 
 
@@ -79,9 +147,23 @@ class Config(SimpleNamespace):
     DATABASE_ECHO: bool
     LOGGING: dict[str, Any]
     REGISTER_CRONTAB: bool
+    EVENT_LANES: dict[str, int]
+    SOCKET_CONNECTIONS: int
+    HANDLER_TIMEOUT: float
     CHANNELS: dict[str, Any]
     USERS: dict[str, Any]
     CACHE: dict[str, Any]
+    SLACK_API: dict[str, Any]
+    PROCESS_POOL: dict[str, Any]
+    THREAD_POOL: dict[str, Any]
+    CRON: dict[str, Any]
+    EVENT_QUEUE: dict[str, Any]
+    DEDUP: dict[str, Any]
+    FAIR_SHARE: dict[str, Any]
+    SUPERVISOR: dict[str, Any]
+    OUTBOX: dict[str, Any]
+    USER_DIRECTORY: dict[str, Any]
+    CONVERSATION_DIRECTORY: dict[str, Any]
     WEBSOCKETDEBUGGERURL: str | None
 
     def check(
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Protocol
+from typing import TYPE_CHECKING
+
+from valkey.exceptions import ValkeyError
+
+if TYPE_CHECKING:
+    from .bot import Bot
+
+logger = logging.getLogger(__name__)
+
+
+class DedupStore(Protocol):
+    async def add(self, key: str) -> bool:
+        """Remember given key. Return False if it was already remembered."""
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class MemoryDedupStore:
+    """Bounded in-process store of recently seen keys."""
+
+    def __init__(self, size: int, ttl: float) -> None:
+        self.size = max(1, size)
+        self.ttl = ttl
+        self.keys: OrderedDict[str, float] = OrderedDict()
+
+    async def add(self, key: str) -> bool:
+        now = time.monotonic()
+        while self.keys:
+            oldest, seen_at = next(iter(self.keys.items()))
+            if now - seen_at < self.ttl and len(self.keys) < self.size:
+                break
+            del self.keys[oldest]
+
+        if key in self.keys:
+            return False
+        self.keys[key] = now
+        return True
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self.keys)}
+
+
+class ValkeyDedupStore:
+    """Store of recently seen keys shared by multiple instances via Valkey.
+
+    If Valkey is not available, keys are treated as new, so events are not
+    dropped.
+
+    """
+
+    def __init__(self, bot: Bot, ttl: float) -> None:
+        self.bot = bot
+        self.ttl = max(1, int(ttl))
+        self.errors = 0
+
+    async def add(self, key: str) -> bool:
+        try:
+            return await self.bot.cache.add(f"DEDUP_{key}", 1, self.ttl)
+        except (ValkeyError, RuntimeError, TimeoutError):
+            self.errors += 1
+            logger.warning("fail to check duplication of %s", key)
+            return True
+
+    def stats(self) -> dict[str, int]:
+        return {"errors": self.errors}
+
+
+class Deduplicator:
+    """Suppress envelopes and events redelivered by Slack.
+
+    An event is a duplicate if its envelope id or its pair of channel, ts
+    and type was already seen.
+
+    """
+
+    def __init__(self, store: DedupStore) -> None:
+        self.store = store
+        self.suppressed = 0
+
+    async def is_duplicate(
+        self,
+        envelope_id: str | None,
+        event: dict[str, Any],
+    ) -> bool:
+        keys = []
+        if envelope_id:
+            keys.append(f"envelope:{envelope_id}")
+        channel = event.get("channel")
+        ts = event.get("ts") or event.get("event_ts")
+        if isinstance(channel, str) and ts:
+            keys.append(f"event:{channel}:{ts}:{event.get('type')}")
+
+        new = [await self.store.add(key) for key in keys]
+        if new and not all(new):
+            self.suppressed += 1
+            logger.info("suppress duplicated event %s", keys)
+            return True
+        return False
+
+    def stats(self) -> dict[str, int]:
+        return {"suppressed": self.suppressed} | self.store.stats()
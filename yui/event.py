@@ -17,21 +17,35 @@ from .utils.attrs import make_instance
 from .utils.attrs import ts_field
 from .utils.attrs import user_id_field
 
+type ChannelArchiveType = Literal["channel_archive"]
+type ChannelCreatedType = Literal["channel_created"]
+type ChannelDeletedType = Literal["channel_deleted"]
+type ChannelRenameType = Literal["channel_rename"]
+type ChannelUnarchiveType = Literal["channel_unarchive"]
 type GoodByeType = Literal["goodbye"]
 type HelloType = Literal["hello"]
+type ImCreatedType = Literal["im_created"]
 type MessageType = Literal["message"]
 type PongType = Literal["pong"]
 type TeamJoinType = Literal["team_join"]
 type TeamMigrationStartedType = Literal["team_migration_started"]
+type UserChangeType = Literal["user_change"]
 type YuiSystemStartType = Literal["yui_system_start"]
 
 type EventType = Literal[
+    ChannelArchiveType,
+    ChannelCreatedType,
+    ChannelDeletedType,
+    ChannelRenameType,
+    ChannelUnarchiveType,
     GoodByeType,
     HelloType,
+    ImCreatedType,
     MessageType,
     PongType,
     TeamJoinType,
     TeamMigrationStartedType,
+    UserChangeType,
     YuiSystemStartType,
 ]
 type Source = dict[str, Any]
@@ -64,6 +78,53 @@ class UnknownEvent(EventBase):
     kwargs: dict[str, Any]
 
 
+@event
+@define(kw_only=True, field_transformer=field_transformer)
+class ChannelArchive(Event):
+    """A channel was archived."""
+
+    type: ClassVar[str] = "channel_archive"
+    channel: ChannelID = channel_id_field()
+    user: UserID = user_id_field(default=None)
+
+
+@event
+@define(kw_only=True, field_transformer=field_transformer)
+class ChannelCreated(Event):
+    """A channel was created."""
+
+    type: ClassVar[str] = "channel_created"
+    channel: dict[str, Any] = field(repr=True)
+
+
+@event
+@define(kw_only=True, field_transformer=field_transformer)
+class ChannelDeleted(Event):
+    """A channel was deleted."""
+
+    type: ClassVar[str] = "channel_deleted"
+    channel: ChannelID = channel_id_field()
+
+
+@event
+@define(kw_only=True, field_transformer=field_transformer)
+class ChannelRename(Event):
+    """A channel was renamed."""
+
+    type: ClassVar[str] = "channel_rename"
+    channel: dict[str, Any] = field(repr=True)
+
+
+@event
+@define(kw_only=True, field_transformer=field_transformer)
+class ChannelUnarchive(Event):
+    """A channel was unarchived."""
+
+    type: ClassVar[str] = "channel_unarchive"
+    channel: ChannelID = channel_id_field()
+    user: UserID = user_id_field(default=None)
+
+
 @event
 @define(kw_only=True, field_transformer=field_transformer)
 class GoodBye(Event):
@@ -80,6 +141,16 @@ class Hello(Event):
     type: ClassVar[str] = "hello"
 
 
+@event
+@define(kw_only=True, field_transformer=field_transformer)
+class ImCreated(Event):
+    """A DM was created."""
+
+    type: ClassVar[str] = "im_created"
+    user: UserID = user_id_field()
+    channel: dict[str, Any] = field(repr=True)
+
+
 @event
 @define(kw_only=True, field_transformer=field_transformer)
 class Message(Event):
@@ -122,6 +193,15 @@ class TeamMigrationStarted(Event):
     type: ClassVar[str] = "team_migration_started"
 
 
+@event
+@define(kw_only=True, field_transformer=field_transformer)
+class UserChange(Event):
+    """A member's data has changed."""
+
+    type: ClassVar[str] = "user_change"
+    user: dict[str, Any] = field(repr=True)
+
+
 @event
 @define(kw_only=True, field_transformer=field_transformer)
 class YuiSystemStart(Event):
@@ -130,6 +210,41 @@ class YuiSystemStart(Event):
     type: ClassVar[str] = "yui_system_start"
 
 
+@overload
+def create_event(  # type: ignore[overload-overlap]
+    type_: ChannelArchiveType,
+    source: Source,
+) -> ChannelArchive: ...
+
+
+@overload
+def create_event(  # type: ignore[overload-overlap]
+    type_: ChannelCreatedType,
+    source: Source,
+) -> ChannelCreated: ...
+
+
+@overload
+def create_event(  # type: ignore[overload-overlap]
+    type_: ChannelDeletedType,
+    source: Source,
+) -> ChannelDeleted: ...
+
+
+@overload
+def create_event(  # type: ignore[overload-overlap]
+    type_: ChannelRenameType,
+    source: Source,
+) -> ChannelRename: ...
+
+
+@overload
+def create_event(  # type: ignore[overload-overlap]
+    type_: ChannelUnarchiveType,
+    source: Source,
+) -> ChannelUnarchive: ...
+
+
 @overload
 def create_event(type_: GoodByeType, source: Source) -> GoodBye: ...  # type: ignore[overload-overlap]
 
@@ -138,6 +253,13 @@ def create_event(type_: GoodByeType, source: Source) -> GoodBye: ...  # type: ig
 def create_event(type_: HelloType, source: Source) -> Hello: ...  # type: ignore[overload-overlap]
 
 
+@overload
+def create_event(  # type: ignore[overload-overlap]
+    type_: ImCreatedType,
+    source: Source,
+) -> ImCreated: ...
+
+
 @overload
 def create_event(type_: MessageType, source: Source) -> Message: ...  # type: ignore[overload-overlap]
 
@@ -157,6 +279,13 @@ def create_event(  # type: ignore[overload-overlap]
 ) -> TeamMigrationStarted: ...
 
 
+@overload
+def create_event(  # type: ignore[overload-overlap]
+    type_: UserChangeType,
+    source: Source,
+) -> UserChange: ...
+
+
 @overload
 def create_event(  # type: ignore[overload-overlap]
     type_: YuiSystemStartType,
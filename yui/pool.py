@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import importlib
+import logging
+import multiprocessing
+import resource
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+
+def preload(modules: tuple[str, ...]):  # pragma: no cover -- run on worker
+    for module in modules:
+        importlib.import_module(module)
+
+
+def ping() -> int:  # pragma: no cover -- run on worker
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_task(
+    f: Callable[..., Any],
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> tuple[Any, int]:  # pragma: no cover -- run on worker
+    return f(*args, **kwargs), ping()
+
+
+class ProcessWorker:
+    """Single worker process."""
+
+    def __init__(self, modules: Iterable[str]) -> None:
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=preload,
+            initargs=(tuple(modules),),
+        )
+        self.tasks = 0
+
+    def warm_up(self):
+        """Start process and import modules before the first task."""
+
+        self.executor.submit(ping)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def kill(self):
+        """Kill process even if it is running a task."""
+
+        processes = getattr(self.executor, "_processes", None) or {}
+        for process in list(processes.values()):
+            process.kill()
+        self.close()
+
+
+class ProcessPool:
+    """Long-lived pool of worker processes.
+
+    Each worker is recycled after ``max_tasks`` tasks or when its peak memory
+    exceeds ``max_memory`` MiB. A worker whose task was cancelled (e.g. by
+    :func:`asyncio.timeout`) is killed and replaced, so it can not keep CPU.
+
+    """
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        max_tasks: int = 0,
+        max_memory: int = 0,
+        preload: Iterable[str] = (),
+    ) -> None:
+        self.size = max(1, size)
+        self.max_tasks = max_tasks
+        self.max_memory = max_memory
+        self.modules: dict[str, None] = dict.fromkeys(preload)
+        self.idle: list[ProcessWorker] = []
+        self.running = 0
+        self.closed = False
+        self.semaphore = asyncio.Semaphore(self.size)
+
+    def spawn(self) -> ProcessWorker:
+        worker = ProcessWorker(self.modules)
+        worker.warm_up()
+        return worker
+
+    def start(self):
+        """Fork all workers in background."""
+
+        while len(self.idle) + self.running < self.size:
+            self.idle.append(self.spawn())
+
+    def close(self):
+        self.closed = True
+        for worker in self.idle:
+            worker.close()
+        self.idle.clear()
+
+    async def run[**P, R](
+        self,
+        f: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Run given function on one of worker processes."""
+
+        module = getattr(f, "__module__", None)
+        if module and module not in self.modules:
+            self.modules[module] = None
+
+        loop = asyncio.get_running_loop()
+        async with self.semaphore:
+            worker = self.idle.pop() if self.idle else self.spawn()
+            worker.tasks += 1
+            memory = 0
+            self.running += 1
+            try:
+                result, memory = await loop.run_in_executor(
+                    worker.executor,
+                    functools.partial(run_task, f, args, kwargs),
+                )
+            except (asyncio.CancelledError, BrokenProcessPool):
+                logger.warning("replace stuck worker of %r", f)
+                worker.kill()
+                worker = self.spawn()
+                raise
+            finally:
+                self.running -= 1
+                if self.closed:
+                    worker.close()
+                else:
+                    if self.should_recycle(worker, memory):
+                        worker.close()
+                        worker = self.spawn()
+                    self.idle.append(worker)
+        return result
+
+    def should_recycle(self, worker: ProcessWorker, memory: int) -> bool:
+        if self.max_tasks and worker.tasks >= self.max_tasks:
+            return True
+        return bool(self.max_memory and memory > self.max_memory * 1024)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": self.size,
+            "idle": len(self.idle),
+            "running": self.running,
+        }
+
+
+class ThreadPool:
+    """Shared pool of threads for blocking work like HTML parsing.
+
+    At most ``size + queue_size`` tasks are handed to threads at once and
+    other callers wait on the event loop, so the executor queue is bounded.
+    A slot is freed when its thread finishes, even if the caller was
+    cancelled earlier.
+
+    """
+
+    def __init__(self, size: int, *, queue_size: int = 0) -> None:
+        self.size = max(1, size)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.size,
+            thread_name_prefix="yui",
+        )
+        self.semaphore = asyncio.Semaphore(self.size + max(0, queue_size))
+        self.waiting = 0
+        self.submitted = 0
+        self.completed = 0
+
+    @property
+    def pending(self) -> int:
+        """Count of tasks in executor queue."""
+
+        queue = getattr(self.executor, "_work_queue", None)
+        return queue.qsize() if queue is not None else 0
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run[**P, R](
+        self,
+        f: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Run given function on one of threads."""
+
+        loop = asyncio.get_running_loop()
+        self.waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        try:
+            future = self.executor.submit(functools.partial(f, *args, **kwargs))
+        except RuntimeError:
+            self.semaphore.release()
+            raise
+        self.submitted += 1
+        future.add_done_callback(functools.partial(self._done, loop))
+        return await asyncio.wrap_future(future)
+
+    def _done(self, loop: asyncio.AbstractEventLoop, future: Future[Any]):
+        # called on worker thread, or on loop when future is cancelled
+        with contextlib.suppress(RuntimeError):  # loop is closed
+            loop.call_soon_threadsafe(self._release)
+
+    def _release(self):
+        self.completed += 1
+        self.semaphore.release()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": self.size,
+            "waiting": self.waiting,
+            "pending": self.pending,
+            "running": self.submitted - self.completed - self.pending,
+            "completed": self.completed,
+        }
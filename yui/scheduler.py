@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any
+from typing import TYPE_CHECKING
+
+from cronsim import CronSim
+
+from .utils.datetime import now
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .bot import Bot
+    from .box.tasks import CronTask
+
+logger = logging.getLogger(__name__)
+
+
+class CronJob:
+    """Schedule runs of one cron task.
+
+    Each run starts at a random moment within ``jitter`` seconds after the
+    cron time, so jobs sharing a minute boundary do not call Slack at once.
+
+    """
+
+    def __init__(
+        self,
+        scheduler: CronScheduler,
+        task: CronTask,
+        *,
+        jitter: float,
+        grace: float,
+    ) -> None:
+        self.scheduler = scheduler
+        self.task = task
+        self.jitter = jitter if task.jitter is None else task.jitter
+        self.grace = grace
+        self.limit = task.max_instances if task.overlap == "concurrent" else 1
+        self.running = 0
+        self.queued: float | None = None
+        self.missed_at: float | None = None
+        self.catch_up_task: asyncio.Task | None = None
+        self.tasks: set[asyncio.Task] = set()
+
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.missed = 0
+        self.caught_up = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    @property
+    def name(self) -> str:
+        return repr(self.task.handler)
+
+    def stop(self):
+        for task in (self.catch_up_task, *self.tasks):
+            if task is not None:
+                task.cancel()
+        self.catch_up_task = None
+        self.queued = self.missed_at = None
+
+    async def schedule(self):
+        """Dispatch runs at cron times forever."""
+
+        for scheduled in CronSim(self.task.spec, now()):
+            planned = scheduled.timestamp() + random.uniform(0, self.jitter)
+            await asyncio.sleep(max(0.0, planned - time.time()))
+            if self.scheduler.is_ready():
+                self.dispatch(planned)
+            else:
+                self.miss(planned)
+
+    def dispatch(self, planned: float):
+        """Start a run or apply overlap policy if previous run is running."""
+
+        if self.running < self.limit:
+            self.spawn(planned)
+        elif self.task.overlap == "queue" and self.queued is None:
+            self.queued = planned
+        else:
+            self.skipped += 1
+            logger.info("skip %s because previous run is running", self.name)
+
+    def spawn(self, planned: float):
+        self.running += 1
+        task = asyncio.create_task(self.run(planned))
+        self.tasks.add(task)
+        task.add_done_callback(self.finish)
+
+    def finish(self, task: asyncio.Task):
+        self.tasks.discard(task)
+        self.running -= 1
+        if self.queued is not None and not task.cancelled():
+            planned, self.queued = self.queued, None
+            self.spawn(planned)
+
+    async def run(self, planned: float):
+        started = time.time()
+        self.last_lag = max(0.0, started - planned)
+        self.max_lag = max(self.max_lag, self.last_lag)
+        ok = False
+        try:
+            ok = await self.scheduler.bot.run_cron_task(self.task)
+        finally:
+            self.last_duration = time.time() - started
+            self.max_duration = max(self.max_duration, self.last_duration)
+            self.failures += not ok
+            self.runs += 1
+
+    def miss(self, planned: float):
+        """Remember a run missed while bot is not ready."""
+
+        self.missed += 1
+        if not self.task.catch_up:
+            logger.info("miss %s because bot is not ready", self.name)
+            return
+
+        self.missed_at = planned
+        if self.catch_up_task is None:
+            self.catch_up_task = asyncio.create_task(self.catch_up())
+
+    async def catch_up(self):
+        """Run the latest missed run once bot is ready again."""
+
+        try:
+            await self.scheduler.wait_ready()
+        finally:
+            self.catch_up_task = None
+
+        planned, self.missed_at = self.missed_at, None
+        if planned is None:
+            return
+        if time.time() - planned > self.grace:
+            logger.info("give up to catch up %s. too late", self.name)
+            return
+        self.caught_up += 1
+        self.dispatch(planned)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "spec": self.task.spec,
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "missed": self.missed,
+            "caught_up": self.caught_up,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+        }
+
+
+class CronScheduler:
+    """Run cron tasks of box.
+
+    :meth:`CronJob.schedule` of each job should be run by caller, like
+    :class:`~yui.supervisor.Supervisor` of bot. Cron tasks only run when bot
+    is ready and :meth:`resume` was called. Runs missed in the meantime are
+    caught up when it becomes ready again within ``grace`` seconds.
+
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        tasks: Iterable[CronTask],
+        *,
+        jitter: float = 0.0,
+        grace: float = 0.0,
+    ) -> None:
+        self.bot = bot
+        self.ready = asyncio.Event()
+        self.jobs = [
+            CronJob(self, task, jitter=jitter, grace=grace) for task in tasks
+        ]
+
+    def is_ready(self) -> bool:
+        return self.bot.is_ready.is_set() and self.ready.is_set()
+
+    async def wait_ready(self):
+        while not self.is_ready():
+            await self.bot.is_ready.wait()
+            await self.ready.wait()
+
+    def stop(self):
+        self.ready.clear()
+        for job in self.jobs:
+            job.stop()
+
+    def pause(self):
+        self.ready.clear()
+
+    def resume(self):
+        self.ready.set()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {job.name: job.stats() for job in self.jobs}
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class Child:
+    """Component run by :class:`Supervisor`."""
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> None:
+        self.name = name
+        self.factory = factory
+        self.running = False
+        self.restarts = 0
+        self.crashes = 0
+        self.failures = 0
+        self.last_error: str | None = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "restarts": self.restarts,
+            "crashes": self.crashes,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+class Supervisor:
+    """Run components and restart only the one which crashed.
+
+    A crashed component is restarted after ``backoff`` seconds, doubled on
+    each consecutive crash up to ``max_backoff`` seconds. A component which
+    ran longer than ``stable_after`` seconds before crash starts over from
+    ``backoff``. A component which returns is not restarted. Exceptions
+    which are not :exc:`Exception`, like :exc:`SystemExit`, are not caught.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        stable_after: float = 600.0,
+    ) -> None:
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after
+        self.children: dict[str, Child] = {}
+
+    def add(self, name: str, factory: Callable[[], Awaitable[Any]]):
+        if name in self.children:
+            error = f"component {name!r} is already added"
+            raise ValueError(error)
+        self.children[name] = Child(name, factory)
+
+    def get_delay(self, child: Child) -> float:
+        return min(self.backoff * 2 ** (child.failures - 1), self.max_backoff)
+
+    async def supervise(self, child: Child):
+        while True:
+            started = time.monotonic()
+            child.running = True
+            try:
+                await child.factory()
+            except Exception as e:
+                child.crashes += 1
+                child.last_error = repr(e)
+                if time.monotonic() - started >= self.stable_after:
+                    child.failures = 0
+                child.failures += 1
+                logger.exception("%s crashed", child.name)
+            else:
+                logger.info("%s finished", child.name)
+                return
+            finally:
+                child.running = False
+
+            delay = self.get_delay(child)
+            logger.info("restart %s after %.1fs", child.name, delay)
+            await asyncio.sleep(delay)
+            child.restarts += 1
+
+    async def run(self):
+        async with asyncio.TaskGroup() as tg:
+            for child in self.children.values():
+                tg.create_task(self.supervise(child))
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {name: child.stats() for name, child in self.children.items()}
@@ -17,6 +17,8 @@ from ..utils.cast import is_container
 if TYPE_CHECKING:
     from ..box.tasks import CronTask
     from ..box.tasks import PollingTask
+    from ..box.tasks import WarmupTask
+    from ..command.limits import ConcurrencyLimit
 
 
 type FuncType = Callable[..., Coroutine[Any, None, bool | None]]
@@ -66,6 +68,9 @@ class Handler:
     options: list[Option] = field(init=False)
     cron: CronTask | None = field(init=False, default=None)
     polling_task: PollingTask | None = field(init=False, default=None)
+    warmup_task: WarmupTask | None = field(init=False, default=None)
+    concurrency: ConcurrencyLimit | None = field(init=False, default=None)
+    requires: set[str] = field(init=False)
     doc: str | None = field(init=False)
     params: Mapping[str, inspect.Parameter] = field(init=False)
     annotations: dict[str, Any] = field(init=False)
@@ -78,6 +83,7 @@ class Handler:
         self.annotations = get_type_hints(self.f)
         self.arguments = []
         self.options = []
+        self.requires = set()
 
     def prepare(self):
         for o in self.options:
@@ -14,3 +14,15 @@ class APIResponse:
 
     def is_ok(self) -> bool:
         return isinstance(self.body, dict) and bool(self.body.get("ok"))
+
+    def is_ratelimited(self) -> bool:
+        return self.status == 429 or (
+            isinstance(self.body, dict)
+            and self.body.get("error") == "ratelimited"
+        )
+
+    def get_retry_after(self, default: float = 1.0) -> float:
+        try:
+            return float(self.headers["Retry-After"])
+        except (KeyError, TypeError, ValueError):
+            return default
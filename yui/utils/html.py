@@ -1,6 +1,6 @@
-from lxml.etree import strip_elements
-from lxml.html import HTMLParser
-from lxml.html import fromstring
+from .lazy import lazy_import
+
+lxml_html = lazy_import("lxml.html")
 
 USELESS_TAGS = frozenset(
     {
@@ -21,15 +21,15 @@ def get_root(
 ):
     """Get root of DOM Tree without useless data"""
 
-    parser = HTMLParser(remove_comments=remove_comments)
-    h = fromstring(html, parser=parser)
+    parser = lxml_html.HTMLParser(remove_comments=remove_comments)
+    h = lxml_html.fromstring(html, parser=parser)
     if useless_tags is None:
         useless_tags = list(USELESS_TAGS)
-    strip_elements(h, *useless_tags, with_tail=False)
+    lxml_html.etree.strip_elements(h, *useless_tags, with_tail=False)
     return h
 
 
 def strip_tags(text: str) -> str:
     """Remove HTML Tags from input text"""
 
-    return str(fromstring(text).text_content())
+    return str(lxml_html.fromstring(text).text_content())
@@ -3,7 +3,7 @@ from typing import Any
 import orjson
 
 
-def loads(value: str) -> Any:
+def loads(value: str | bytes) -> Any:
     return orjson.loads(value)
 
 
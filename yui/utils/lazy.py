@@ -0,0 +1,32 @@
+import importlib
+import importlib.machinery
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import module on first attribute access.
+
+    Use this for heavy dependencies which are not needed until a command
+    runs, so importing apps stays fast. Extension modules can not be loaded
+    lazily, so they are imported at once.
+
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        error = f"No module named {name!r}"
+        raise ModuleNotFoundError(error, name=name)
+    if isinstance(spec.loader, importlib.machinery.ExtensionFileLoader):
+        return importlib.import_module(name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import sys
@@ -13,6 +14,7 @@ from .format import preformatted
 if TYPE_CHECKING:
     from ..bot import APICallError
     from ..bot import Bot
+    from ..box.apps.base import BaseApp
     from ..event import Event
 
 LIMIT = 3500
@@ -39,6 +41,8 @@ async def report(
     *,
     event: Event | None = None,
     exception: APICallError | None = None,
+    app: BaseApp | None = None,
+    elapsed: float | None = None,
 ):
     tb_lines = get_simple_tb_text(traceback.format_exception(*sys.exc_info()))
     messages: list[str] = []
@@ -48,6 +52,10 @@ async def report(
 {bold('Event')}
 {preformatted(str(event))}
 """
+    if app:
+        message += f"{bold('App')}: {code(repr(app))}\n"
+    if elapsed is not None:
+        message += f"{bold('Elapsed')}: {elapsed:.1f}s\n"
     if exception:
         message += f"""\
 {bold('Method')}: {code(exception.method)}
@@ -70,14 +78,26 @@ async def report(
             length = 6
         block += line
         length += len(line)
+    message += preformatted(block)
+    messages.append(message)
 
-    resp = await bot.api.conversations.open(
-        users=[bot.config.USERS["owner"]],
+    channel_id = await bot.get_conversation_directory().open_dm(
+        bot.config.USERS["owner"],
     )
+    if channel_id is None:
+        return
 
-    for message in messages:
-        await bot.say(
-            resp.body["channel"]["id"],
-            message,
-            length_limit=None,
-        )
+    # gather starts its tasks in order, so chunks are queued in order and
+    # the outbox sends them one by one as the channel is the same
+    await asyncio.gather(
+        *(
+            bot.say(
+                channel_id,
+                message,
+                length_limit=None,
+                priority="report",
+                coalesce=True,
+            )
+            for message in messages
+        ),
+    )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+from typing import Final
+from typing import Literal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+type WarmupState = Literal["pending", "running", "ready", "failed"]
+
+WARMING_UP_MESSAGE: Final = (
+    "아직 명령어의 실행준비가 덜 되었어요. 잠시만 기다려주세요!"
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Readiness state of each dataset prepared by warm-up tasks.
+
+    A dataset becomes ready when its warm-up task finishes once and stays
+    ready after that. Datasets without warm-up task are always ready.
+
+    """
+
+    def __init__(self, datasets: Iterable[str]) -> None:
+        self.states: dict[str, WarmupState] = dict.fromkeys(
+            datasets,
+            "pending",
+        )
+        self.attempts: dict[str, int] = dict.fromkeys(self.states, 0)
+        self.started_at: dict[str, float] = {}
+        self.durations: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+
+    def start(self, dataset: str):
+        self.attempts[dataset] = self.attempts.get(dataset, 0) + 1
+        self.started_at[dataset] = time.monotonic()
+        if self.states.get(dataset) != "ready":
+            self.states[dataset] = "running"
+
+    def finish(self, dataset: str):
+        self.durations[dataset] = time.monotonic() - self.started_at[dataset]
+        self.states[dataset] = "ready"
+        self.errors.pop(dataset, None)
+        logger.info(
+            "%s is ready in %.1fs",
+            dataset,
+            self.durations[dataset],
+        )
+
+    def restore(self, dataset: str):
+        """Mark dataset ready because its data is in cache already."""
+
+        if self.states.get(dataset) != "ready":
+            self.states[dataset] = "ready"
+            logger.info("%s is ready from cache", dataset)
+
+    def fail(self, dataset: str, error: BaseException):
+        self.errors[dataset] = repr(error)
+        if self.states.get(dataset) != "ready":
+            self.states[dataset] = "failed"
+
+    def is_ready(self, datasets: Iterable[str]) -> bool:
+        return all(
+            self.states.get(dataset, "ready") == "ready" for dataset in datasets
+        )
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            dataset: {
+                "state": state,
+                "attempts": self.attempts[dataset],
+                "duration": self.durations.get(dataset),
+                "error": self.errors.get(dataset),
+            }
+            for dataset, state in self.states.items()
+        }